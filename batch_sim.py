@@ -0,0 +1,474 @@
+# batch_sim.py
+#
+# Vectorized Monte Carlo engine for a single home/away pairing.
+# Plays the same matchup thousands of times in one pass with NumPy, using the
+# trench / separation / pressure formulas from GameSim.resolve_play and
+# resolve_pass_target and the call_plays decision logic. Every array below is
+# indexed by game; team-dependent values are stored per side (0 = away, 1 = home)
+# and gathered with the per-game offense side.
+#
+# Simplifications vs. GameSim: starters play the whole game at full stamina and
+# nobody gets hurt, so there are no box scores or injuries - only scores.
+# The tunable constants come from the same EngineTuning as GameSim's (TUNING
+# unless another set is passed in).
+
+import numpy as np
+
+from tactics import PLAYBOOK, RECEIVER_SLOTS
+from engine_tuning import TUNING
+
+AWAY, HOME = 0, 1
+
+# --- PLAY / STRATEGY CODES ---
+# Same integer codes as GameSim (tactics.PLAYBOOK), as NumPy lookup tables
+OFF_IDX = PLAYBOOK.off
+DEF_IDX = PLAYBOOK.defense
+PUNT = OFF_IDX["PUNT"]
+FIELD_GOAL = OFF_IDX["FIELD_GOAL"]
+
+IS_PASS = np.array(PLAYBOOK.is_pass)
+PLAY_TIME = np.array(PLAYBOOK.time)
+PASS_BASE_YARDS = np.array(PLAYBOOK.base_yards)
+IS_ZONE = np.array(PLAYBOOK.is_zone)
+
+# Strategy counter matrix: [off_play, def_strategy] -> -15 (read), +15 (great call), 0
+MATCHUP = np.array(PLAYBOOK.matchup, dtype=float)
+
+# Receiver slots: WR1, WR2, TE, RB -> route priority per play (-1 = not a target)
+REC_POS = list(RECEIVER_SLOTS)
+ROUTE_PRIORITY = np.array([[-1.0 if p is None else p for p in row] for row in PLAYBOOK.route_priority])
+
+PASS_CALLS_AGGRESSIVE = np.array([OFF_IDX["PASS_DEEP"], OFF_IDX["PASS_PA"], OFF_IDX["PASS_STD"]])
+PASS_CALLS_SAFE = np.array([OFF_IDX["PASS_QUICK"], OFF_IDX["PASS_SCREEN"], OFF_IDX["PASS_STD"]])
+RUN_CALLS_AGGRESSIVE = np.array([OFF_IDX["RUN_DRAW"], OFF_IDX["RUN_ZONE"], OFF_IDX["RUN_POWER"]])
+RUN_CALLS_SAFE = np.array([OFF_IDX["RUN_POWER"], OFF_IDX["RUN_ZONE"], OFF_IDX["RUN_POWER"]])
+PASS_DEFENSES = np.array([DEF_IDX[k] for k in ["COVER_2", "COVER_3", "BLITZ_ZONE", "MAN_1"]])
+RUN_DEFENSES = np.array([DEF_IDX[k] for k in ["BLITZ_HEAVY", "MAN_1", "BLITZ_ZONE", "GOAL_LINE"]])
+
+MAX_OT_PERIODS = 10
+
+
+def _starters(team, position, count):
+    """First `count` healthy players on the depth chart (falls back to anyone)."""
+    chart = team.depth_chart.get(position, [])
+    healthy = [p for p in chart if p.weeks_injured == 0]
+    picked = (healthy or chart)[:count]
+    while picked and len(picked) < count:
+        picked.append(picked[len(picked) % max(1, len(picked))])
+    return picked
+
+
+def _team_ratings(team, t):
+    """Collapses a team's starters and coach into the scalars the engine needs (t = EngineTuning)."""
+    coach = team.coach
+    qb = _starters(team, "QB", 1)[0]
+    rb = _starters(team, "RB", 1)[0]
+    ol = _starters(team, "OL", 5)
+    dl = _starters(team, "DL", 3)
+    lbs = _starters(team, "LB", 3)
+    dbs = _starters(team, "DB", 3)
+    kicker = _starters(team, "K", 1)
+    punter = _starters(team, "P", 1)
+    receivers = _starters(team, "WR", 2) + _starters(team, "TE", 1) + [rb]
+
+    r = {
+        "run_pass_bias": coach.run_pass_bias, "aggressiveness": coach.aggressiveness,
+        "fourth_down_agg": coach.fourth_down_agg,
+        "analyst": coach.has_trait("The Analyst"), "gut_feeling": coach.has_trait("Gut Feeling"),
+        "fourth_down_fire": coach.has_trait("Fourth Down Fire"), "clock_manager": coach.has_trait("Clock Manager"),
+        "halftime_adjuster": coach.has_trait("Halftime Adjuster"),
+        "qb_whisperer": coach.has_trait("Quarterback Whisperer"),
+        "mastermind": coach.has_trait("Defensive Mastermind"),
+
+        "qb_acc": qb.attributes["ACC"], "qb_int": qb.attributes["INT"],
+        "qb_spd": qb.attributes["SPD"], "qb_agi": qb.attributes["AGI"],
+        "gunslinger": qb.has_trait("Gunslinger"), "game_manager": qb.has_trait("Game Manager"),
+        "hero_ball": qb.has_trait("Hero Ball"), "field_general": qb.has_trait("Field General"),
+        "statue": qb.has_trait("Statue"), "escapist": qb.has_trait("Escapist"),
+
+        "rb_spd": rb.attributes["SPD"], "rb_weak": rb.attributes["STR"] < 50,
+        "butterfingers": rb.has_trait("Butterfingers"), "bruiser": rb.has_trait("Bruiser"),
+
+        "ol_run": sum(p.attributes["STR"] + p.attributes["BLK"] for p in ol) / (len(ol) * 2),
+        "ol_pass": sum(p.attributes["BLK"] for p in ol) / len(ol),
+        "brick_wall": any(p.has_trait("Brick Wall") for p in ol),
+        "turnstile": any(p.has_trait("Turnstile") for p in ol),
+
+        "dl_run": sum(p.attributes["STR"] + p.attributes["TKL"] for p in dl) / (len(dl) * 2),
+        "dl_pass": sum(p.attributes["STR"] for p in dl) / len(dl),
+        "first_step": any(p.has_trait("First Step") for p in dl),
+        "ankle_biter_rate": sum(p.has_trait("Ankle Biter") for p in dl + lbs + dbs) / len(dl + lbs + dbs),
+
+        "big_leg": bool(punter) and punter[0].has_trait("Big Leg"),
+        "ice_veins": bool(kicker) and kicker[0].has_trait("Ice Veins"),
+        "choker": bool(kicker) and kicker[0].has_trait("Choker"),
+    }
+
+    # Receivers (WR1, WR2, TE, RB): separation skill with trait bonuses baked in
+    r["rec_sep"] = [(p.attributes["SPD"] * 0.45) + (p.attributes["AGI"] * 0.55)
+                    + (10 if p.has_trait("Route Technician") else 0)
+                    + (15 if (p.has_trait("Satellite") and REC_POS[j] == "RB") else 0)
+                    for j, p in enumerate(receivers)]
+    r["rec_cth"] = [p.attributes["CTH"] * t.cth_weight - (15 if p.has_trait("Stone Hands") else 0) for p in receivers]
+    r["rec_drop"] = [10 if p.has_trait("Stone Hands") else t.drop_chance for p in receivers]
+    r["rec_spd"] = [p.attributes["SPD"] for p in receivers]
+    r["rec_valve"] = [p.has_trait("Safety Valve") for p in receivers]
+    r["rec_joystick"] = [p.has_trait("Human Joystick") for p in receivers]
+
+    # Coverage pools: [DB1..3, LB1..3]
+    cover = dbs + lbs
+    r["cov_skill"] = [(p.attributes["SPD"] * 0.50) + (p.attributes["INT"] * 0.50) for p in cover]
+    r["cov_int"] = [p.attributes["INT"] * t.int_rate * (1.25 if p.has_trait("Ball Hawk") else 1.0) for p in cover]
+    r["cov_spd"] = [p.attributes["SPD"] for p in cover]
+    return r
+
+
+class MatchupOdds:
+    """Result of a batch run: win probability plus score and margin distributions."""
+    def __init__(self, home, away, home_scores, away_scores):
+        self.home = home
+        self.away = away
+        self.home_scores = home_scores
+        self.away_scores = away_scores
+        self.margins = home_scores - away_scores
+        self.n_games = len(home_scores)
+        self.home_win_prob = float(np.mean(self.margins > 0))
+        self.away_win_prob = float(np.mean(self.margins < 0))
+        self.tie_prob = float(np.mean(self.margins == 0))
+
+    @property
+    def favorite(self):
+        return self.home if self.home_win_prob >= self.away_win_prob else self.away
+
+    @property
+    def spread(self):
+        """Median home margin (positive = home favored)."""
+        return float(np.median(self.margins))
+
+    def expected_score(self):
+        return float(np.mean(self.home_scores)), float(np.mean(self.away_scores))
+
+    def margin_percentiles(self, qs=(10, 25, 50, 75, 90)):
+        return {q: float(np.percentile(self.margins, q)) for q in qs}
+
+    def margin_distribution(self):
+        """{home margin: probability}"""
+        vals, counts = np.unique(self.margins, return_counts=True)
+        return {int(v): c / self.n_games for v, c in zip(vals, counts)}
+
+    def score_distribution(self, side="home"):
+        """{points: probability} for one side."""
+        scores = self.home_scores if side == "home" else self.away_scores
+        vals, counts = np.unique(scores, return_counts=True)
+        return {int(v): c / self.n_games for v, c in zip(vals, counts)}
+
+    def __str__(self):
+        h, a = self.expected_score()
+        return (f"{self.away.name} {a:.1f} @ {self.home.name} {h:.1f} | "
+                f"Home win {self.home_win_prob*100:.1f}% over {self.n_games} sims")
+
+
+class BatchMatchupSim:
+    def __init__(self, home, away, seed=None, tuning=None):
+        self.home = home
+        self.away = away
+        self.rng = np.random.default_rng(seed)
+        self.tuning = tuning or TUNING
+        ratings = [_team_ratings(away, self.tuning), _team_ratings(home, self.tuning)]
+        # Stack every rating into arrays indexed by side (0 = away, 1 = home)
+        self.r = {k: np.array([ratings[AWAY][k], ratings[HOME][k]]) for k in ratings[AWAY]}
+
+    def _randint(self, lo, hi, n):
+        """Inclusive on both ends, like random.randint."""
+        return self.rng.integers(lo, hi + 1, size=n)
+
+    def run(self, n_games=2000):
+        n = n_games
+        rng = self.rng
+        R = self.r
+        t = self.tuning
+        idx = np.arange(n)
+
+        # --- GAME STATE ---
+        off = np.zeros(n, dtype=int)            # offense side (away receives first)
+        ball_on = np.full(n, 25.0)
+        down = np.ones(n, dtype=int)
+        distance = np.full(n, 10.0)
+        quarter = np.ones(n, dtype=int)
+        time_left = np.full(n, 900.0)
+        score = np.zeros((n, 2), dtype=int)
+        active = np.ones(n, dtype=bool)
+        ot = np.zeros(n, dtype=bool)
+        ot_period = np.zeros(n, dtype=int)
+        ot_turn = np.zeros(n, dtype=int)
+
+        while active.any():
+            dfn = 1 - off
+            off_score = score[idx, off]
+            def_score = score[idx, dfn]
+            diff = off_score - def_score
+            shootout = ot & (ot_period >= 3)
+
+            # --- TIME MANAGEMENT (check_time_management) ---
+            cm = R["clock_manager"][off]
+            hurry = (quarter >= 4) & ~ot & (diff < 0) & (time_left < np.where(cm, 420, 300))
+            chew = (quarter >= 4) & ~ot & (diff > 0) & (time_left < np.where(cm, 360, 240))
+
+            # --- PLAY CALLING (call_plays) ---
+            play = np.empty(n, dtype=int)
+            dstr = np.empty(n, dtype=int)
+
+            pass_prob = R["run_pass_bias"][off] * 0.08
+            pass_prob = pass_prob + np.where(distance > 8, 0.25, 0.0) - np.where(distance < 4, 0.15, 0.0)
+            pass_prob = pass_prob + np.where(hurry, 0.35, 0.0) - np.where(chew, 0.40, 0.0)
+            pass_prob = pass_prob + np.where(R["gunslinger"][off], 0.15, 0.0) - np.where(R["game_manager"][off], 0.10, 0.0)
+            pass_prob = np.clip(pass_prob, 0.10, 0.90)
+            is_pass = rng.random(n) < pass_prob
+            is_pass |= R["hero_ball"][off] & (diff < -3) & (quarter == 4) & ~ot
+
+            aggressive = self._randint(0, 10, n) < R["aggressiveness"][off]
+            pick = rng.integers(0, 3, size=n)
+            pass_call = np.where(aggressive, PASS_CALLS_AGGRESSIVE[pick], PASS_CALLS_SAFE[pick])
+            sling = R["gunslinger"][off] & (rng.random(n) < 0.4)
+            manage = ~sling & R["game_manager"][off] & (rng.random(n) < 0.4)
+            pass_call = np.where(sling, OFF_IDX["PASS_DEEP"], np.where(manage, OFF_IDX["PASS_QUICK"], pass_call))
+            run_call = np.where(aggressive, RUN_CALLS_AGGRESSIVE[pick], RUN_CALLS_SAFE[pick])
+            pick_def = rng.integers(0, 4, size=n)
+            play[:] = np.where(is_pass, pass_call, run_call)
+            dstr[:] = np.where(is_pass, PASS_DEFENSES[pick_def], RUN_DEFENSES[pick_def])
+
+            # 4th down decisions
+            agg = R["fourth_down_agg"][off].astype(float)
+            agg += np.where((quarter == 4) & (off_score < def_score) & (time_left < 180), 50, 0)
+            gut = R["gut_feeling"][off] & (rng.random(n) < 0.2)
+            agg += np.where(gut, self._randint(-20, 40, n), 0)
+            agg += np.where(R["fourth_down_fire"][off], 15, 0)
+            fourth = (down == 4) & ~shootout
+            in_fg_range = ball_on >= 65
+            go_short = fourth & in_fg_range & (ball_on > 40) & (agg > 15)
+            kick = fourth & in_fg_range & ~go_short
+            go_deep = fourth & ~in_fg_range & (agg > 25)
+            punt = fourth & ~in_fg_range & ~go_deep
+            play[go_short] = np.where(distance[go_short] <= 2, OFF_IDX["RUN_POWER"], OFF_IDX["PASS_QUICK"])
+            dstr[go_short] = np.where(distance[go_short] <= 2, DEF_IDX["GOAL_LINE"], DEF_IDX["MAN_1"])
+            play[kick] = FIELD_GOAL
+            play[go_deep] = OFF_IDX["PASS_DEEP"]; dstr[go_deep] = DEF_IDX["BLITZ_HEAVY"]
+            play[punt] = PUNT
+
+            goal_line = (ball_on < 3) & ~shootout
+            play[goal_line] = OFF_IDX["RUN_POWER"]; dstr[goal_line] = DEF_IDX["GOAL_LINE"]
+            coin = rng.random(n) < 0.5
+            play[shootout] = np.where(coin[shootout], OFF_IDX["RUN_POWER"], OFF_IDX["PASS_QUICK"])
+            dstr[shootout] = np.where(coin[shootout], DEF_IDX["GOAL_LINE"], DEF_IDX["MAN_1"])
+
+            # --- MODIFIERS ---
+            air_raid = R["run_pass_bias"][off] >= 7
+            smash = R["run_pass_bias"][off] <= 3
+            pass_play = IS_PASS[play]
+            run_play = ~pass_play & (play < PUNT)
+            scheme_bonus = np.where((air_raid & pass_play) | (smash & run_play), 5, 0)
+
+            strat = MATCHUP[play, dstr].copy()
+            analyst = R["analyst"][off]
+            strat = np.where(analyst & (strat < 0), 0, np.where(analyst & (strat > 0), strat + 5, strat))
+            fire = np.where(R["fourth_down_fire"][off], 15, 0) + np.where(R["gut_feeling"][off] & (rng.random(n) < 0.3), 20, 0)
+            strat = strat + np.where(down == 4, fire, 0)
+            strat = strat + np.where((quarter == 3) & ~ot & (diff < 0) & R["halftime_adjuster"][off], 5, 0)
+
+            yards = np.zeros(n)
+            time_used = PLAY_TIME[play].astype(float)
+            flip = np.zeros(n, dtype=bool)        # possession flips at the line of scrimmage
+            pts = np.zeros(n, dtype=int)          # points for the offense on this snap
+            changed = np.zeros(n, dtype=bool)     # possession ended (any reason)
+            normal_end = np.zeros(n, dtype=bool)  # play runs through down/distance bookkeeping
+
+            # --- SPECIAL TEAMS ---
+            is_punt = play == PUNT
+            blocked_punt = is_punt & (rng.random(n) < 0.01)
+            punted = is_punt & ~blocked_punt
+            punt_dist = 35 + self._randint(0, 20, n) + np.where(R["big_leg"][off], 5, 0)
+            flip |= blocked_punt; time_used[blocked_punt] = 10
+
+            is_fg = play == FIELD_GOAL
+            blocked_fg = is_fg & (rng.random(n) < 0.015)
+            fg_dist = 100 - ball_on + 17
+            clutch = ((quarter == 4) | ot) & (np.abs(score[:, HOME] - score[:, AWAY]) <= 8)
+            acc_bonus = np.where(R["ice_veins"][off] & clutch, 10, 0) - np.where(R["choker"][off] & clutch, 20, 0)
+            fg_acc = np.where(fg_dist <= 25, 100, 100 - (fg_dist - 25) + acc_bonus)
+            fg_good = is_fg & ~blocked_fg & (self._randint(1, 100, n) < fg_acc)
+            fg_miss = is_fg & ~blocked_fg & ~fg_good
+            flip |= blocked_fg | fg_miss; time_used[blocked_fg] = 10
+            pts += np.where(fg_good, 3, 0)
+
+            # --- RUN PLAYS ---
+            ol_run = R["ol_run"][off] + np.where(smash, 3, 0) - np.where(air_raid, 2, 0) + np.where(R["field_general"][off], 5, 0)
+            trench = (ol_run - R["dl_run"][dfn]) + self._randint(-t.trench_variance, t.trench_variance, n) + strat * 0.5 + scheme_bonus * 0.5
+            trench += np.where(ball_on > 80, 4, 0) - np.where(R["first_step"][dfn], 5, 0)
+            fumble_chance = t.fumble_base + np.where(R["rb_weak"][off], 1, 0) + np.where(R["butterfingers"][off], 5, 0)
+            fumble = run_play & (rng.uniform(0, 100, n) < fumble_chance)
+            flip |= fumble; time_used[fumble] = 10
+
+            stuffed = trench < t.stuff_line
+            middle = ~stuffed & (trench < t.gain_line)
+            run_yds = np.where(stuffed, self._randint(-4, 0, n),
+                      np.where(middle, self._randint(1, 5, n), self._randint(4, 12, n)))
+            breakaway = ~stuffed & ~middle & (rng.random(n) < t.breakaway_base + R["rb_spd"][off] / 2000)
+            run_yds = run_yds + np.where(breakaway, self._randint(20, 60, n), 0)
+            run_yds = run_yds + np.where(rng.random(n) < R["ankle_biter_rate"][dfn] * 0.3, 4, 0)
+            run_yds = run_yds + np.where(R["bruiser"][off] & (rng.random(n) < 0.3), 3, 0)
+            run_ok = run_play & ~fumble
+            yards[run_ok] = run_yds[run_ok]
+            time_used[run_ok] += 5
+            normal_end |= run_ok
+
+            # --- PASS PLAYS: target selection (resolve_pass_target) ---
+            # Coverage defender per receiver slot: WR -> DB, TE -> LB 70% / DB, RB -> LB
+            pool = rng.integers(0, 3, size=(n, 4))
+            use_lb = np.zeros((n, 4), dtype=bool)
+            use_lb[:, 2] = rng.random(n) < 0.7
+            use_lb[:, 3] = True
+            cov = pool + np.where(use_lb, 3, 0)
+            def_skill = R["cov_skill"][dfn[:, None], cov]
+            def_skill = np.where(IS_ZONE[dstr][:, None], (def_skill + t.zone_coverage) / 2, def_skill)
+            sep = R["rec_sep"][off] - def_skill + self._randint(-t.sep_variance, t.sep_variance, (n, 4))
+            prio = ROUTE_PRIORITY[play]
+            eligible = prio >= 0
+            t_score = np.where(eligible, sep + prio * 3, -np.inf)
+            order = np.argsort(-t_score, axis=1)
+            sorted_score = np.take_along_axis(t_score, order, axis=1)
+            sorted_sep = np.take_along_axis(sep, order, axis=1)
+            sorted_ok = np.isfinite(sorted_score)
+            has_target = sorted_ok[:, 0]
+
+            weights = np.where(sorted_ok[:, :3], np.maximum(1, sorted_score[:, :3] + 20), 0)
+            cum = np.cumsum(weights, axis=1)
+            u = rng.random(n) * np.maximum(cum[:, -1], 1e-9)
+            chosen = np.minimum((u[:, None] >= cum).sum(axis=1), 2)
+            best_sep = sorted_sep[idx, chosen]
+
+            # QB vision: re-read to a clearly more open man
+            vision = (self._randint(0, 100, n) + R["qb_int"][off] * 0.3 > 50) & (best_sep < -2)
+            thresh = np.where(R["game_manager"][off], 1, 5)
+            better = sorted_ok & (sorted_sep > (best_sep + thresh)[:, None])
+            better[idx, chosen] = False
+            reread = vision & better.any(axis=1)
+            chosen = np.where(reread, np.argmax(better, axis=1), chosen)
+            tslot = order[idx, chosen]
+            separation = sorted_sep[idx, chosen] + np.where(air_raid, 2, 0)
+            dslot = cov[idx, tslot]
+
+            # Pass rush
+            ol_pass = R["ol_pass"][off] + np.where(air_raid, 2, 0) - np.where(smash, 3, 0)
+            ol_pass += np.where(R["brick_wall"][off], 8, 0) - np.where(R["turnstile"][off], 8, 0)
+            pressure = ((R["dl_pass"][dfn] - ol_pass) / 2) - strat + self._randint(-t.pressure_variance, t.pressure_variance, n)
+            pressured = pass_play & ((pressure > t.pressure_threshold) | ~has_target)
+            escape = R["qb_spd"][off] * 0.6 + R["qb_agi"][off] * 0.4
+            escape += np.where(R["escapist"][off], 15, 0) - np.where(R["statue"][off], 20, 0)
+            scramble = pressured & (escape > self._randint(0, 100, n) + t.scramble_margin)
+            sacked = pressured & ~scramble
+            strip = sacked & (rng.random(n) < t.sack_fumble)
+            sacked &= ~strip
+            scramble_yds = 1 + np.floor(rng.random(n) * (np.floor(R["qb_spd"][off] / 6) + 2))
+            yards[scramble] = scramble_yds[scramble]; time_used[scramble] = 25
+            yards[sacked] = -self._randint(2, 9, n)[sacked]; time_used[sacked] = 45
+            flip |= strip; time_used[strip] = 30
+            normal_end |= scramble | sacked
+
+            # Throw
+            thrown = pass_play & ~pressured
+            acc = R["qb_acc"][off] * t.acc_weight + np.where(air_raid, 5, 0) + np.where(R["qb_whisperer"][off], 5, 0)
+            catch = np.clip(t.catch_base + acc + R["rec_cth"][off, tslot] + separation * t.sep_weight, t.catch_min, t.catch_max)
+            catch += np.where(R["rec_valve"][off, tslot] & (down == 3) & (distance < 5), 15, 0)
+            caught = self._randint(1, 100, n) <= catch
+            dropped = caught & (self._randint(0, 100, n) < R["rec_drop"][off, tslot])
+            incomplete = thrown & (~caught | dropped)
+            time_used[incomplete] = 15
+            normal_end |= incomplete
+
+            live = thrown & ~incomplete
+            bad_read = self._randint(0, 100, n) > R["qb_int"][off] - np.where(R["gunslinger"][off], 10, 0)
+            int_chance = R["cov_int"][dfn, dslot] * np.where(R["mastermind"][dfn], 1.10, 1.0)
+            picked = live & ((separation < t.risky_separation) | bad_read) & (self._randint(1, 100, n) < int_chance)
+            flip |= picked; time_used[picked] = 20
+
+            complete = live & ~picked
+            yac = np.where(R["rec_spd"][off, tslot] > R["cov_spd"][dfn, dslot], self._randint(1, t.yac_max, n), 0)
+            yac = yac + np.where((yac > 0) & (rng.random(n) < t.big_play_chance), self._randint(10, 25, n), 0)
+            yac = yac + np.where(R["rec_joystick"][off, tslot], self._randint(2, 10, n), 0)
+            pass_yds = np.maximum(1, PASS_BASE_YARDS[play] + yac + self._randint(-2, 5, n))
+            yards[complete] = pass_yds[complete]
+            time_used[complete] += 5
+            normal_end |= complete
+
+            # --- CLOCK ---
+            time_used[normal_end] += 10
+            time_used = np.where(normal_end & hurry, np.where(cm, 18, 25), time_used)
+            time_used = np.where(normal_end & chew, np.where(cm, 60, 55), time_used)
+
+            # --- FIELD POSITION, DOWNS & SCORING ---
+            ball_after = ball_on + yards
+            td = normal_end & (ball_after >= 100)
+            safety = normal_end & ~td & (ball_after <= 0)
+            first = normal_end & ~td & ~safety & (yards >= distance)
+            on_downs = normal_end & ~td & ~safety & ~first & (down + 1 > 4)
+            pts += np.where(td, np.where(shootout, 2, 7), 0)
+
+            score[idx, off] += np.where(active, pts, 0)
+            score[idx, dfn] += np.where(active & safety, 2, 0)
+
+            new_ball = np.where(normal_end, ball_after, ball_on)
+            new_down = np.where(first, 1, np.where(normal_end, down + 1, down))
+            new_dist = np.where(first, 10, np.where(normal_end, distance - yards, distance))
+
+            kickoff = td | safety | fg_good
+            changed = flip | kickoff | on_downs | punted
+            new_off = np.where(changed, dfn, off)
+            new_ball = np.where(flip | on_downs, 100 - new_ball, new_ball)
+            new_ball = np.where(kickoff, 25, new_ball)
+            punt_spot = ball_on - punt_dist  # 100 - ((100 - LOS) + dist), as in resolve_play
+            new_ball = np.where(punted, np.where(punt_spot < 0, 20, punt_spot), new_ball)
+            new_down = np.where(changed, 1, new_down)
+            new_dist = np.where(changed, 10, new_dist)
+
+            # --- REGULATION CLOCK ---
+            reg = active & ~ot
+            time_left = np.where(reg, time_left - time_used, time_left)
+            expired = reg & (time_left <= 0)
+            next_q = expired & (quarter < 4)
+            quarter = np.where(next_q, quarter + 1, quarter)
+            time_left = np.where(next_q, 900, time_left)
+            final = expired & ~next_q
+
+            off = np.where(active, new_off, off)
+            ball_on = np.where(active, new_ball, ball_on)
+            down = np.where(active, new_down, down)
+            distance = np.where(active, new_dist, distance)
+
+            tied = score[:, HOME] == score[:, AWAY]
+            active &= ~(final & ~tied)
+            enter_ot = final & tied
+            ot |= enter_ot
+            ot_period = np.where(enter_ot, 1, ot_period)
+            ot_turn = np.where(enter_ot, 0, ot_turn)
+
+            # --- OVERTIME POSSESSIONS (play_overtime) ---
+            # Each team gets one possession per period; shootout attempts are a single snap
+            ot_done = active & ot & ~enter_ot & (changed | shootout)
+            second_half = ot_done & (ot_turn == 1)
+            active &= ~(second_half & ~tied)
+            ot_period = np.where(second_half & tied, ot_period + 1, ot_period)
+            active &= ~(ot_period > MAX_OT_PERIODS)
+            ot_turn = np.where(ot_done, 1 - ot_turn, ot_turn)
+            reset = active & (enter_ot | ot_done)
+            off = np.where(reset, ot_turn, off)
+            in_shootout = ot_period >= 3
+            ball_on = np.where(reset, np.where(in_shootout, 97, 75), ball_on)
+            down = np.where(reset, np.where(in_shootout, 4, 1), down)
+            distance = np.where(reset, np.where(in_shootout, 3, 10), distance)
+
+        return MatchupOdds(self.home, self.away, score[:, HOME].copy(), score[:, AWAY].copy())
+
+
+def simulate_matchup(home, away, n_games=2000, seed=None, tuning=None):
+    """Plays home vs away n_games times in one vectorized pass and returns MatchupOdds."""
+    return BatchMatchupSim(home, away, seed=seed, tuning=tuning).run(n_games)
@@ -0,0 +1,313 @@
+# benchmarks.py
+#
+# Microbenchmarks for the project's hot paths, with stored baselines.
+# Every benchmark starts from a fresh copy of the same seeded universe, reseeds
+# the global RNG (and the engine's) before the timed call and keeps the best of
+# a few runs, so two runs on one machine do exactly the same work. Compared
+# with a baseline, any benchmark slower than it by more than the threshold is
+# a regression and the exit code is 1.
+#
+#   python benchmarks.py                        run everything, compare with the baseline
+#   python benchmarks.py --save                 run and store the times as the baseline
+#   python benchmarks.py play_game "resolve_play:*"    run some (shell-style patterns)
+#   python benchmarks.py --list
+#
+# Baselines are per machine: record one with --save before the change being
+# measured, on the machine that runs the comparison. Setting SIM_WORKERS
+# changes what simulate_week measures, so keep it the same for both runs.
+import contextlib
+import fnmatch
+import gc
+import io
+import json
+import os
+import pickle
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+
+from config import SIM_FIDELITY, SIM_WORKERS
+from tactics import PLAYBOOK, SPECIAL_OFF, SPECIAL_DEF
+from game_sim import GameSim
+from scheduler import Game, seed_game
+from world_gen import generate_world
+from logic import ensure_college_schedule, simulate_week
+from utils import repair_save_data
+from recruiting import process_weekly_recruiting, process_signing_day
+from transfer_portal import process_portal_entries, resolve_portal_destinations
+from coach_manager import process_coaching_carousel
+from season_manager import advance_season
+from league_manager import SAVE_FILE, save_league, load_league, deep_pickling
+
+BENCH_SEED = 2024
+BENCH_SCHOOLS = 100       # high schools in the benchmark universe (the game itself uses 300)
+BENCH_GAMES = 50          # college games per play_game run
+BENCH_SNAPS = 5000        # snaps per resolve_play run
+BENCH_REPEAT = 3          # runs per benchmark; the fastest one counts
+BENCH_MIN_TIME = 1.0      # quick benchmarks keep running until this many seconds are timed...
+BENCH_MAX_RUNS = 20       # ...or this many runs, so their best time is not one noisy sample
+BENCH_THRESHOLD = 0.25    # slower than the baseline by more than this = regression
+BENCH_BASELINE = "bench_baseline.json"
+
+# Where each special-teams snap starts (everything else is 1st & 10 on the own 25)
+SNAP_SPOTS = {PLAYBOOK.off["PUNT"]: 30, PLAYBOOK.off["FIELD_GOAL"]: 70}
+
+# --- BENCHMARK UNIVERSES ---
+class World:
+    """
+    The universes benchmarks start from, kept pickled so every run gets its own
+    fresh copy. "start" is a new game at week 1 (college schedule merged);
+    "offseason" is the same universe after week 16, ready for advance_season.
+    Each is built on first use.
+    """
+    def __init__(self):
+        self.frozen = {}
+
+    def store(self, name, universe):
+        with deep_pickling(): self.frozen[name] = pickle.dumps(universe, pickle.HIGHEST_PROTOCOL)
+
+    def get(self, name):
+        if name not in self.frozen:
+            random.seed(BENCH_SEED)
+            if name == "start":
+                self.store(name, _prepare(generate_world(BENCH_SCHOOLS)))
+            else:
+                universe = self.get("start")
+                _play_season(universe)
+                self.store(name, universe)
+        return pickle.loads(self.frozen[name])
+
+def _prepare(universe):
+    """What main.py does to a newly generated universe before the first week."""
+    ensure_college_schedule(universe)
+    repair_save_data(universe)
+    return universe
+
+def _play_season(universe):
+    # Only the offseason's inputs matter here (records, stats, playoff games), so
+    # every league uses the drive engine for speed
+    fidelity = dict(SIM_FIDELITY)
+    SIM_FIDELITY.update(COLLEGE="drive", HS="drive")
+    try:
+        while universe.current_week <= 16: simulate_week(universe, silent=True)
+    finally:
+        SIM_FIDELITY.update(fidelity)
+
+def _college_games(universe, week=1):
+    colleges = set(universe.college_league)
+    return [g for g in universe.schedule.get(week, []) if g.home_team in colleges]
+
+# --- BENCHMARKS ---
+class Benchmark:
+    """
+    `setup(world)` builds the arguments of `run` (untimed, once per run);
+    `keep(world, result)` lets a benchmark hand its result to the World.
+    """
+    def __init__(self, name, run, setup=None, keep=None, repeat=None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.keep = keep
+        self.repeat = repeat
+
+    def measure(self, world, repeat=BENCH_REPEAT):
+        """Best wall time of at least `repeat` runs (more for quick ones, see BENCH_MIN_TIME), in seconds."""
+        times = []
+        while len(times) < (self.repeat or repeat) or (sum(times) < BENCH_MIN_TIME and len(times) < BENCH_MAX_RUNS):
+            random.seed(BENCH_SEED)
+            args = self.setup(world) if self.setup else ()
+            random.seed(BENCH_SEED)
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                result = self.run(*args)
+                times.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+            if self.keep: self.keep(world, result)
+        return min(times)
+
+def _kept_world(world, universe):
+    if "start" not in world.frozen: world.store("start", _prepare(universe))
+
+def _games_setup(world):
+    universe = world.get("start")
+    sims = []
+    for game in _college_games(universe)[:BENCH_GAMES]:
+        seed_game(universe, game)
+        # Built like the season's own games: compact play log kept, output to the console
+        sims.append(GameSim(game))
+    return (sims,)
+
+def _play_games(sims):
+    for sim in sims: sim.play_game()
+
+def _snaps_setup(off_code):
+    def setup(world):
+        universe = world.get("start")
+        game = _college_games(universe)[0]
+        sim = GameSim(Game(game.home_team, game.away_team, 1), headless=True)
+        sim.rng.seed(BENCH_SEED)
+        if PLAYBOOK.off_keys[off_code] in SPECIAL_OFF:
+            def_codes = [PLAYBOOK.defense[k] for k in SPECIAL_DEF]
+        else:
+            def_codes = [PLAYBOOK.defense[k] for k in PLAYBOOK.def_keys if k not in SPECIAL_DEF]
+        return sim, off_code, def_codes
+    return setup
+
+def _snaps(sim, off_code, def_codes):
+    offense, defense = sim.offense, sim.defense
+    spot = SNAP_SPOTS.get(off_code, 25)
+    for i in range(BENCH_SNAPS):
+        # Scores and turnovers hand the ball over inside resolve_play; every snap starts from the same spot
+        sim.offense, sim.defense = offense, defense
+        sim.down, sim.distance, sim.ball_on = 1, 10, spot
+        sim.resolve_play(off_code, def_codes[i % len(def_codes)], "NORMAL")
+
+def _universe(name):
+    return lambda world: (world.get(name),)
+
+def _portal_setup(world):
+    universe = world.get("offseason")
+    return universe, process_portal_entries(universe, silent=True)
+
+def _saved_setup(world):
+    save_league(world.get("start"))
+    return (SAVE_FILE,)
+
+def build_benchmarks():
+    benchmarks = [Benchmark("generate_world", lambda: generate_world(BENCH_SCHOOLS), keep=_kept_world, repeat=1)]
+    benchmarks.append(Benchmark("play_game", _play_games, setup=_games_setup))
+    for off_code, key in enumerate(PLAYBOOK.off_keys):
+        benchmarks.append(Benchmark(f"resolve_play:{key}", _snaps, setup=_snaps_setup(off_code)))
+    benchmarks += [
+        Benchmark("simulate_week", lambda u: simulate_week(u, silent=True), setup=_universe("start")),
+        Benchmark("process_weekly_recruiting", process_weekly_recruiting, setup=_universe("start")),
+        Benchmark("process_signing_day", lambda u: process_signing_day(u, silent=True), setup=_universe("offseason")),
+        Benchmark("resolve_portal_destinations", lambda u, pool: resolve_portal_destinations(u, pool, silent=True), setup=_portal_setup),
+        Benchmark("process_coaching_carousel", lambda u: process_coaching_carousel(u, silent=True), setup=_universe("offseason")),
+        Benchmark("advance_season", lambda u: advance_season(u, interactive=False, silent=True), setup=_universe("offseason")),
+        Benchmark("save_league", save_league, setup=_universe("start")),
+        Benchmark("load_league", load_league, setup=_saved_setup),
+    ]
+    return benchmarks
+
+def select(benchmarks, patterns):
+    if not patterns: return benchmarks
+    chosen = [b for b in benchmarks if any(fnmatch.fnmatchcase(b.name, p) for p in patterns)]
+    if not chosen: raise ValueError(f"No benchmark matches {' '.join(patterns)} (see --list)")
+    return chosen
+
+# --- RUNNING ---
+@contextlib.contextmanager
+def _sandbox():
+    """
+    Runs in a scratch directory, so save files and stat logs written by the code
+    under test stay out of the project, with the benchmark's output swallowed.
+    Player ids (uuid4) come from the global RNG meanwhile, so a seeded world is
+    the same from run to run.
+    """
+    home = os.getcwd()
+    uuid4 = uuid.uuid4
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory(prefix="bench_") as scratch:
+        # The name lists (if present) change what world generation does
+        for names in ("firstnames.txt", "lastnames.txt"):
+            if os.path.exists(os.path.join(here, names)): shutil.copy(os.path.join(here, names), scratch)
+        os.chdir(scratch)
+        uuid.uuid4 = lambda: uuid.UUID(int=random.getrandbits(128), version=4)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield
+        finally:
+            uuid.uuid4 = uuid4
+            os.chdir(home)
+
+def run_benchmarks(benchmarks, repeat=BENCH_REPEAT, log=print):
+    """{name: best seconds}, in the order given."""
+    results = {}
+    world = World()
+    for bench in benchmarks:
+        with _sandbox():
+            results[bench.name] = bench.measure(world, repeat)
+        log(f"  {bench.name:<32}{results[bench.name]:>9.4f}s")
+    return results
+
+# --- BASELINES ---
+def machine_info():
+    return {"python": platform.python_version(), "machine": platform.machine(), "platform": platform.platform(),
+            "sim_workers": SIM_WORKERS, "schools": BENCH_SCHOOLS, "seed": BENCH_SEED}
+
+def load_baseline(path=BENCH_BASELINE):
+    if not os.path.exists(path): return None
+    with open(path) as f: return json.load(f)
+
+def save_baseline(results, path=BENCH_BASELINE):
+    """Stores the times, keeping the baseline's other benchmarks when only some were run."""
+    baseline = load_baseline(path) or {"results": {}}
+    baseline["machine"] = machine_info()
+    baseline["results"].update(results)
+    with open(path, "w") as f: json.dump(baseline, f, indent=1)
+
+def compare(results, baseline, threshold=BENCH_THRESHOLD):
+    """Rows of (name, seconds, baseline seconds or None, ratio or None, regressed)."""
+    rows = []
+    for name, seconds in results.items():
+        base = baseline["results"].get(name) if baseline else None
+        ratio = seconds / base if base else None
+        rows.append((name, seconds, base, ratio, ratio is not None and ratio > 1 + threshold))
+    return rows
+
+def print_comparison(rows, threshold):
+    print(f"\n{'BENCHMARK':<32}{'TIME':>10}{'BASELINE':>10}{'CHANGE':>9}")
+    for name, seconds, base, ratio, regressed in rows:
+        if ratio is None:
+            print(f"{name:<32}{seconds:>9.4f}s{'-':>10}{'new':>9}")
+            continue
+        flag = f"  REGRESSION (> +{threshold:.0%})" if regressed else ""
+        print(f"{name:<32}{seconds:>9.4f}s{base:>9.4f}s{ratio - 1:>+9.1%}{flag}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks with stored baselines")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (shell-style patterns; default all)")
+    parser.add_argument("--save", action="store_true", help="store the times as the new baseline instead of comparing")
+    parser.add_argument("--baseline", default=BENCH_BASELINE, help=f"baseline file (default {BENCH_BASELINE})")
+    parser.add_argument("--threshold", type=float, default=BENCH_THRESHOLD,
+                        help=f"allowed slowdown before a benchmark fails, as a fraction (default {BENCH_THRESHOLD})")
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEAT, help="minimum runs per benchmark; the fastest counts")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args()
+
+    benchmarks = build_benchmarks()
+    if args.list:
+        for bench in benchmarks: print(bench.name)
+        sys.exit()
+    try:
+        benchmarks = select(benchmarks, args.names)
+    except ValueError as e:
+        parser.error(str(e))
+
+    baseline_path = os.path.abspath(args.baseline)
+    print(f"Running {len(benchmarks)} benchmark(s)...")
+    results = run_benchmarks(benchmarks, args.repeat)
+
+    if args.save:
+        save_baseline(results, baseline_path)
+        print(f"\nBaseline saved to {args.baseline}.")
+        sys.exit()
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None: print(f"\nNo baseline at {args.baseline} (record one with --save).")
+    rows = compare(results, baseline, args.threshold)
+    print_comparison(rows, args.threshold)
+    regressions = [r for r in rows if r[4]]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed past +{args.threshold:.0%}.")
+        sys.exit(1)
@@ -0,0 +1,88 @@
+# box_score.py
+#
+# Per-game player stat lines. The engines count into a BoxScore (one row of
+# ints per player, indexed by the stat codes below) rather than the players'
+# season stats, and the box is merged into the season totals in one step when
+# the game is final. A game that is abandoned or played again leaves season
+# stats untouched. The committed box stays on the Game for views and news.
+
+# Same names as Player.stats
+STAT_KEYS = (
+    "pass_att", "pass_cmp", "pass_yds", "pass_td", "pass_int", "sacks_taken",
+    "rush_att", "rush_yds", "rush_td", "fumbles",
+    "rec_cat", "rec_yds", "rec_td",
+    "tackles", "sacks", "int_made", "def_td",
+    "fg_made", "fg_att", "punts", "punt_yds",
+)
+(PASS_ATT, PASS_CMP, PASS_YDS, PASS_TD, PASS_INT, SACKS_TAKEN,
+ RUSH_ATT, RUSH_YDS, RUSH_TD, FUMBLES,
+ REC_CAT, REC_YDS, REC_TD,
+ TACKLES, SACKS, INT_MADE, DEF_TD,
+ FG_MADE, FG_ATT, PUNTS, PUNT_YDS) = range(len(STAT_KEYS))
+N_STATS = len(STAT_KEYS)
+
+
+class BoxScore:
+    def __init__(self):
+        self.players = []   # slot -> player
+        self.rows = []      # slot -> count per stat code
+        self.slots = {}     # player -> slot
+        self.committed = False
+
+    def row(self, player):
+        """The player's counters for this game (a slot is opened on first use)."""
+        slot = self.slots.get(player)
+        if slot is None:
+            slot = self.slots[player] = len(self.players)
+            self.players.append(player)
+            self.rows.append([0] * N_STATS)
+        return self.rows[slot]
+
+    def commit(self):
+        """Adds the game into the players' season stats (once) and drops empty lines."""
+        if self.committed: return
+        players, rows = [], []
+        for player, row in zip(self.players, self.rows):
+            if not any(row): continue
+            stats = player.stats
+            for i, v in enumerate(row):
+                if v: stats[STAT_KEYS[i]] = stats.get(STAT_KEYS[i], 0) + v
+            players.append(player)
+            rows.append(tuple(row))
+        self.players, self.rows = players, rows
+        self.slots = {p: i for i, p in enumerate(players)}
+        self.committed = True
+
+    def export(self):
+        """(player id, row) pairs, for handing a box played elsewhere back to the real players."""
+        return [(p.id, tuple(row)) for p, row in zip(self.players, self.rows) if any(row)]
+
+    @classmethod
+    def restore(cls, entries, players_by_id):
+        box = cls()
+        for pid, row in entries:
+            box.row(players_by_id[pid])[:] = row
+        return box
+
+    def line(self, player):
+        """Stat dict for one player in this game (Player.get_stat_summary format)."""
+        slot = self.slots.get(player)
+        if slot is None: return {}
+        return {k: v for k, v in zip(STAT_KEYS, self.rows[slot]) if v}
+
+    def team_lines(self, team):
+        """(player, stat dict) for everyone on `team` who recorded a stat, in box order."""
+        roster = set(team.roster)
+        return [(p, self.line(p)) for p in self.players if p in roster]
+
+    def top_performer(self, team):
+        """Player of the game for `team`: yards, touchdowns and defensive plays, roughly weighted."""
+        best, best_score = None, 0
+        for p, s in self.team_lines(team):
+            score = (s.get("pass_yds", 0) * 0.5 + s.get("rush_yds", 0) + s.get("rec_yds", 0)
+                     + 20 * (s.get("pass_td", 0) + s.get("rush_td", 0) + s.get("rec_td", 0))
+                     - 15 * s.get("pass_int", 0)
+                     + 8 * s.get("tackles", 0) + 20 * s.get("sacks", 0) + 30 * s.get("int_made", 0)
+                     + 10 * s.get("fg_made", 0))
+            if score > best_score: best, best_score = p, score
+        return best
@@ -1,5 +1,6 @@
 import random
 from coach_traits import COACH_TRAITS
+from trait_flags import COACH_FLAGS
 
 class Coach:
     # Existing Archetypes
@@ -47,9 +48,37 @@ class Coach:
         self.championships = 0
 
         # --- TRAIT GENERATION ---
-        self.traits = []
+        self.trait_flags = 0 # Bit flags, see trait_flags.py
         self._generate_traits(base_rating)
 
+    # --- TRAITS ---
+    @property
+    def traits(self):
+        """Trait names, derived from trait_flags. Use add_trait() to grant one."""
+        return COACH_FLAGS.names(self.trait_flags)
+
+    @traits.setter
+    def traits(self, names):
+        self.trait_flags = COACH_FLAGS.mask(names)
+
+    def has_trait(self, name):
+        return bool(self.trait_flags & COACH_FLAGS.bit(name))
+
+    def add_trait(self, name):
+        self.trait_flags |= COACH_FLAGS.bit(name)
+
+    def __getstate__(self):
+        # Saves store trait names so bit numbering can change between versions
+        state = self.__dict__.copy()
+        state["traits"] = list(self.traits)
+        del state["trait_flags"]
+        return state
+
+    def __setstate__(self, state):
+        names = state.pop("traits", [])
+        self.__dict__.update(state)
+        self.trait_flags = COACH_FLAGS.mask(names)
+
     # Legacy property for compatibility with other modules that might check job_security
     @property
     def job_security(self):
@@ -72,16 +101,10 @@ class Coach:
         count = 0
         while count < num_traits and available:
             candidate = available.pop()
-            has_conflict = False
-            candidate_data = COACH_TRAITS[candidate]
-            if "conflict" in candidate_data:
-                for existing in self.traits:
-                    if existing in candidate_data["conflict"]:
-                        has_conflict = True
-                        break
+            has_conflict = self.trait_flags & COACH_FLAGS.conflicts[candidate]
             
             if not has_conflict:
-                self.traits.append(candidate)
+                self.add_trait(candidate)
                 count += 1
 
     @property
@@ -190,47 +213,47 @@ class Coach:
                 bonus += 100
         
         # 2. Trait Bonuses
-        if "Pipeline: South" in self.traits and recruit.home_region == "SOUTH": bonus += 150
-        if "Pipeline: North" in self.traits and recruit.home_region == "NORTH": bonus += 150
-        if "Pipeline: West" in self.traits and recruit.home_region == "WEST": bonus += 150
+        if self.has_trait("Pipeline: South") and recruit.home_region == "SOUTH": bonus += 150
+        if self.has_trait("Pipeline: North") and recruit.home_region == "NORTH": bonus += 150
+        if self.has_trait("Pipeline: West") and recruit.home_region == "WEST": bonus += 150
         
-        if "Five Star Chaser" in self.traits:
+        if self.has_trait("Five Star Chaser"):
             if recruit.stars >= 4: bonus += 120
             elif recruit.stars <= 2: bonus -= 50
             
-        if "Diamond in the Rough" in self.traits:
+        if self.has_trait("Diamond in the Rough"):
             if recruit.stars <= 3: 
                 bonus += 100
                 if recruit.potential > 80: bonus += 50
             
-        if "Quarterback Guru" in self.traits and recruit.position == "QB": bonus += 60
+        if self.has_trait("Quarterback Guru") and recruit.position == "QB": bonus += 60
         if "Trench Master" in self.development_archetype and recruit.position in ["OL", "DL"]: bonus += 40
-        if "Living Room Legend" in self.traits: bonus += 50
-        if "Snake Oil Salesman" in self.traits: bonus += 65
-        if "Socially Awkward" in self.traits: bonus -= 40
-        if "JuCo Bandit" in self.traits and getattr(recruit, 'is_juco', False): bonus += 200
+        if self.has_trait("Living Room Legend"): bonus += 50
+        if self.has_trait("Snake Oil Salesman"): bonus += 65
+        if self.has_trait("Socially Awkward"): bonus -= 40
+        if self.has_trait("JuCo Bandit") and getattr(recruit, 'is_juco', False): bonus += 200
 
         return bonus
 
-    def get_game_bonus(self, context, **kwargs):
-        """Generic hook for game_sim.py to ask for bonuses."""
+    def get_game_bonus(self, context, rng=random, **kwargs):
+        """Generic hook for game_sim.py to ask for bonuses. `rng` is the game's RNG stream."""
         val = 0
         if context == "4th_down":
-            if "Fourth Down Fire" in self.traits: val += 15
-            if "Gut Feeling" in self.traits and random.random() < 0.3: val += 20
+            if self.has_trait("Fourth Down Fire"): val += 15
+            if self.has_trait("Gut Feeling") and rng.random() < 0.3: val += 20
         elif context == "play_recognition":
-            if "The Analyst" in self.traits: val += 10
+            if self.has_trait("The Analyst"): val += 10
         elif context == "int_chance_defense":
-            if "Defensive Mastermind" in self.traits: val += 10
+            if self.has_trait("Defensive Mastermind"): val += 10
         elif context == "qb_attributes":
-            if "Quarterback Whisperer" in self.traits: val += 5
+            if self.has_trait("Quarterback Whisperer"): val += 5
         elif context == "halftime":
             diff = kwargs.get('score_diff', 0)
-            if "Halftime Adjuster" in self.traits and diff < 0: val += 5
+            if self.has_trait("Halftime Adjuster") and diff < 0: val += 5
         elif context == "penalty_chance":
-            if "Disciplinarian" in self.traits: val -= 20
-            if "Player's Coach" in self.traits: val += 20
-            if "Clock Manager" in self.traits: val -= 10
+            if self.has_trait("Disciplinarian"): val -= 20
+            if self.has_trait("Player's Coach"): val += 20
+            if self.has_trait("Clock Manager"): val -= 10
             
         return val
 
@@ -243,9 +266,9 @@ class Coach:
         elif self.development_archetype == "Trench Master" and position in ["OL","DL"]: bonus_rolls += 6
         elif self.development_archetype == "Skill Developer" and position in ["WR","DB","RB"]: bonus_rolls += 6
 
-        if "Weight Room Obsessed" in self.traits: bonus_rolls += 3
-        if "Technician" in self.traits: bonus_rolls += 2
-        if "Program Builder" in self.traits: bonus_rolls += 1
+        if self.has_trait("Weight Room Obsessed"): bonus_rolls += 3
+        if self.has_trait("Technician"): bonus_rolls += 2
+        if self.has_trait("Program Builder"): bonus_rolls += 1
         return bonus_rolls
 
     def __str__(self):
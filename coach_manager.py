@@ -168,7 +168,7 @@ def generate_new_coach(target_prestige, context="Coordinator"):
     new_coach.fan_support = 50 
     
     if context == "G5_Star" and random.random() < 0.5:
-        new_coach.traits.append("Program Builder")
+        new_coach.add_trait("Program Builder")
     
     return new_coach
 
@@ -247,7 +247,7 @@ def calculate_comprehensive_score(school, candidate, origin_school=None):
         "WEST": "Pipeline: West"
     }
     needed_trait = region_map.get(school.region, None)
-    if needed_trait and needed_trait in candidate.traits:
+    if needed_trait and candidate.has_trait(needed_trait):
         score += 10
     
     # 5. ALMA MATER BONUS (0 or 25 pts)
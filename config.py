@@ -1,4 +1,39 @@
+import os
 from rich.console import Console
 
 # Shared console instance used across all modules
-console = Console()
\ No newline at end of file
+console = Console()
+
+# Worker processes used to play a week's games in parallel (1 = sequential).
+# Opt in by editing this or setting the SIM_WORKERS environment variable.
+SIM_WORKERS = int(os.environ.get("SIM_WORKERS", 1))
+
+# Engine per league for unwatched games: "play" = full play-by-play GameSim,
+# "drive" = drive-level DriveSim (much faster, calibrated to GameSim's averages).
+# Games with an exported or watched log always use the play engine.
+SIM_FIDELITY = {"HS": "drive", "COLLEGE": "play"}
+
+# Optional JSON playbook replacing the built-in tables in tactics.py
+# (validated and compiled once at import).
+PLAYBOOK_FILE = os.environ.get("PLAYBOOK_FILE")
+
+# Optional JSON of play engine constants (engine_tuning.py), e.g. the output of
+# "python tuning_lab.py calibrate --out ...". Unset = built-in values.
+# GameSim and the batch odds (batch_sim.py) read it. DriveSim does not: its
+# rates are fitted to GameSim with the built-in values, so a league on "drive"
+# keeps the built-in balance until DriveSim is refit to the new set.
+ENGINE_TUNING_FILE = os.environ.get("ENGINE_TUNING_FILE")
+
+# Watch mode: frame cap for the live screen, and the default seconds per snap
+# when auto-advancing (None = press Enter for every snap; "watch <ID> <secs>"
+# overrides it per game).
+WATCH_FPS = 20
+WATCH_DELAY = None
+
+# Profiling (sim_profiler.py): set to a path prefix to time every game and
+# write <prefix>.txt / <prefix>.pstats after each simulated week.
+SIM_PROFILE = os.environ.get("SIM_PROFILE")
+
+# Exported game logs are appended to one archive per season in this directory
+# (see log_archive.py).
+LOG_ARCHIVE_DIR = os.environ.get("LOG_ARCHIVE_DIR", "game_logs")
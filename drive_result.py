@@ -0,0 +1,94 @@
+# drive_result.py
+#
+# One possession, as tracked by GameSim and DriveSim: who had the ball, where
+# it started, how many plays, yards and seconds it took, and how it ended
+# (play_log D_* result codes). The finished list is kept on Game.drives for
+# views, news and analytics.
+import play_result as pr
+from play_log import (
+    DRIVE_RESULTS, D_INTERCEPTED, D_FUMBLE, D_STRIP_SACK, D_SAFETY, D_TOUCHDOWN, D_DOWNS,
+    D_FG_GOOD, D_FG_MISSED, D_FG_BLOCKED, D_PUNT_BLOCKED, D_PUNT, D_2PT_GOOD, D_2PT_FAILED,
+)
+
+# PlayResult outcome -> drive result, for plays that end a possession
+_ENDING_OUTCOMES = {
+    pr.INTERCEPTION: D_INTERCEPTED, pr.FUMBLE: D_FUMBLE, pr.STRIP_SACK: D_STRIP_SACK,
+    pr.PUNT: D_PUNT, pr.PUNT_BLOCKED: D_PUNT_BLOCKED,
+    pr.FG_GOOD: D_FG_GOOD, pr.FG_MISSED: D_FG_MISSED, pr.FG_BLOCKED: D_FG_BLOCKED,
+}
+SCORING_RESULTS = (D_TOUCHDOWN, D_FG_GOOD, D_2PT_GOOD)
+
+
+def result_of(res):
+    """Drive result for the PlayResult that ended a possession."""
+    if res.conversion is not None: return D_2PT_GOOD if res.conversion else D_2PT_FAILED
+    if res.touchdown: return D_TOUCHDOWN
+    if res.safety: return D_SAFETY
+    if res.turnover_on_downs: return D_DOWNS
+    return _ENDING_OUTCOMES[res.outcome]
+
+
+class DriveResult:
+    """
+    `quarter` and `clock` are when the drive started (quarter 0 = overtime, with
+    `clock` holding the OT period). `yards` is net yards from scrimmage;
+    `distance` the kick length for field goals and punts. `points` counts for
+    the offense only (a safety's 2 points go to the defense).
+    """
+    __slots__ = ("offense", "quarter", "clock", "start", "plays", "yards", "time_used",
+                 "result", "distance", "points")
+
+    def __init__(self, offense, quarter, clock, start):
+        self.offense = offense
+        self.quarter = quarter
+        self.clock = int(clock)
+        self.start = int(start)
+        self.plays = 0
+        self.yards = 0
+        self.time_used = 0
+        self.result = None
+        self.distance = 0
+        self.points = 0
+
+    @property
+    def scored(self):
+        return self.result in SCORING_RESULTS
+
+    def label(self):
+        label = DRIVE_RESULTS[self.result]
+        if self.result in (D_FG_GOOD, D_FG_MISSED): return f"{self.distance} yd {label}"
+        if self.result == D_PUNT: return f"Punt {self.distance} yds"
+        return label
+
+    def render(self):
+        return f"{self.plays} plays, {self.yards} yds, {self.time_used // 60}:{self.time_used % 60:02d} - {self.label()}"
+
+    # --- PROCESS HAND-OFF ---
+    def export(self, home):
+        """Tuple with the offense as a side (1 home / 0 away), for games played in another process."""
+        return (1 if self.offense is home else 0, self.quarter, self.clock, self.start, self.plays,
+                self.yards, self.time_used, self.result, self.distance, self.points)
+
+    @classmethod
+    def restore(cls, data, home, away):
+        side, quarter, clock, start, *rest = data
+        drive = cls(home if side else away, quarter, clock, start)
+        drive.plays, drive.yards, drive.time_used, drive.result, drive.distance, drive.points = rest
+        return drive
+
+
+def go_ahead_drive(drives, team):
+    """The scoring drive that put `team` ahead for good, or None."""
+    mine = theirs = 0
+    go_ahead = None
+    for d in drives:
+        if d.offense is team:
+            mine += d.points
+            if d.result == D_SAFETY: theirs += 2
+        else:
+            theirs += d.points
+            if d.result == D_SAFETY: mine += 2
+        if mine <= theirs: go_ahead = None
+        elif go_ahead is None: go_ahead = d
+    if go_ahead is None or go_ahead.offense is not team or not go_ahead.scored: return None
+    return go_ahead
@@ -0,0 +1,472 @@
+# drive_sim.py
+#
+# Drive-level engine for games nobody watches (high school by default, see
+# config.SIM_FIDELITY). Instead of resolving every snap, each set of downs
+# ("series") is settled with a few draws from probabilities fitted against
+# GameSim: do they move the chains, how far, do they give the ball away. The
+# plays, yards, tackles and sacks of the series are then handed out to the
+# starters so season stat lines stay plausible.
+#
+# The series model was fitted on ~75k regulation series played by GameSim on
+# HS and college schedules; fourth-down decisions, kicking, punting, overtime
+# and injury severity follow GameSim's rules directly. The play mix (pass
+# share, sacks, completions, targets, how a series' yards are split) is fitted
+# to GameSim box scores of whole HS weeks, so team and player rates match it.
+# Both fits use the built-in engine constants: DriveSim does not read
+# engine_tuning.
+#
+# Simplifications vs. GameSim: no fatigue (starters play until hurt), no
+# two-minute clock management, and injuries are rolled once per drive from the
+# hits each player took in it. A possession's clock is charged all at once, so
+# when it runs past a quarter break the time left over is carried into the
+# next quarter instead of restarting it at 15:00 as GameSim does: that part of
+# the drive was played after the break. Restarting it would hand every quarter
+# up to a drive of free time (+15% HS scoring, fewer overtimes).
+
+import math
+import random
+
+from game_random import GameRandom
+from team_snapshot import TeamSnapshot
+from box_score import (
+    BoxScore, PASS_ATT, PASS_CMP, PASS_YDS, PASS_TD, PASS_INT, SACKS_TAKEN, RUSH_ATT, RUSH_YDS, RUSH_TD,
+    REC_CAT, REC_YDS, REC_TD, TACKLES, SACKS, INT_MADE, FG_MADE, FG_ATT, PUNTS, PUNT_YDS,
+)
+from play_policy import policy_for, fourth_down_index, KICK, PUNT
+from drive_result import DriveResult
+from sim_profiler import PROFILER
+from play_log import (
+    PlayLog, DRIVE_OT_PERIOD, D_INTERCEPTED, D_FUMBLE, D_STRIP_SACK, D_SAFETY, D_TOUCHDOWN, D_END_OF_GAME,
+    D_DOWNS, D_FG_GOOD, D_FG_MISSED, D_FG_BLOCKED, D_PUNT_BLOCKED, D_PUNT, D_2PT_GOOD, D_2PT_FAILED,
+)
+from game_sim import (
+    roll_injury,
+    BIG_LEG, ICE_VEINS, CHOKER, GLASS_CANNON,
+)
+
+# --- SERIES MODEL (logistic, fitted on GameSim output) ---
+# P(move the chains or score) and P(turnover) for one set of downs.
+# `need` is min(10, yards to the goal line).
+SUCCESS_COEF = {"const": 2.20, "run_edge": 0.038, "press": -0.023, "acc": 0.010,
+                "sep": 0.0186, "cth": 0.0046, "rpb": 0.044, "need": -0.177}
+TURNOVER_COEF = {"const": -2.50, "run_edge": -0.0114, "sep": -0.0184, "cth": -0.0038,
+                 "rpb": 0.0189, "need": 0.0584, "qint": -0.0115}
+
+EXTRA_GAIN_MEAN = 7.75      # yards beyond the sticks on a successful series (exponential)
+SHOOTOUT_SUCCESS = 0.74     # 2-pt attempt from the 3 (GameSim, 3rd OT+)
+FOURTH_DOWN_SUCCESS = (0.55, 0.35)  # going for it: distance <= 2, longer
+
+# --- PLAY MIX (GameSim league-wide rates) ---
+SACK_RATE = 0.14            # per dropback
+SCRAMBLE_RATE = 0.04        # per dropback
+INCOMPLETE_RATE = 0.065     # per attempt
+INT_SHARE, FUMBLE_SHARE = 0.71, 0.21   # of turnovers; the rest are strip sacks
+TARGET_WEIGHTS = (0.49, 0.29, 0.08, 0.14)  # WR1, WR2, TE, RB
+# A series' yards are split between its touches (runs, scrambles, catches by
+# receiver slot) in proportion to GAIN_SCALE ** GAIN_POWER, with some noise
+GAIN_SCALE = {"run": 3.75, "scramble": 4.0, "WR": 21.5, "TE": 19.8, "RB": 7.7}
+GAIN_POWER = 5
+# Pass share of a series' snaps (logistic): long gains are mostly catches, so
+# it rises with the series' yards per snap ("gain") as well as the coach's
+# run/pass bias. The scoring snap has its own, steeper in the bias
+PASS_COEF = {"const": -3.26, "rpb": 0.34, "gain": 0.26}
+TOUCHDOWN_COEF = {"const": -0.80, "rpb": 0.41}
+
+# Game clock per snap by series outcome (GameSim averages; kicks include the 4th down snap)
+SECONDS_MOVING, SECONDS_STALLED, SECONDS_TURNOVER, SECONDS_KICK = 60, 47, 33, 45
+
+# Injury risk multipliers per touch (same as GameSim.resolve_play)
+RISK_CARRY, RISK_TACKLE, RISK_SACK, RISK_SCRAMBLE, RISK_THROW = 1.0, 1.0, 5.0, 3.0, 0.1
+
+# Series outcomes
+FIRST_DOWN, TOUCHDOWN, TURNOVER, STALL, SAFETY = range(5)
+
+
+def _logistic(coef, feats):
+    z = coef["const"]
+    for k, w in coef.items():
+        if k != "const": z += w * feats[k]
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+class DriveSim:
+    def __init__(self, game, console=None, headless=False):
+        self.game = game
+        # Same seeding rules as GameSim: the game's seed fixes the whole stream
+        if getattr(game, 'seed', None) is None: game.seed = random.getrandbits(64)
+        self.rng = GameRandom(game.seed)
+        self.console = console
+        self.headless = headless
+
+        self.home = game.home_team
+        self.away = game.away_team
+        self.offense = self.away
+        self.defense = self.home
+        # Stats are counted per game and merged into season totals at the final whistle
+        self.box = BoxScore()
+        self.snapshots = {self.home: TeamSnapshot(self.home, self.box), self.away: TeamSnapshot(self.away, self.box)}
+        self.policies = {self.home: policy_for(self.home.coach), self.away: policy_for(self.away.coach)}
+        self.quarter = 1
+        self.time_remaining = 900
+        self.ball_on = 25
+        self.log = PlayLog(self.home, self.away)
+        self.drives = []  # DriveResult per possession
+        self.play_count = 0
+        self.is_overtime = False
+        self.ot_period = 0
+        self.stats = {
+            self.home: {"score": 0, "yards": 0, "pass": 0, "rush": 0, "to": 0},
+            self.away: {"score": 0, "yards": 0, "pass": 0, "rush": 0, "to": 0}
+        }
+        self._risk = {}     # card -> chance of getting through this drive unhurt
+        if PROFILER.active: PROFILER.attach(self)
+
+    # --- MATCHUP ---
+    def _features(self):
+        """Unit ratings for the current offense vs defense (the series model inputs)."""
+        so, sd = self.snapshots[self.offense], self.snapshots[self.defense]
+        n_ol, n_dl = len(so.unit("OL", 5)) or 1, len(sd.unit("DL", 3)) or 1
+        recs = so.unit("WR", 2) + so.unit("TE", 1)
+        dbs = sd.unit("DB", 3)
+        qb = so.unit("QB", 1)[0]
+        return {
+            "run_edge": so.unit_sum("OL", 5, "run_block") / (n_ol * 2) - sd.unit_sum("DL", 3, "run_stop") / (n_dl * 2),
+            "press": sd.unit_sum("DL", 3, "str") / n_dl - so.unit_sum("OL", 5, "blk") / n_ol,
+            "acc": qb.acc, "qint": qb.int,
+            "sep": sum(c.separation for c in recs) / len(recs) - sum(c.coverage for c in dbs) / len(dbs),
+            "cth": sum(c.cth for c in recs) / len(recs),
+            "rpb": self.offense.coach.run_pass_bias,
+        }
+
+    def _starter(self, team, position, count=1):
+        unit = self.snapshots[team].unit(position, count)
+        return self.rng.choice(unit) if count > 1 else unit[0]
+
+    # --- INJURIES ---
+    def _hit(self, card, risk):
+        chance = (0.5 + (100 - card.dur) * 0.02) * risk
+        # TRAIT: Glass Cannon (Higher risk)
+        if card.trait_flags & GLASS_CANNON: chance *= 3.0
+        self._risk[card] = self._risk.get(card, 1.0) * (1 - chance / 100)
+
+    def _roll_injuries(self):
+        injuries = []
+        for card, unhurt in self._risk.items():
+            if self.rng.random() >= unhurt:
+                injuries.append(roll_injury(self.rng, card))
+        self._risk = {}
+        return injuries
+
+    # --- SERIES ---
+    def _play_series(self, feats):
+        """Settles one set of downs. Returns (outcome, yards gained, snaps)."""
+        need = min(10, 100 - self.ball_on)
+        feats["need"] = need
+        p_to = _logistic(TURNOVER_COEF, feats)
+        p_ok = _logistic(SUCCESS_COEF, feats)
+        roll = self.rng.random()
+
+        if roll < p_to:
+            u = self.rng.random()
+            plays = 1 if u < 0.5 else (2 if u < 0.85 else 3)
+            return TURNOVER, min(need - 1, self.rng.randint(-2, 4)), plays
+        if roll < p_to + p_ok:
+            u = self.rng.random()
+            plays = 1 if u < 0.45 else (2 if u < 0.85 else 3)
+            gain = max(need, 10 + int(self.rng.expovariate(1 / EXTRA_GAIN_MEAN)))
+            # Like GameSim, a scoring gain is reported in full, past the goal line
+            if self.ball_on + gain >= 100: return TOUCHDOWN, gain, plays
+            return FIRST_DOWN, gain, plays
+        gain = min(need - 1, self.rng.randint(-4, 9))
+        if self.ball_on + gain <= 0: return SAFETY, -self.ball_on, 3
+        return STALL, gain, 3
+
+    def _snap(self, qb, pass_share, scoring=False):
+        """
+        Picks one play and credits its attempt. Returns (ball carrier, kind, GAIN_SCALE
+        key); no carrier on sacks/incompletions, which the scoring snap never is.
+        """
+        rng = self.rng
+        o, d = self.offense, self.defense
+        if rng.random() >= pass_share:
+            rb = self._starter(o, "RB")
+            rb.line[RUSH_ATT] += 1
+            return rb, "run", "run"
+        u = rng.random()
+        if scoring: u = SACK_RATE + u * (1 - SACK_RATE)
+        if u < SACK_RATE:
+            qb.line[SACKS_TAKEN] += 1
+            self._starter(d, "DL", 3).line[SACKS] += 1
+            self._hit(qb, RISK_SACK)
+            return None, "sack", None
+        if u < SACK_RATE + SCRAMBLE_RATE:
+            qb.line[RUSH_ATT] += 1
+            self._hit(qb, RISK_SCRAMBLE)
+            return qb, "scramble", "scramble"
+        qb.line[PASS_ATT] += 1
+        self._hit(qb, RISK_THROW)
+        if not scoring and rng.random() < INCOMPLETE_RATE: return None, "incomplete", None
+        qb.line[PASS_CMP] += 1
+        slot = rng.choices((0, 1, 2, 3), weights=TARGET_WEIGHTS)[0]
+        if slot < 2:
+            wrs = self.snapshots[o].unit("WR", 2)
+            target = wrs[min(slot, len(wrs) - 1)]
+        elif slot == 2: target = self._starter(o, "TE")
+        else: target = self._starter(o, "RB")
+        target.line[REC_CAT] += 1
+        return target, "catch", ("WR", "WR", "TE", "RB")[slot]
+
+    def _hand_out(self, yards, feats, plays, scored=False):
+        """Spreads a series' snaps and yardage over the starters' box scores."""
+        rng = self.rng
+        o, d = self.offense, self.defense
+        qb = self._starter(o, "QB")
+        pass_share = max(0.10, min(0.90, _logistic(PASS_COEF, {"rpb": feats["rpb"], "gain": yards / plays})))
+        scoring_share = _logistic(TOUCHDOWN_COEF, feats)
+
+        touches = []    # [card, kind, GAIN_SCALE key, yards]
+        lost = 0        # sack yardage, made up by the touches
+        for n in range(plays):
+            scoring = scored and n == plays - 1
+            card, kind, key = self._snap(qb, scoring_share if scoring else pass_share, scoring)
+            if kind == "sack":
+                loss = rng.randint(2, 9)
+                lost += loss
+                self.stats[o]["yards"] -= loss; self.stats[o]["pass"] -= loss
+            elif card is not None:
+                touches.append([card, kind, key, 0])
+
+        if not touches:
+            # Every snap was a sack or an incompletion: the yardage came on a run
+            rb = self._starter(o, "RB")
+            rb.line[RUSH_ATT] += 1
+            touches.append([rb, "run", "run", 0])
+
+        # Big plays are catches: weight each touch by its typical gain
+        weights = [GAIN_SCALE[key] ** GAIN_POWER * (rng.random() + 0.5) for _, _, key, _ in touches]
+        total_w = sum(weights)
+        for t, w in zip(touches, weights): t[3] = int((yards + lost) * w / total_w)
+        # Last touch gets whatever is left so the series adds up (sacks included)
+        touches[-1][3] += yards + lost - sum(t[3] for t in touches)
+
+        for i, (card, kind, _, gained) in enumerate(touches):
+            self._hit(card, RISK_CARRY)
+            self.stats[o]["pass" if kind == "catch" else "rush"] += gained
+            if kind == "catch":
+                card.line[REC_YDS] += gained; qb.line[PASS_YDS] += gained
+                tackler = self._starter(d, "DB", 3) if rng.random() < 0.7 else self._starter(d, "LB", 3)
+            else:
+                card.line[RUSH_YDS] += gained
+                u = rng.random()
+                tackler = self._starter(d, "DL", 3) if u < 0.25 else (self._starter(d, "LB", 3) if u < 0.75 else self._starter(d, "DB", 3))
+            if scored and i == len(touches) - 1: continue
+            tackler.line[TACKLES] += 1
+            self._hit(tackler, RISK_TACKLE)
+
+        if scored:
+            card, kind, _, _ = touches[-1]
+            if kind == "catch": card.line[REC_TD] += 1; qb.line[PASS_TD] += 1
+            else: card.line[RUSH_TD] += 1
+        self.stats[o]["yards"] += yards + lost
+        self.play_count += plays
+
+    def _give_away(self):
+        """Turnover play at the end of a series: interception, fumble or strip sack."""
+        rng = self.rng
+        o, d = self.offense, self.defense
+        qb = self._starter(o, "QB")
+        u = rng.random()
+        if u < INT_SHARE:
+            qb.line[PASS_ATT] += 1; qb.line[PASS_INT] += 1
+            self._starter(d, "DB", 3).line[INT_MADE] += 1
+            result = D_INTERCEPTED
+        elif u < INT_SHARE + FUMBLE_SHARE:
+            self._starter(o, "RB").line[RUSH_ATT] += 1
+            result = D_FUMBLE
+        else:
+            qb.line[SACKS_TAKEN] += 1
+            self._starter(d, "DL", 3).line[SACKS] += 1
+            result = D_STRIP_SACK
+        self.stats[d]["to"] += 1
+        self.play_count += 1
+        return result
+
+    # --- FOURTH DOWN ---
+    def _fourth_down(self, distance):
+        """GameSim's 4th down call (play_policy). Returns 'GO', 'FG' or 'PUNT'."""
+        late_and_trailing = (self.quarter == 4 and self.time_remaining < 180
+                             and self.stats[self.offense]["score"] < self.stats[self.defense]["score"])
+        policy = self.policies[self.offense]
+        call = policy.fourth_down(fourth_down_index(distance, self.ball_on, late_and_trailing), self.rng)
+        if call == KICK: return "FG"
+        if call == PUNT: return "PUNT"
+        return "GO"
+
+    def _kick_field_goal(self):
+        if self.rng.random() < 0.015: return D_FG_BLOCKED, 0
+        kicker = self._starter(self.offense, "K")
+        kicker.line[FG_ATT] += 1
+        dist = 100 - self.ball_on + 17
+        score_diff = abs(self.stats[self.home]["score"] - self.stats[self.away]["score"])
+        is_clutch_time = (self.quarter == 4 or self.is_overtime) and score_diff <= 8
+        # TRAIT: Ice Veins / Choker (Clutch Kicking)
+        acc_bonus = 10 if (kicker.trait_flags & ICE_VEINS and is_clutch_time) else 0
+        if kicker.trait_flags & CHOKER and is_clutch_time: acc_bonus -= 20
+        acc = 100 if dist <= 25 else 100 - (dist - 25) * 1.0 + acc_bonus
+        self.play_count += 1
+        if self.rng.randint(1, 100) < acc:
+            kicker.line[FG_MADE] += 1
+            return D_FG_GOOD, int(dist)
+        return D_FG_MISSED, int(dist)
+
+    def _punt(self):
+        self.play_count += 1
+        if self.rng.random() < 0.01: return None
+        punter = self._starter(self.offense, "P")
+        dist = 35 + self.rng.randint(0, 20)
+        if punter.trait_flags & BIG_LEG: dist += 5
+        punter.line[PUNTS] += 1; punter.line[PUNT_YDS] += dist
+        return dist
+
+    # --- DRIVES ---
+    def play_drive(self):
+        """
+        Plays one possession for self.offense from self.ball_on.
+        Returns (points, drive result (play_log D_* code), FG / punt distance,
+        next ball spot for the other team, seconds used).
+        """
+        feats = self._features()
+        elapsed = 0
+        while True:
+            outcome, gain, plays = self._play_series(feats)
+            if outcome == TURNOVER:
+                # The snaps before the giveaway moved the ball; a one-snap series didn't
+                if plays > 1:
+                    self._hand_out(gain, feats, plays - 1)
+                    self.ball_on += gain
+                result = self._give_away()
+                elapsed += plays * SECONDS_TURNOVER
+                return 0, result, 0, 100 - self.ball_on, elapsed
+            if outcome == SAFETY:
+                self._hand_out(gain, feats, plays)
+                self.stats[self.defense]["score"] += 2
+                return 0, D_SAFETY, 0, 25, elapsed + plays * SECONDS_STALLED
+
+            scored = outcome == TOUCHDOWN
+            moving = outcome != STALL
+            self._hand_out(gain, feats, plays, scored=scored)
+            self.ball_on += gain
+            elapsed += plays * (SECONDS_MOVING if moving else SECONDS_STALLED)
+            if scored:
+                return 7, D_TOUCHDOWN, 0, 25, elapsed
+            if outcome == FIRST_DOWN:
+                if not self.is_overtime and self.quarter == 4 and self.time_remaining - elapsed <= 0:
+                    return 0, D_END_OF_GAME, 0, 100 - self.ball_on, elapsed
+                continue
+
+            # Stalled: 4th down
+            distance = min(10, 100 - self.ball_on + gain) - gain
+            call = self._fourth_down(distance)
+            if call == "GO":
+                elapsed += SECONDS_STALLED
+                if self.rng.random() < FOURTH_DOWN_SUCCESS[0 if distance <= 2 else 1]:
+                    extra = distance + int(self.rng.expovariate(0.25))
+                    scored = self.ball_on + extra >= 100
+                    self._hand_out(extra, feats, 1, scored=scored)
+                    if scored: return 7, D_TOUCHDOWN, 0, 25, elapsed
+                    self.ball_on += extra
+                    continue
+                self._hand_out(self.rng.randint(0, distance - 1), feats, 1)
+                return 0, D_DOWNS, 0, 100 - self.ball_on, elapsed
+            if call == "FG":
+                result, dist = self._kick_field_goal()
+                elapsed += SECONDS_KICK
+                if result == D_FG_GOOD: return 3, result, dist, 25, elapsed
+                return 0, result, dist, 100 - self.ball_on, elapsed
+            dist = self._punt()
+            elapsed += SECONDS_KICK
+            if dist is None: return 0, D_PUNT_BLOCKED, 0, 100 - self.ball_on, elapsed
+            spot = 100 - (self.ball_on + dist)
+            return 0, D_PUNT, dist, spot if spot >= 0 else 20, elapsed
+
+    def _start_drive(self):
+        if self.is_overtime: return DriveResult(self.offense, 0, self.ot_period, self.ball_on)
+        return DriveResult(self.offense, self.quarter, self.time_remaining, self.ball_on)
+
+    def _run_possession(self):
+        drive = self._start_drive()
+        plays_before = self.play_count
+        points, drive.result, drive.distance, next_spot, elapsed = self.play_drive()
+        if points > 0: self.stats[self.offense]["score"] += points
+        drive.points, drive.time_used, drive.plays = points, elapsed, self.play_count - plays_before
+        drive.yards = (100 if drive.result == D_TOUCHDOWN else self.ball_on) - drive.start
+        self.drives.append(drive)
+        injuries = self._roll_injuries()
+        if not self.headless:
+            self.log.drive(drive, injuries, (self.stats[self.home]["score"], self.stats[self.away]["score"]))
+        return points, next_spot, elapsed
+
+    def _switch(self, next_spot):
+        self.offense, self.defense = self.defense, self.offense
+        self.ball_on = next_spot
+
+    def play_overtime(self):
+        self.is_overtime = True
+        self.ot_period = 1
+        while self.stats[self.home]["score"] == self.stats[self.away]["score"]:
+            if not self.headless: self.log.header(DRIVE_OT_PERIOD, self.ot_period)
+            for team in (self.away, self.home):
+                self.offense = team
+                self.defense = self.home if team == self.away else self.away
+                if self.ot_period >= 3:
+                    # 2-point shootout from the 3
+                    drive = DriveResult(team, 0, self.ot_period, 97)
+                    drive.plays = 1
+                    if self.rng.random() < SHOOTOUT_SUCCESS:
+                        self._hand_out(3, self._features(), 1, scored=True)
+                        self.stats[team]["score"] += 2
+                        drive.result, drive.points, drive.yards = D_2PT_GOOD, 2, 3
+                    else:
+                        drive.yards = self.rng.randint(-2, 2)
+                        self._hand_out(drive.yards, self._features(), 1)
+                        drive.result = D_2PT_FAILED
+                    self.drives.append(drive)
+                else:
+                    self.ball_on = 75
+                    self._run_possession()
+            self.ot_period += 1
+
+    def play_game(self):
+        while self.quarter <= 4:
+            _, next_spot, elapsed = self._run_possession()
+            self.time_remaining -= elapsed
+            # Carry the overrun into the next quarter (see the module comment)
+            while self.time_remaining <= 0 and self.quarter <= 4:
+                self.quarter += 1
+                self.time_remaining += 900
+            self._switch(next_spot)
+
+        if self.stats[self.home]["score"] == self.stats[self.away]["score"]:
+            self.play_overtime()
+
+        self.game.home_score = self.stats[self.home]["score"]
+        self.game.away_score = self.stats[self.away]["score"]
+        self.box.commit()
+        self.game.box_score = self.box
+        self.game.played = True
+        self.game.game_log = self.log
+        self.game.drives = self.drives
+        self.game.summary = self.build_summary()
+        return self.game
+
+    def build_summary(self):
+        """Same shape as GameSim.build_summary."""
+        return {
+            "home": dict(self.stats[self.home]),
+            "away": dict(self.stats[self.away]),
+            "turnovers": self.stats[self.home]["to"] + self.stats[self.away]["to"],
+            "overtime": self.is_overtime,
+            "ot_periods": max(0, self.ot_period - 1),
+            "plays": self.play_count,
+            "drives": len(self.drives),
+        }
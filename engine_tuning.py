@@ -0,0 +1,92 @@
+# engine_tuning.py
+#
+# Tunable constants of the play engine (GameSim.resolve_play and
+# resolve_pass_target) as one parameter set. A GameSim or BatchMatchupSim reads
+# them from its EngineTuning (TUNING unless it is given another), so the tuning lab can
+# search them (tuning_lab.calibrate) or run two sets side by side without
+# editing code.
+#
+# PARAMS holds each constant's built-in value, search step and allowed range.
+# Integer constants stay integers (they feed randint ranges). A calibrated set
+# is saved as JSON ({name: value}); point ENGINE_TUNING_FILE (config) at it to
+# make it the default for every game.
+import json
+
+from config import ENGINE_TUNING_FILE
+
+# name: (default, step, low, high)
+PARAMS = {
+    # Pass target selection
+    "sep_variance": (15, 2, 0, 40),             # separation roll: +/- this
+    "zone_coverage": (85, 2, 40, 99),           # zone defenders' coverage is averaged with this
+    # Pass rush
+    "pressure_variance": (20, 2, 0, 40),        # pressure roll: +/- this
+    "pressure_threshold": (20, 2, 0, 50),       # pressure above this = sack or scramble
+    "scramble_margin": (30, 5, 0, 80),          # QB escape must beat a 0-100 roll + this
+    "sack_fumble": (0.05, 0.01, 0.0, 0.3),
+    # Throw
+    "catch_base": (60, 2, 0, 100),
+    "acc_weight": (0.50, 0.05, 0.0, 1.5),       # QB ACC
+    "cth_weight": (0.50, 0.05, 0.0, 1.5),       # receiver CTH
+    "sep_weight": (1.5, 0.1, 0.0, 4.0),         # separation
+    "catch_min": (40, 2, 0, 99),
+    "catch_max": (99, 1, 50, 100),
+    "drop_chance": (3, 1, 0, 20),               # % of catchable balls dropped
+    # Interceptions
+    "risky_separation": (-5, 1, -20, 10),       # throws into tighter coverage than this are risky
+    "int_rate": (0.16, 0.01, 0.0, 0.5),         # INT chance per point of the defender's INT
+    # Yards after catch
+    "yac_max": (8, 1, 1, 20),
+    "big_play_chance": (0.10, 0.01, 0.0, 0.5),
+    # Runs
+    "trench_variance": (20, 2, 0, 40),          # trench roll: +/- this
+    "stuff_line": (-15, 1, -40, 0),             # trench result below this = stuffed
+    "gain_line": (5, 1, -20, 30),               # below this = short gain, above = good blocking
+    "breakaway_base": (0.03, 0.005, 0.0, 0.2),
+    "fumble_base": (1.5, 0.1, 0.0, 10.0),       # % per carry
+}
+
+
+class EngineTuning:
+    __slots__ = tuple(PARAMS)
+
+    def __init__(self, **values):
+        for name, (default, _, _, _) in PARAMS.items(): setattr(self, name, default)
+        self.update(values)
+
+    def update(self, values):
+        for name, value in values.items():
+            if name not in PARAMS: raise ValueError(f"Unknown engine constant {name}")
+            default, _, low, high = PARAMS[name]
+            value = max(low, min(high, value))
+            setattr(self, name, int(round(value)) if isinstance(default, int) else float(value))
+
+    def replace(self, **values):
+        """Copy with some constants changed."""
+        tuning = EngineTuning(**self.as_dict())
+        tuning.update(values)
+        return tuning
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in PARAMS}
+
+    def changes(self):
+        """{name: value} for every constant that differs from the built-in default."""
+        return {name: value for name, value in self.as_dict().items() if value != PARAMS[name][0]}
+
+    def __eq__(self, other):
+        return isinstance(other, EngineTuning) and self.as_dict() == other.as_dict()
+
+    def __repr__(self):
+        return f"EngineTuning({', '.join(f'{k}={v!r}' for k, v in self.changes().items())})"
+
+    # --- FILES ---
+    def save(self, path):
+        with open(path, "w") as f: json.dump(self.as_dict(), f, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f: return cls(**json.load(f))
+
+
+TUNING = EngineTuning.load(ENGINE_TUNING_FILE) if ENGINE_TUNING_FILE else EngineTuning()
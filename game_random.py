@@ -0,0 +1,20 @@
+# game_random.py
+#
+# Per-game random stream for the engines. A snap makes a dozen or more
+# randint/choice calls; random.Random implements those in Python on top of
+# getrandbits with rejection sampling (randrange -> _randbelow), which costs
+# several times a plain random() call. GameRandom derives them from a single
+# random() draw instead. For the small ranges the engines use the bias is far
+# below anything a season could show.
+#
+# The seed still fixes the whole stream (scheduler.seed_game), so games replay
+# exactly; they just draw different numbers than random.Random would.
+import random
+
+
+class GameRandom(random.Random):
+    def randint(self, a, b):
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
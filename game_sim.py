@@ -1,13 +1,72 @@
+import io
 import random
 import time
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich import box
 from rich.text import Text
-from rich.align import Align
 
-from tactics import OFF_PLAYS, DEF_STRATEGIES
+from tactics import PLAYBOOK
+from game_random import GameRandom
+import play_result as pr
+from play_result import PlayResult
+from team_snapshot import TeamSnapshot
+from box_score import (
+    BoxScore, PASS_ATT, PASS_CMP, PASS_YDS, PASS_TD, PASS_INT, SACKS_TAKEN, RUSH_ATT, RUSH_YDS, RUSH_TD,
+    REC_CAT, REC_YDS, REC_TD, TACKLES, SACKS, INT_MADE, FG_MADE, FG_ATT, PUNTS, PUNT_YDS,
+)
+from play_policy import policy_for, fourth_down_index, pass_index
+from log_archive import archive_for, game_key
+from live_view import LiveView
+from config import WATCH_DELAY
+from drive_result import DriveResult, result_of
+from sim_profiler import PROFILER
+from engine_tuning import TUNING
+from play_log import PlayLog, D_END_OF_GAME, SNAP, OT_SNAP, SHOOTOUT, OT_PERIOD, OT_POSSESSION, SHOOTOUT_TEAM
+from trait_flags import PLAYER_FLAGS, COACH_FLAGS
+
+# --- TRAIT FLAGS ---
+FIRST_STEP = PLAYER_FLAGS.bit("First Step")
+BRICK_WALL = PLAYER_FLAGS.bit("Brick Wall")
+TURNSTILE = PLAYER_FLAGS.bit("Turnstile")
+TRENCH_DOG = PLAYER_FLAGS.bit("Trench Dog")
+GLASS_CANNON = PLAYER_FLAGS.bit("Glass Cannon")
+IRON_MAN = PLAYER_FLAGS.bit("Iron Man")
+GUNSLINGER = PLAYER_FLAGS.bit("Gunslinger")
+GAME_MANAGER = PLAYER_FLAGS.bit("Game Manager")
+SATELLITE = PLAYER_FLAGS.bit("Satellite")
+BIG_LEG = PLAYER_FLAGS.bit("Big Leg")
+ICE_VEINS = PLAYER_FLAGS.bit("Ice Veins")
+CHOKER = PLAYER_FLAGS.bit("Choker")
+FIELD_GENERAL = PLAYER_FLAGS.bit("Field General")
+BUTTERFINGERS = PLAYER_FLAGS.bit("Butterfingers")
+ANKLE_BITER = PLAYER_FLAGS.bit("Ankle Biter")
+BRUISER = PLAYER_FLAGS.bit("Bruiser")
+STATUE = PLAYER_FLAGS.bit("Statue")
+ESCAPIST = PLAYER_FLAGS.bit("Escapist")
+STONE_HANDS = PLAYER_FLAGS.bit("Stone Hands")
+SAFETY_VALVE = PLAYER_FLAGS.bit("Safety Valve")
+BALL_HAWK = PLAYER_FLAGS.bit("Ball Hawk")
+HUMAN_JOYSTICK = PLAYER_FLAGS.bit("Human Joystick")
+
+# Coach traits
+CLOCK_MANAGER = COACH_FLAGS.bit("Clock Manager")
+THE_ANALYST = COACH_FLAGS.bit("The Analyst")
+
+# --- PLAY CODES ---
+# Integer codes from the compiled playbook (tactics.PLAYBOOK)
+RUN_POWER, RUN_ZONE, RUN_DRAW = (PLAYBOOK.off[k] for k in ("RUN_POWER", "RUN_ZONE", "RUN_DRAW"))
+PASS_QUICK, PASS_SCREEN, PASS_STD, PASS_PA, PASS_DEEP = (
+    PLAYBOOK.off[k] for k in ("PASS_QUICK", "PASS_SCREEN", "PASS_STD", "PASS_PA", "PASS_DEEP"))
+PUNT, FIELD_GOAL = PLAYBOOK.off["PUNT"], PLAYBOOK.off["FIELD_GOAL"]
+COVER_2, COVER_3, MAN_1, BLITZ_ZONE, BLITZ_HEAVY, GOAL_LINE = (
+    PLAYBOOK.defense[k] for k in ("COVER_2", "COVER_3", "MAN_1", "BLITZ_ZONE", "BLITZ_HEAVY", "GOAL_LINE"))
+RETURN, BLOCK = PLAYBOOK.defense["RETURN"], PLAYBOOK.defense["BLOCK"]
+
+PASS_CALLS_AGGRESSIVE = (PASS_DEEP, PASS_PA, PASS_STD)
+PASS_CALLS_SAFE = (PASS_QUICK, PASS_SCREEN, PASS_STD)
+RUN_CALLS_AGGRESSIVE = (RUN_DRAW, RUN_ZONE, RUN_POWER)
+RUN_CALLS_SAFE = (RUN_POWER, RUN_ZONE, RUN_POWER) # Weighted towards POWER
+PASS_DEFENSES = (COVER_2, COVER_3, BLITZ_ZONE, MAN_1)
+RUN_DEFENSES = (BLITZ_HEAVY, MAN_1, BLITZ_ZONE, GOAL_LINE)
 
 # --- INJURY DATA ---
 INJURIES_MINOR = [("Bruised Ribs", 1, 1), ("Hip Pointer", 1, 2), ("Stinger", 1, 1), ("Sprained Wrist", 1, 2), ("Bruised Knee", 1, 2), ("Turf Toe", 1, 3), ("Lower Back Strain", 1, 2)]
@@ -15,28 +74,73 @@ INJURIES_MODERATE = [("Sprained Ankle", 2, 3), ("Hamstring Strain", 2, 4), ("Gro
 INJURIES_SERIOUS = [("High Ankle Sprain", 5, 8), ("MCL Sprain", 5, 8), ("Meniscus Tear", 4, 9), ("Broken Hand", 5, 8), ("Sports Hernia", 6, 9), ("Broken Collarbone", 7, 10), ("Broken Ribs", 4, 7)]
 INJURIES_SEVERE = [("Broken Arm", 9, 14), ("Broken Leg", 12, 18), ("Torn Pectoral", 11, 16), ("Torn Triceps", 11, 16), ("Lisfranc Injury", 10, 16), ("Torn ACL", 14, 20), ("Achilles Tear", 14, 20), ("Patellar Tendon Tear", 14, 20), ("Vertebrae Fracture", 15, 25)]
 
+def roll_injury(rng, card):
+    """Severity and injury for a player who got hurt. Returns (player, injury_name, severity)."""
+    player = card.player
+    dur = card.dur
+    severity_penalty = (100 - dur)
+    severity_roll = rng.randint(0, 100) + severity_penalty
+    
+    if severity_roll > 120: pool, lbl = INJURIES_SEVERE, "SEVERE"
+    elif severity_roll > 90: pool, lbl = INJURIES_SERIOUS, "SERIOUS"
+    elif severity_roll > 55: pool, lbl = INJURIES_MODERATE, "MODERATE"
+    else: pool, lbl = INJURIES_MINOR, "MINOR"
+    
+    # TRAIT: Iron Man (Downgrades Minor/Moderate to Nothing)
+    if card.trait_flags & IRON_MAN and lbl in ["MINOR", "MODERATE"]:
+        card.owner.refresh(card)
+        return (player, None, lbl)
+
+    inj_name, min_w, max_w = rng.choice(pool)
+    player.weeks_injured = rng.randint(min_w, max_w)
+    player.injury_type = inj_name
+    card.owner.refresh(card)
+    return (player, inj_name, lbl)
+
 class GameSim:
-    def __init__(self, game, console=None):
+    def __init__(self, game, console=None, headless=False, tuning=None):
         self.game = game
+        # Engine constants (engine_tuning.py); the tuning lab passes its own sets
+        self.tuning = tuning or TUNING
+        # Every roll in the game comes from this stream. Scheduled games carry a seed
+        # derived from the universe seed (scheduler.seed_game); anything else gets one
+        # drawn here. Either way it is recorded so the game can be replayed exactly.
+        if getattr(game, 'seed', None) is None: game.seed = random.getrandbits(64)
+        self.rng = GameRandom(game.seed)
         # Use provided console or create a new one to ensure Rich works everywhere
         self.console = console if console else Console()
+        # Headless: calibration/bulk runs skip the play log entirely. Season games keep
+        # it (compact records, no text) so they can be replayed; exported and watched
+        # games always do.
+        self.headless = headless and not game.export_log and not getattr(game, 'slow_mode', False)
+        self.view = LiveView(self, self.console, delay=getattr(game, 'watch_delay', WATCH_DELAY)) if getattr(game, 'slow_mode', False) else None
         
         self.home = game.home_team
         self.away = game.away_team
         self.offense = self.away 
         self.defense = self.home
+        # Frozen ratings/trait flags for both teams, built once at kickoff
+        # Stats are counted per game and merged into season totals at the final whistle
+        self.box = BoxScore()
+        self.snapshots = {self.home: TeamSnapshot(self.home, self.box), self.away: TeamSnapshot(self.away, self.box)}
+        self.policies = {self.home: policy_for(self.home.coach), self.away: policy_for(self.away.coach)}
         self.quarter = 1
         self.time_remaining = 900 
         self.down = 1
         self.distance = 10
         self.ball_on = 25 
-        self.log = []
+        self.log = PlayLog(self.home, self.away)
+        self.last_play = None  # PlayResult of the last snap, rendered only in watch mode
+        self.drive = None      # DriveResult of the possession in progress
+        self.drives = []
+        self.play_count = 0
         self.is_overtime = False
         self.ot_period = 0  # Track OT period for new rules
         self.stats = {
             self.home: {"score": 0, "yards": 0, "pass": 0, "rush": 0, "to": 0},
             self.away: {"score": 0, "yards": 0, "pass": 0, "rush": 0, "to": 0}
         }
+        if PROFILER.active: PROFILER.attach(self)
 
     def get_clock_str(self):
         if self.is_overtime: return f"[yellow]OT{self.ot_period}[/yellow]" if self.ot_period > 0 else "[yellow]OT[/yellow]"
@@ -71,7 +175,7 @@ class GameSim:
         hurry_threshold = 300
         chew_threshold = 240
         
-        if "Clock Manager" in coach.traits:
+        if coach.trait_flags & CLOCK_MANAGER:
             hurry_threshold = 420 
             chew_threshold = 360  
         
@@ -82,261 +186,149 @@ class GameSim:
         if score_diff > 0 and self.time_remaining < chew_threshold: return "CHEW"
         return "NORMAL"
 
+    def score(self):
+        return self.stats[self.home]["score"], self.stats[self.away]["score"]
+
+    # --- POSSESSIONS ---
+    def start_drive(self):
+        if self.is_overtime: self.drive = DriveResult(self.offense, 0, self.ot_period, self.ball_on)
+        else: self.drive = DriveResult(self.offense, self.quarter, self.time_remaining, self.ball_on)
+
+    def track_drive(self, res):
+        """Adds a snap to the drive in progress; closes it when the possession (or 2-pt try) is over."""
+        drive = self.drive
+        drive.plays += 1
+        drive.time_used += res.time_used
+        if PLAYBOOK.is_run[res.play] or PLAYBOOK.is_pass[res.play]: drive.yards += res.yards
+        if res.possession_change or res.conversion is not None:
+            drive.result = result_of(res)
+            drive.points = res.points
+            if res.touchdown and res.conversion is None: drive.yards = 100 - drive.start  # gains are reported past the goal line
+            if res.play in (PUNT, FIELD_GOAL): drive.distance = res.yards
+            self.end_drive()
+
+    def end_drive(self, result=None):
+        if result is not None: self.drive.result = result
+        self.drives.append(self.drive)
+        self.drive = None
+
     def draw_live_ui(self, last_play_desc):
-        self.console.clear()
-        
-        h_score = self.stats[self.home]["score"]
-        a_score = self.stats[self.away]["score"]
-        
-        # Color the leading score
-        h_style = "bold green" if h_score > a_score else ("bold red" if h_score < a_score else "bold white")
-        a_style = "bold green" if a_score > h_score else ("bold red" if a_score < h_score else "bold white")
-        
-        # Possession indicators
-        p_h = "[yellow]◄ BALL[/yellow]" if self.offense == self.home else "      "
-        p_a = "[yellow]BALL ►[/yellow]" if self.offense == self.away else "      "
-        
-        # --- SCOREBOARD ---
-        grid = Table.grid(expand=True)
-        grid.add_column(justify="left", ratio=1)
-        grid.add_column(justify="center", ratio=1)
-        grid.add_column(justify="right", ratio=1)
-        
-        grid.add_row(
-            f"[bold]{self.away.name.upper()}[/bold] ({self.away.record_str()})",
-            "vs",
-            f"[bold]{self.home.name.upper()}[/bold] ({self.home.record_str()})"
-        )
-        grid.add_row(
-            f"{p_a} [{a_style}]{a_score}[/{a_style}]",
-            "",
-            f"[{h_style}]{h_score}[/{h_style}] {p_h}"
-        )
-        
-        scoreboard = Panel(grid, style="cyan", box=box.ROUNDED)
-        self.console.print(scoreboard)
-        
-        # --- GAME STATUS ---
-        q_str = f"[yellow]OT{self.ot_period}[/yellow]" if self.is_overtime else f"Q{self.quarter}"
-        clock = self.get_clock_str()
-        mode = self.check_time_management()
-        mode_str = f"[red]HURRY[/red]" if mode == "HURRY" else (f"[green]CHEW[/green]" if mode == "CHEW" else "NORMAL")
-        
-        status_table = Table(box=box.SIMPLE, show_header=False, expand=True)
-        status_table.add_column("Clock", justify="left")
-        status_table.add_column("Down", justify="center")
-        status_table.add_column("Mode", justify="right")
-        
-        status_table.add_row(
-            f"{q_str} | {clock}",
-            f"{self.down} & {int(self.distance)} | {self.get_field_pos_str()}",
-            f"Mode: {mode_str}"
-        )
-        self.console.print(status_table)
-
-        # --- FIELD VISUALIZATION ---
-        field_chars = [f"[green].[/green]"] * 100
-        for i in range(10, 100, 10): field_chars[i] = f"[white]|[/white]"
-        
-        # Target Line
-        target_idx = int(self.ball_on + self.distance)
-        if 0 <= target_idx < 100: field_chars[target_idx] = f"[yellow]I[/yellow]"
-        
-        # Ball Position
-        b_idx = max(0, min(99, int(self.ball_on)))
-        field_chars[b_idx] = f"[bold yellow]O[/bold yellow]"
-        
-        field_str = "".join(field_chars)
-        self.console.print(Panel(Align.center(f"[red]END[/red] {field_str} [red]END[/red]"), box=box.HEAVY))
-        
-        # --- LAST PLAY ---
-        self.console.print(Panel(f"[bold]{last_play_desc}[/bold]", title="LAST PLAY", border_style="cyan"))
+        """Watch mode: shows the current state and waits (Enter or the auto-advance delay)."""
+        self.view.show(last_play_desc)
 
     def get_active_player(self, team, position, count=1):
-        candidates = team.depth_chart.get(position, [])
-        active = []
-        for p in candidates:
-            # TRAIT: Iron Man (Ignores fatigue minimums slightly)
-            threshold = 15 if "Iron Man" in p.traits else 25
-            
-            # TRAIT: Soft (Refuses to play if hurt at all)
-            if "Soft" in p.traits and p.weeks_injured > 0: continue
-            
-            if p.weeks_injured == 0 and p.stamina > threshold:
-                active.append(p)
-            if len(active) == count: break
-        
-        if len(active) < count:
-            for p in candidates:
-                if p not in active and p.weeks_injured == 0:
-                    active.append(p)
-                    if len(active) == count: break
-        
-        if not active: active = [candidates[0]] if candidates else []
-        if count == 1: return active[0] if active else None
-        return active
+        unit = self.snapshots[team].unit(position, count)
+        if count == 1: return unit[0].player if unit else None
+        return [c.player for c in unit]
 
-    def process_fatigue_and_injury(self, player, fatigue_amount, risk_multiplier=1.0):
-        if not player: return None
+    def get_active_cards(self, team, position, count=1):
+        """Like get_active_player, but returns the kickoff PlayerCards used by the play engine."""
+        unit = self.snapshots[team].unit(position, count)
+        if count == 1: return unit[0] if unit else None
+        return unit
+
+    def process_fatigue_and_injury(self, card, fatigue_amount, risk_multiplier=1.0):
+        if not card: return None
+        player = card.player
         
         # TRAIT: Trench Dog (Less stamina loss)
-        if "Trench Dog" in player.traits: fatigue_amount = int(fatigue_amount * 0.5)
+        if card.trait_flags & TRENCH_DOG: fatigue_amount = int(fatigue_amount * 0.5)
         
-        player.stamina = max(0, player.stamina - fatigue_amount)
-        dur = player.attributes.get("DUR", 75)
+        player.stamina = max(0, card.owner.stamina(card) - fatigue_amount)
+        dur = card.dur
         base_chance = 0.5 + (100 - dur) * 0.02
         if player.stamina < 30: base_chance += 2.0
         
         # TRAIT: Glass Cannon (Higher risk)
-        if "Glass Cannon" in player.traits: risk_multiplier *= 3.0
+        if card.trait_flags & GLASS_CANNON: risk_multiplier *= 3.0
         
         final_chance = base_chance * risk_multiplier
-        if random.uniform(0, 100) < final_chance:
-            severity_penalty = (100 - dur)
-            severity_roll = random.randint(0, 100) + severity_penalty
-            
-            if severity_roll > 120: pool, lbl = INJURIES_SEVERE, "SEVERE"
-            elif severity_roll > 90: pool, lbl = INJURIES_SERIOUS, "SERIOUS"
-            elif severity_roll > 55: pool, lbl = INJURIES_MODERATE, "MODERATE"
-            else: pool, lbl = INJURIES_MINOR, "MINOR"
-            
-            # TRAIT: Iron Man (Downgrades Minor/Moderate to Nothing)
-            if "Iron Man" in player.traits and lbl in ["MINOR", "MODERATE"]:
-                return f"[yellow]{player.last_name} shakes off a hit.[/yellow]"
-
-            inj_name, min_w, max_w = random.choice(pool)
-            player.weeks_injured = random.randint(min_w, max_w)
-            player.injury_type = inj_name
-            return f"[bold red]{player.last_name} INJURED ({inj_name} - {lbl})[/bold red]"
+        if self.rng.uniform(0, 100) < final_chance:
+            return roll_injury(self.rng, card)
+        card.owner.refresh(card)
         return None
 
     def recover_stamina_step(self):
-        teams = [self.home, self.away]
-        for team in teams:
-            for p in team.roster:
-                if p.weeks_injured == 0 and p.stamina < 100:
-                    p.stamina = min(100, p.stamina + 4)
+        # Recovery is applied lazily by the snapshots (see team_snapshot.py)
+        for snap in self.snapshots.values(): snap.advance()
 
     def call_plays(self, mode):
-        coach = self.offense.coach
-        qb = self.get_active_player(self.offense, "QB")
+        qb = self.get_active_cards(self.offense, "QB")
         
         # 3rd OT+ Rules: Shootout from 3-yard line. No kicking allowed.
         if self.is_overtime and self.ot_period >= 3:
-            return ("RUN_POWER", "GOAL_LINE") if random.random() < 0.5 else ("PASS_QUICK", "MAN_1")
+            return (RUN_POWER, GOAL_LINE) if self.rng.random() < 0.5 else (PASS_QUICK, MAN_1)
 
-        if self.ball_on < 3: return "RUN_POWER", "GOAL_LINE"
+        if self.ball_on < 3: return RUN_POWER, GOAL_LINE
         
+        policy = self.policies[self.offense]
+        score_diff = self.stats[self.offense]["score"] - self.stats[self.defense]["score"]
+
         if self.down == 4:
-            field_goal_range = 65 
-            agg_score = coach.fourth_down_agg
-            if self.quarter == 4 and self.stats[self.offense]["score"] < self.stats[self.defense]["score"]:
-                if self.time_remaining < 180: agg_score += 50 
-
-            # TRAIT: Gut Feeling (High Variance decision)
-            if "Gut Feeling" in coach.traits and random.random() < 0.2:
-                agg_score += random.randint(-20, 40)
-
-            # TRAIT: Fourth Down Fire (Boost to aggressiveness)
-            if "Fourth Down Fire" in coach.traits:
-                agg_score += 15
-
-            if self.ball_on >= field_goal_range:
-                if self.ball_on > 40 and agg_score > 15: 
-                     if self.distance <= 2: return "RUN_POWER", "GOAL_LINE"
-                     return "PASS_QUICK", "MAN_1"
-                return "FIELD_GOAL", "BLOCK"
-            else:
-                if agg_score > 25: return "PASS_DEEP", "BLITZ_HEAVY"
-                return "PUNT", "RETURN"
+            late_and_trailing = self.quarter == 4 and score_diff < 0 and self.time_remaining < 180
+            return policy.fourth_down(fourth_down_index(self.distance, self.ball_on, late_and_trailing), self.rng)
 
         # --- ADJUSTED PLAYCALLING BIAS ---
-        pass_prob = (coach.run_pass_bias * 0.08) 
-        
-        # Contextual Modifiers
-        if self.distance > 8: pass_prob += 0.25 # Need yards, pass more
-        if self.distance < 4: pass_prob -= 0.15 # Short yardage, run more
-        
-        if mode == "HURRY": pass_prob += 0.35
-        if mode == "CHEW": pass_prob -= 0.40
-        
-        # Coach Trait adjustments
-        if qb and "Gunslinger" in qb.traits: pass_prob += 0.15
-        if qb and "Game Manager" in qb.traits: pass_prob -= 0.10
-        
-        # Clamp probability
-        pass_prob = max(0.10, min(0.90, pass_prob))
-
-        is_pass = random.random() < pass_prob
-        
-        # TRAIT: Hero Ball (Ignores safe calls when losing)
-        score_diff = self.stats[self.offense]["score"] - self.stats[self.defense]["score"]
-        if qb and "Hero Ball" in qb.traits and score_diff < -3 and self.quarter == 4:
-            is_pass = True 
+        qb_flags = qb.trait_flags if qb else 0
+        pass_prob = policy.pass_prob[pass_index(self.distance, mode, qb_flags, score_diff < -3 and self.quarter == 4)]
+        is_pass = self.rng.random() < pass_prob
 
         if is_pass:
-            roll = random.randint(0, 10)
-            if roll < coach.aggressiveness:
-                choices = ["PASS_DEEP", "PASS_PA", "PASS_STD"]
-            else:
-                choices = ["PASS_QUICK", "PASS_SCREEN", "PASS_STD"]
+            roll = self.rng.randint(0, 10)
+            choices = PASS_CALLS_AGGRESSIVE if roll < policy.aggressiveness else PASS_CALLS_SAFE
             
-            if qb and "Gunslinger" in qb.traits and random.random() < 0.4: off_play_key = "PASS_DEEP"
-            elif qb and "Game Manager" in qb.traits and random.random() < 0.4: off_play_key = "PASS_QUICK"
-            else: off_play_key = random.choice(choices)
+            if qb and qb.trait_flags & GUNSLINGER and self.rng.random() < 0.4: off_code = PASS_DEEP
+            elif qb and qb.trait_flags & GAME_MANAGER and self.rng.random() < 0.4: off_code = PASS_QUICK
+            else: off_code = self.rng.choice(choices)
             
-            def_play_key = random.choice(["COVER_2", "COVER_3", "BLITZ_ZONE", "MAN_1"])
+            def_code = self.rng.choice(PASS_DEFENSES)
         else:
-            roll = random.randint(0, 10)
-            if roll < coach.aggressiveness: choices = ["RUN_DRAW", "RUN_ZONE", "RUN_POWER"]
-            else: choices = ["RUN_POWER", "RUN_ZONE", "RUN_POWER"] # Weighted towards POWER
-            off_play_key = random.choice(choices)
-            def_play_key = random.choice(["BLITZ_HEAVY", "MAN_1", "BLITZ_ZONE", "GOAL_LINE"])
+            roll = self.rng.randint(0, 10)
+            choices = RUN_CALLS_AGGRESSIVE if roll < policy.aggressiveness else RUN_CALLS_SAFE
+            off_code = self.rng.choice(choices)
+            def_code = self.rng.choice(RUN_DEFENSES)
 
-        return off_play_key, def_play_key
+        return off_code, def_code
 
-    def get_defender_matchup(self, target_pos, def_key):
-        is_zone = "COVER" in def_key or "ZONE" in def_key
+    def get_defender_matchup(self, target_pos, def_code):
+        is_zone = PLAYBOOK.is_zone[def_code]
         def_pos_key = "DB"
         if target_pos == "WR": def_pos_key = "DB"
-        elif target_pos == "TE": def_pos_key = "LB" if random.random() < 0.7 else "DB"
+        elif target_pos == "TE": def_pos_key = "LB" if self.rng.random() < 0.7 else "DB"
         elif target_pos == "RB": def_pos_key = "LB"
 
-        unit = self.get_active_player(self.defense, def_pos_key, count=3)
-        if not isinstance(unit, list): unit = [unit]
-        return random.choice(unit), is_zone
+        unit = self.get_active_cards(self.defense, def_pos_key, count=3)
+        return self.rng.choice(unit), is_zone
 
-    def resolve_pass_target(self, off_key, def_key, qb):
-        play_data = OFF_PLAYS[off_key]
-        routes = play_data.get("routes", {"WR": ("Route", 10)})
+    def resolve_pass_target(self, off_code, def_code, qb):
+        route_priority = PLAYBOOK.route_priority[off_code]    # per receiver slot: WR1, WR2, TE, RB
+        t = self.tuning
         candidates = []
         eligible = []
         
-        wrs = self.get_active_player(self.offense, "WR", count=2)
-        tes = self.get_active_player(self.offense, "TE", count=1)
-        rbs = self.get_active_player(self.offense, "RB", count=1)
-        if wrs: eligible.extend([("WR", p) for p in (wrs if isinstance(wrs, list) else [wrs])])
-        if tes: eligible.extend([("TE", p) for p in (tes if isinstance(tes, list) else [tes])])
-        if rbs: eligible.extend([("RB", p) for p in (rbs if isinstance(rbs, list) else [rbs])])
-
-        for pos_name, player in eligible:
-            if pos_name not in routes: continue
-            route_type, priority = routes[pos_name]
-            if route_type == "Block": continue 
-            defender, is_zone = self.get_defender_matchup(pos_name, def_key)
+        wrs = self.get_active_cards(self.offense, "WR", count=2)
+        te = self.get_active_cards(self.offense, "TE", count=1)
+        rb = self.get_active_cards(self.offense, "RB", count=1)
+        eligible.extend([(i, "WR", c) for i, c in enumerate(wrs)])
+        if te: eligible.append((2, "TE", te))
+        if rb: eligible.append((3, "RB", rb))
+
+        for slot, pos_name, player in eligible:
+            priority = route_priority[slot]
+            if priority is None: continue   # blocking or not in the pattern
+            defender, is_zone = self.get_defender_matchup(pos_name, def_code)
             
-            off_skill = (player.attributes["SPD"] * 0.45) + (player.attributes["AGI"] * 0.55)
-            def_skill = (defender.attributes["SPD"] * 0.50) + (defender.attributes["INT"] * 0.50)
+            # Route Technician bonus is already part of the card's separation rating
+            off_skill = player.separation
+            def_skill = defender.coverage
             
-            # TRAIT: Route Technician (Separation bonus)
-            if "Route Technician" in player.traits: off_skill += 10
             # TRAIT: Satellite (RB acting like WR)
-            if "Satellite" in player.traits and pos_name == "RB": off_skill += 15
+            if pos_name == "RB" and player.trait_flags & SATELLITE: off_skill += 15
             
-            if is_zone: def_skill = (def_skill + 85) / 2
+            if is_zone: def_skill = (def_skill + t.zone_coverage) / 2
             
             # Variance added to separation
-            raw_sep = off_skill - def_skill + random.randint(-15, 15)
+            raw_sep = off_skill - def_skill + self.rng.randint(-t.sep_variance, t.sep_variance)
             t_score = raw_sep + (priority * 3)
             candidates.append({"player": player, "defender": defender, "separation": raw_sep, "score": t_score})
 
@@ -345,23 +337,24 @@ class GameSim:
 
         top_options = candidates[:3]
         weights = [max(1, c["score"] + 20) for c in top_options]
-        best_opt = random.choices(top_options, weights=weights, k=1)[0]
+        best_opt = self.rng.choices(top_options, weights=weights, k=1)[0]
         
-        vision_roll = random.randint(0, 100) + (qb.attributes["INT"] * 0.3)
+        vision_roll = self.rng.randint(0, 100) + (qb.int * 0.3)
         if vision_roll > 50: 
             if best_opt["separation"] < -2:
                 for alt in candidates:
                     if alt == best_opt: continue
                     # TRAIT: Game Manager (Always finds open man even if low priority)
-                    thresh = 1 if "Game Manager" in qb.traits else 5
+                    thresh = 1 if qb.trait_flags & GAME_MANAGER else 5
                     if alt["separation"] > (best_opt["separation"] + thresh):
                         best_opt = alt
                         break
         target = best_opt
         return target["player"], target["defender"], target["separation"]
 
-    def resolve_play(self, off_key, def_key, mode):
+    def resolve_play(self, off_code, def_code, mode):
         self.recover_stamina_step()
+        t = self.tuning
         
         # --- Coach & Scheme Logic ---
         coach_off = self.offense.coach
@@ -373,11 +366,11 @@ class GameSim:
         
         # Scheme Playcall Synergy Bonus
         scheme_bonus = 0
-        if is_air_raid and "PASS" in off_key: scheme_bonus = 5
-        if is_smashmouth and "RUN" in off_key: scheme_bonus = 5
+        if is_air_raid and PLAYBOOK.is_pass[off_code]: scheme_bonus = 5
+        if is_smashmouth and PLAYBOOK.is_run[off_code]: scheme_bonus = 5
 
-        qb = self.get_active_player(self.offense, "QB")
-        rb = self.get_active_player(self.offense, "RB")
+        qb = self.get_active_cards(self.offense, "QB")
+        rb = self.get_active_cards(self.offense, "RB")
         
         in_red_zone = self.ball_on > 80
         injuries_this_play = []
@@ -392,351 +385,362 @@ class GameSim:
             off_score = self.stats[self.offense]["score"]
             def_score = self.stats[self.defense]["score"]
             if off_score < def_score:
-                halftime_boost += coach_off.get_game_bonus("halftime", score_diff=off_score-def_score)
+                halftime_boost += coach_off.get_game_bonus("halftime", rng=self.rng, score_diff=off_score-def_score)
 
         # --- SPECIAL TEAMS ---
-        if off_key == "PUNT":
+        if off_code == PUNT:
             # Check for Blocked Punt (Rare: 1%)
-            if random.random() < 0.01:
+            if self.rng.random() < 0.01:
                 self.switch_possession(turnover=True)
-                return "[bold red]PUNT BLOCKED![/bold red] Recovered by defense.", 0, 10
+                res = PlayResult(off_code, pr.PUNT_BLOCKED, time_used=10)
+                res.possession_change = True
+                return res
 
-            puntr = self.get_active_player(self.offense, "P")
-            dist = 35 + random.randint(0, 20)
-            if "Big Leg" in puntr.traits: dist += 5
+            puntr = self.get_active_cards(self.offense, "P")
+            dist = 35 + self.rng.randint(0, 20)
+            if puntr.trait_flags & BIG_LEG: dist += 5
             
-            puntr.stats["punts"] += 1; puntr.stats["punt_yds"] += dist
+            puntr.line[PUNTS] += 1; puntr.line[PUNT_YDS] += dist
             self.switch_possession()
             self.ball_on = 100 - (self.ball_on + dist)
             if self.ball_on < 0: self.ball_on = 20
-            return f"Punt for {dist} yds.", 0, 15
+            res = PlayResult(off_code, pr.PUNT, yards=dist, time_used=15, player=puntr.player)
+            res.possession_change = True
+            return res
             
-        if off_key == "FIELD_GOAL":
+        if off_code == FIELD_GOAL:
             # Check for Blocked FG (Rare: 1.5%)
-            if random.random() < 0.015:
+            if self.rng.random() < 0.015:
                 self.switch_possession(turnover=True)
-                return "[bold red]KICK BLOCKED![/bold red] Defense recovers!", 0, 10
+                res = PlayResult(off_code, pr.FG_BLOCKED, time_used=10)
+                res.possession_change = True
+                return res
 
-            kicker = self.get_active_player(self.offense, "K")
-            kicker.stats["fg_att"] += 1
+            kicker = self.get_active_cards(self.offense, "K")
+            kicker.line[FG_ATT] += 1
             dist = 100 - self.ball_on + 17
             
             # TRAIT: Ice Veins (Clutch Kicking)
-            acc_bonus = 10 if ("Ice Veins" in kicker.traits and is_clutch_time) else 0
-            if "Choker" in kicker.traits and is_clutch_time: acc_bonus -= 20
+            acc_bonus = 10 if (kicker.trait_flags & ICE_VEINS and is_clutch_time) else 0
+            if kicker.trait_flags & CHOKER and is_clutch_time: acc_bonus -= 20
             
             if dist <= 25: acc = 100
             else: acc = 100 - (dist - 25) * 1.0 + acc_bonus
             
-            if random.randint(1, 100) < acc:
-                kicker.stats["fg_made"] += 1
+            if self.rng.randint(1, 100) < acc:
+                kicker.line[FG_MADE] += 1
                 self.stats[self.offense]["score"] += 3
                 self.switch_possession(kickoff=not self.is_overtime, ot_reset=self.is_overtime)
-                return f"{int(dist)} yd FG [bold green]GOOD[/bold green].", 3, 5
+                res = PlayResult(off_code, pr.FG_GOOD, yards=int(dist), time_used=5, player=kicker.player)
+                res.points = 3
             else:
                 self.switch_possession(kickoff=False, ot_reset=self.is_overtime, turnover=True)
-                return f"{int(dist)} yd FG [bold red]MISSED[/bold red].", 0, 5
+                res = PlayResult(off_code, pr.FG_MISSED, yards=int(dist), time_used=5, player=kicker.player)
+            res.possession_change = True
+            return res
 
         # --- STANDARD PLAY RESOLUTION ---
-        play_data = OFF_PLAYS[off_key]
-        def_data = DEF_STRATEGIES[def_key]
-        
-        strat_mod = 0
-        desc_add = ""
-        
-        # Strategy Counter Logic
-        if off_key in def_data["bonus_vs"]: 
-            strat_mod = -15
-            desc_add = f" [red](Def Read!)[/red]"
-        elif off_key in def_data["weak_vs"]: 
-            strat_mod = 15
-            desc_add = f" [green](Great Call!)[/green]"
+        # Strategy Counter Logic (precomputed offense x defense matrix)
+        strat_mod = PLAYBOOK.matchup[off_code][def_code]
+        call_note = None
+        if strat_mod < 0: call_note = pr.CALL_READ
+        elif strat_mod > 0: call_note = pr.CALL_GREAT
 
         # TRAIT: The Analyst
-        if "The Analyst" in coach_off.traits:
+        if coach_off.trait_flags & THE_ANALYST:
             if strat_mod < 0: 
                 strat_mod = 0
-                desc_add = f" [yellow](Analyst Save)[/yellow]"
+                call_note = pr.CALL_ANALYST
             elif strat_mod > 0:
                 strat_mod += 5
 
         # TRAIT: 4th Down Fire
         if self.down == 4:
-            strat_mod += coach_off.get_game_bonus("4th_down")
+            strat_mod += coach_off.get_game_bonus("4th_down", rng=self.rng)
 
         strat_mod += halftime_boost
-        result_text = ""; yards = 0; time_used = play_data["time"]
+        yards = 0; time_used = PLAYBOOK.time[off_code]
+        target = None
 
         # >>> RUN PLAY LOGIC <<<
-        if play_data["type"] == "RUN":
-            rb.stats["rush_att"] += 1
+        if PLAYBOOK.is_run[off_code]:
+            rb.line[RUSH_ATT] += 1
             inj = self.process_fatigue_and_injury(rb, 12, risk_multiplier=1.0)
             if inj: injuries_this_play.append(inj)
             
-            dl_core = self.get_active_player(self.defense, "DL", count=3)
-            ol_core = self.get_active_player(self.offense, "OL", count=5)
-            if not isinstance(dl_core, list): dl_core = [dl_core]
-            if not isinstance(ol_core, list): ol_core = [ol_core]
+            dl_core = self.get_active_cards(self.defense, "DL", count=3)
+            ol_core = self.get_active_cards(self.offense, "OL", count=5)
 
-            dl_avg = sum(p.attributes["STR"] + p.attributes["TKL"] for p in dl_core) / (len(dl_core)*2)
-            ol_avg = sum(p.attributes["STR"] + p.attributes["BLK"] for p in ol_core) / (len(ol_core)*2)
+            dl_avg = self.snapshots[self.defense].unit_sum("DL", 3, "run_stop") / (len(dl_core)*2)
+            ol_avg = self.snapshots[self.offense].unit_sum("OL", 5, "run_block") / (len(ol_core)*2)
             
             # -- SCHEME IMPACT --
             if is_smashmouth: ol_avg += 3 
             if is_air_raid: ol_avg -= 2   
-            if "Field General" in qb.traits: ol_avg += 5
+            if qb.trait_flags & FIELD_GENERAL: ol_avg += 5
             
             # TRENCH CALCULATION (Increased Variance)
-            trench_win = (ol_avg - dl_avg) + (random.randint(-20, 20)) + (strat_mod * 0.5) + (scheme_bonus * 0.5)
+            trench_win = (ol_avg - dl_avg) + (self.rng.randint(-t.trench_variance, t.trench_variance)) + (strat_mod * 0.5) + (scheme_bonus * 0.5)
             if in_red_zone: trench_win += 4
             
             # TRAIT: First Step
-            if any("First Step" in p.traits for p in dl_core): trench_win -= 5
+            if self.snapshots[self.defense].unit_flags("DL", 3) & FIRST_STEP: trench_win -= 5
             
             tackler = None
             
             # FUMBLE CHECK (Run)
             # 1.5% chance normally, higher if tired or low STR
-            fumble_chance = 1.5
-            if rb.stamina < 30: fumble_chance += 3
-            if rb.attributes["STR"] < 50: fumble_chance += 1
-            if "Butterfingers" in rb.traits: fumble_chance += 5
+            fumble_chance = t.fumble_base
+            if rb.owner.stamina(rb) < 30: fumble_chance += 3
+            if rb.str < 50: fumble_chance += 1
+            if rb.trait_flags & BUTTERFINGERS: fumble_chance += 5
             
-            if random.uniform(0, 100) < fumble_chance:
+            if self.rng.uniform(0, 100) < fumble_chance:
                 self.switch_possession(turnover=True)
                 self.stats[self.defense]["to"] += 1
-                return f"[bold red]FUMBLE![/bold red] {rb.last_name} loses the ball! Recovered by defense.", 0, 10
+                res = PlayResult(off_code, pr.FUMBLE, time_used=10, player=rb.player)
+                res.possession_change = True
+                return res
+
+            res = PlayResult(off_code, pr.RUN, player=rb.player)
 
             # Run Outcome Resolution
-            if trench_win < -15: 
-                yards = random.randint(-4, 0)
-                tackler = random.choice(dl_core)
-                result_text = f"Stuffed by {tackler.last_name}!"
-            elif trench_win < 5:
-                yards = random.randint(1, 5) 
-                lb_core = self.get_active_player(self.defense, "LB", count=3)
-                if not isinstance(lb_core, list): lb_core = [lb_core]
-                tackler = random.choice(lb_core) 
-                result_text = "Run up middle."
+            if trench_win < t.stuff_line: 
+                yards = self.rng.randint(-4, 0)
+                tackler = self.rng.choice(dl_core)
+                res.detail = pr.RUN_STUFFED
+            elif trench_win < t.gain_line:
+                yards = self.rng.randint(1, 5) 
+                lb_core = self.get_active_cards(self.defense, "LB", count=3)
+                tackler = self.rng.choice(lb_core) 
+                res.detail = pr.RUN_MIDDLE
             else:
                 # Good blocking, now RB vs defenders
-                yards = random.randint(4, 12)
+                yards = self.rng.randint(4, 12)
                 
                 # Breakaway Logic
-                breakaway_chance = 0.03 + (rb.attributes["SPD"] / 2000)
-                if random.random() < breakaway_chance:
-                    bonus_yards = random.randint(20, 60)
+                breakaway_chance = t.breakaway_base + (rb.spd / 2000)
+                if self.rng.random() < breakaway_chance:
+                    bonus_yards = self.rng.randint(20, 60)
                     yards += bonus_yards
-                    result_text = f"[bold yellow]BREAKAWAY![/bold yellow]"
+                    res.detail = pr.RUN_BREAKAWAY
                 else: 
-                    result_text = "Nice run!"
+                    res.detail = pr.RUN_NICE
                 
-                if random.random() < 0.7: 
-                    lb_core = self.get_active_player(self.defense, "LB", count=3)
-                    if not isinstance(lb_core, list): lb_core = [lb_core]
-                    tackler = random.choice(lb_core)
+                if self.rng.random() < 0.7: 
+                    lb_core = self.get_active_cards(self.defense, "LB", count=3)
+                    tackler = self.rng.choice(lb_core)
                 else: 
-                    db_core = self.get_active_player(self.defense, "DB", count=3)
-                    if not isinstance(db_core, list): db_core = [db_core]
-                    tackler = random.choice(db_core)
+                    db_core = self.get_active_cards(self.defense, "DB", count=3)
+                    tackler = self.rng.choice(db_core)
             
             # TRAIT: Ankle Biter / Bruiser interactions
             if tackler:
-                if "Ankle Biter" in tackler.traits and random.random() < 0.3:
-                    yards += 4; result_text += " Missed tackle!"
-                if "Bruiser" in rb.traits and random.random() < 0.3:
-                    yards += 3; result_text += f" {rb.last_name} runs through contact!"
+                if tackler.trait_flags & ANKLE_BITER and self.rng.random() < 0.3:
+                    yards += 4; res.missed_tackle = True
+                if rb.trait_flags & BRUISER and self.rng.random() < 0.3:
+                    yards += 3; res.broke_tackle = True
 
-            rb.stats["rush_yds"] += yards
+            rb.line[RUSH_YDS] += yards
             if tackler: 
-                tackler.stats["tackles"] += 1
+                tackler.line[TACKLES] += 1
                 inj_t = self.process_fatigue_and_injury(tackler, 8, risk_multiplier=1.0)
                 if inj_t: injuries_this_play.append(inj_t)
                 
-            yard_str = f"[green]{yards}[/green]" if yards > 0 else f"[red]{yards}[/red]"
-            result_text += f" {yard_str} yds.{desc_add}"
+            res.tackler = tackler.player if tackler else None
+            res.call_note = call_note
             time_used += 5
 
         # >>> PASS PLAY LOGIC <<<
         else:
-            target, defender, separation = self.resolve_pass_target(off_key, def_key, qb)
+            target, defender, separation = self.resolve_pass_target(off_code, def_code, qb)
             
             if is_air_raid: separation += 2
             
-            dl_core = self.get_active_player(self.defense, "DL", count=3)
-            ol_core = self.get_active_player(self.offense, "OL", count=5)
-            if not isinstance(dl_core, list): dl_core = [dl_core]
-            if not isinstance(ol_core, list): ol_core = [ol_core]
+            dl_core = self.get_active_cards(self.defense, "DL", count=3)
+            ol_core = self.get_active_cards(self.offense, "OL", count=5)
             
-            dl_pres = sum(p.attributes["STR"] for p in dl_core) / len(dl_core)
-            ol_blk = sum(p.attributes["BLK"] for p in ol_core) / len(ol_core)
+            dl_pres = self.snapshots[self.defense].unit_sum("DL", 3, "str") / len(dl_core)
+            ol_blk = self.snapshots[self.offense].unit_sum("OL", 5, "blk") / len(ol_core)
             
             if is_air_raid: ol_blk += 2    
             if is_smashmouth: ol_blk -= 3  
-            if any("Brick Wall" in p.traits for p in ol_core): ol_blk += 8
-            if any("Turnstile" in p.traits for p in ol_core): ol_blk -= 8
+            if self.snapshots[self.offense].unit_flags("OL", 5) & BRICK_WALL: ol_blk += 8
+            if self.snapshots[self.offense].unit_flags("OL", 5) & TURNSTILE: ol_blk -= 8
             
-            pressure_roll = ((dl_pres - ol_blk) / 2) - strat_mod + random.randint(-20, 20)
+            pressure_roll = ((dl_pres - ol_blk) / 2) - strat_mod + self.rng.randint(-t.pressure_variance, t.pressure_variance)
             play_concluded = False
 
             # Pressure Outcomes
-            if (pressure_roll > 20) or (target is None):
-                escape_ability = (qb.attributes["SPD"] * 0.6) + (qb.attributes["AGI"] * 0.4)
+            if (pressure_roll > t.pressure_threshold) or (target is None):
+                escape_ability = qb.escape
                 
-                if "Statue" in qb.traits: escape_ability -= 20
-                if "Escapist" in qb.traits: escape_ability += 15
+                if qb.trait_flags & STATUE: escape_ability -= 20
+                if qb.trait_flags & ESCAPIST: escape_ability += 15
 
-                escape_roll = random.randint(0, 100)
-                if escape_ability > (escape_roll + 30):
-                    scramble_yards = random.randint(1, int(qb.attributes["SPD"] / 6) + 2)
-                    qb.stats["rush_att"] += 1; qb.stats["rush_yds"] += scramble_yards
+                escape_roll = self.rng.randint(0, 100)
+                if escape_ability > (escape_roll + t.scramble_margin):
+                    scramble_yards = self.rng.randint(1, int(qb.spd / 6) + 2)
+                    qb.line[RUSH_ATT] += 1; qb.line[RUSH_YDS] += scramble_yards
                     yards = scramble_yards
-                    result_text = f"Pressure! {qb.last_name} scrambles for [green]{scramble_yards}[/green] yds."
+                    res = PlayResult(off_code, pr.SCRAMBLE, player=qb.player)
                     inj_s = self.process_fatigue_and_injury(qb, 15, risk_multiplier=3.0)
                     if inj_s: injuries_this_play.append(inj_s)
                     time_used = 25; play_concluded = True
                 
                 elif not play_concluded:
                     # SACK logic with Fumble Chance
-                    sacker = random.choice(dl_core)
-                    loss = random.randint(2, 9)
+                    sacker = self.rng.choice(dl_core)
+                    loss = self.rng.randint(2, 9)
                     
                     # FUMBLE CHECK (Sack)
-                    if random.random() < 0.05: # 5% chance on sack
+                    if self.rng.random() < t.sack_fumble: # 5% chance on sack
                         self.switch_possession(turnover=True)
                         self.stats[self.defense]["to"] += 1
-                        qb.stats["sacks_taken"] += 1; sacker.stats["sacks"] += 1
-                        return f"[bold red]STRIP SACK![/bold red] {sacker.last_name} knocks it loose! Defense ball.", 0, 30
-
-                    qb.stats["sacks_taken"] += 1; sacker.stats["sacks"] += 1
-                    yards = -loss; result_text = f"[bold red]SACK![/bold red] {sacker.last_name} drops QB for [red]-{loss}[/red]."; time_used = 45; play_concluded = True
+                        qb.line[SACKS_TAKEN] += 1; sacker.line[SACKS] += 1
+                        res = PlayResult(off_code, pr.STRIP_SACK, time_used=30, player=qb.player)
+                        res.defender = sacker.player
+                        res.possession_change = True
+                        return res
+
+                    qb.line[SACKS_TAKEN] += 1; sacker.line[SACKS] += 1
+                    yards = -loss; time_used = 45; play_concluded = True
+                    res = PlayResult(off_code, pr.SACK, player=qb.player)
+                    res.defender = sacker.player
                     inj_q = self.process_fatigue_and_injury(qb, 20, risk_multiplier=5.0)
                     if inj_q: injuries_this_play.append(inj_q)
             
             # Throwing Outcomes
             if not play_concluded:
-                qb.stats["pass_att"] += 1 
-                base_acc = (qb.attributes["ACC"] * 0.50)
-                base_cth = (target.attributes["CTH"] * 0.50)
-                sep_bonus = separation * 1.5 
+                qb.line[PASS_ATT] += 1 
+                base_acc = (qb.acc * t.acc_weight)
+                base_cth = (target.cth * t.cth_weight)
+                sep_bonus = separation * t.sep_weight 
                 
                 if is_air_raid: base_acc += 5
-                base_acc += coach_off.get_game_bonus("qb_attributes")
-                if "Stone Hands" in target.traits: base_cth -= 15
+                base_acc += coach_off.get_game_bonus("qb_attributes", rng=self.rng)
+                if target.trait_flags & STONE_HANDS: base_cth -= 15
                 
-                catch_chance = max(40, min(99, 60 + base_acc + base_cth + sep_bonus))
+                catch_chance = max(t.catch_min, min(t.catch_max, t.catch_base + base_acc + base_cth + sep_bonus))
                 
-                if "Safety Valve" in target.traits and self.down == 3 and self.distance < 5:
+                if target.trait_flags & SAFETY_VALVE and self.down == 3 and self.distance < 5:
                     catch_chance += 15
 
-                roll = random.randint(1, 100)
+                roll = self.rng.randint(1, 100)
                 
                 # Check for DROP (Even if catch chance passed)
-                drop_chance = 3
-                if "Stone Hands" in target.traits: drop_chance = 10
-                is_drop = False
+                drop_chance = t.drop_chance
+                if target.trait_flags & STONE_HANDS: drop_chance = 10
                 
                 if roll <= catch_chance:
-                    if random.randint(0, 100) < drop_chance:
-                        is_drop = True
+                    if self.rng.randint(0, 100) < drop_chance:
                         play_concluded = True
-                        result_text = f"Incomplete. {target.last_name} [red]DROPPED[/red] the pass!"
+                        res = PlayResult(off_code, pr.DROP, player=qb.player)
                 else:
                     play_concluded = True
-                    result_text = f"Incomplete pass to {target.last_name}."
+                    res = PlayResult(off_code, pr.INCOMPLETE, player=qb.player)
 
                 if play_concluded:
+                    res.target = target.player; res.defender = defender.player
                     self.process_fatigue_and_injury(qb, 5, risk_multiplier=0.1)
                     yards = 0; time_used = 15
             
             # Interception Logic
             if not play_concluded:
-                risky_throw = separation < -5
-                bad_read = random.randint(0, 100) > qb.attributes["INT"]
+                risky_throw = separation < t.risky_separation
+                bad_read = self.rng.randint(0, 100) > qb.int
                 
-                if "Gunslinger" in qb.traits: bad_read = random.randint(0, 100) > (qb.attributes["INT"] - 10)
+                if qb.trait_flags & GUNSLINGER: bad_read = self.rng.randint(0, 100) > (qb.int - 10)
 
-                int_chance = defender.attributes["INT"] * 0.16
-                if "Ball Hawk" in defender.traits: int_chance *= 1.25
-                int_chance_mod = coach_def.get_game_bonus("int_chance_defense")
+                int_chance = defender.int * t.int_rate
+                if defender.trait_flags & BALL_HAWK: int_chance *= 1.25
+                int_chance_mod = coach_def.get_game_bonus("int_chance_defense", rng=self.rng)
                 if int_chance_mod > 0: int_chance = int_chance * (1 + (int_chance_mod/100.0))
 
-                if (risky_throw or bad_read) and random.randint(1, 100) < int_chance:
-                    defender.stats["int_made"] += 1; qb.stats["pass_int"] += 1
+                if (risky_throw or bad_read) and self.rng.randint(1, 100) < int_chance:
+                    defender.line[INT_MADE] += 1; qb.line[PASS_INT] += 1
                     self.switch_possession(turnover=True); self.stats[self.defense]["to"] += 1
-                    return f"[bold red]INTERCEPTED[/bold red] by {defender.last_name}!", 0, 20
+                    res = PlayResult(off_code, pr.INTERCEPTION, time_used=20, player=qb.player)
+                    res.target = target.player; res.defender = defender.player
+                    res.possession_change = True
+                    return res
 
             # Completion & Yards
             if not play_concluded:
-                qb.stats["pass_cmp"] += 1; target.stats["rec_cat"] += 1
-                base_yards = 20 if "DEEP" in off_key else (10 if "STD" in off_key else 4)
+                qb.line[PASS_CMP] += 1; target.line[REC_CAT] += 1
+                base_yards = PLAYBOOK.base_yards[off_code]
                 
                 # Dynamic YAC (Yards After Catch)
                 yac = 0
-                if target.attributes["SPD"] > defender.attributes["SPD"]:
-                    yac = random.randint(1, 8)
-                    if random.random() < 0.1: yac += random.randint(10, 25) # Big play
+                if target.spd > defender.spd:
+                    yac = self.rng.randint(1, t.yac_max)
+                    if self.rng.random() < t.big_play_chance: yac += self.rng.randint(10, 25) # Big play
                 
-                if "Human Joystick" in target.traits: yac += random.randint(2, 10)
+                if target.trait_flags & HUMAN_JOYSTICK: yac += self.rng.randint(2, 10)
                 
-                yards = max(1, base_yards + yac + random.randint(-2, 5))
-                target.stats["rec_yds"] += yards; qb.stats["pass_yds"] += yards
+                yards = max(1, base_yards + yac + self.rng.randint(-2, 5))
+                target.line[REC_YDS] += yards; qb.line[PASS_YDS] += yards
                 
                 self.process_fatigue_and_injury(qb, 5, risk_multiplier=0.1)
                 inj_t = self.process_fatigue_and_injury(target, 10, risk_multiplier=1.0)
                 if inj_t: injuries_this_play.append(inj_t)
                 
                 # Tackle logic
-                if random.random() < 0.3:
-                    lb_core = self.get_active_player(self.defense, "LB", count=3)
-                    if not isinstance(lb_core, list): lb_core = [lb_core]
-                    tackler = random.choice(lb_core); tackler.stats["tackles"] += 1
+                if self.rng.random() < 0.3:
+                    lb_core = self.get_active_cards(self.defense, "LB", count=3)
+                    tackler = self.rng.choice(lb_core); tackler.line[TACKLES] += 1
                 else: 
-                    defender.stats["tackles"] += 1
+                    defender.line[TACKLES] += 1
                     tackler = defender
                 
                 if tackler:
                     inj_def = self.process_fatigue_and_injury(tackler, 8, risk_multiplier=1.0)
                     if inj_def: injuries_this_play.append(inj_def)
 
-                yard_str = f"[green]{yards}[/green]"
-                result_text = f"Pass to {target.last_name} for {yard_str} yds."; time_used += 5 
+                res = PlayResult(off_code, pr.COMPLETE, player=qb.player)
+                res.target = target.player; res.defender = defender.player; res.tackler = tackler.player
+                time_used += 5 
 
-        if injuries_this_play: result_text += " " + " ".join(injuries_this_play)
+        res.injuries = injuries_this_play
 
         time_used += 10 
         
         # TRAIT: Clock Manager
         if mode == "HURRY": 
             time_used = 25
-            if "Clock Manager" in coach_off.traits: time_used = 18 
+            if coach_off.trait_flags & CLOCK_MANAGER: time_used = 18 
         if mode == "CHEW": 
             time_used = 55
-            if "Clock Manager" in coach_off.traits: time_used = 60 
+            if coach_off.trait_flags & CLOCK_MANAGER: time_used = 60 
         
         self.stats[self.offense]["yards"] += yards
+        self.stats[self.offense]["rush" if res.outcome in (pr.RUN, pr.SCRAMBLE) else "pass"] += yards
         self.ball_on += yards
+        res.yards = yards
+        res.time_used = time_used
         
-        score = 0
         if self.ball_on >= 100:
-            result_text += f" [bold green]TOUCHDOWN![/bold green]"; score = 7; self.stats[self.offense]["score"] += 7
-            if play_data["type"] == "RUN": rb.stats["rush_td"] += 1
+            res.touchdown = True; res.points = 7; self.stats[self.offense]["score"] += 7
+            if PLAYBOOK.is_run[off_code]: rb.line[RUSH_TD] += 1
             else: 
-                qb.stats["pass_td"] += 1
-                if "target" in locals() and target: target.stats["rec_td"] += 1
+                qb.line[PASS_TD] += 1
+                if target: target.line[REC_TD] += 1
             self.switch_possession(kickoff=not self.is_overtime, ot_reset=self.is_overtime)
+            res.possession_change = True
         elif self.ball_on <= 0:
-            result_text += f" [bold red]SAFETY![/bold red]"; self.stats[self.defense]["score"] += 2 
+            res.safety = True; self.stats[self.defense]["score"] += 2 
             self.switch_possession(kickoff=True)
+            res.possession_change = True
         else:
             if yards >= self.distance:
-                self.down = 1; self.distance = 10; result_text += f" [cyan]1st Down![/cyan]"
+                self.down = 1; self.distance = 10; res.first_down = True
             else:
                 self.down += 1; self.distance -= yards
                 if self.down > 4:
-                    result_text += f" [magenta]Turnover on Downs![/magenta]"; self.switch_possession(ot_reset=self.is_overtime, turnover=True)
+                    res.turnover_on_downs = True; self.switch_possession(ot_reset=self.is_overtime, turnover=True)
+                    res.possession_change = True
 
-        return result_text, score, time_used
+        return res
     
     
     def play_overtime(self, file_handle):
@@ -747,7 +751,8 @@ class GameSim:
         
         # Loop until scores are NOT tied after equal possessions
         while self.stats[self.home]["score"] == self.stats[self.away]["score"]:
-            self.log.append(f"\n[bold yellow]--- OVERTIME PERIOD {self.ot_period} ---[/bold yellow]")
+            if not self.headless:
+                self.log.header(OT_PERIOD, self.ot_period)
             if file_handle: file_handle.write(f"\n--- OT PERIOD {self.ot_period} ---\n")
             
             teams = [self.away, self.home]
@@ -765,34 +770,37 @@ class GameSim:
                     self.down = 4
                     self.distance = 3
                     
-                    self.log.append(f"\n[bold]{team.name} 2-Point Attempt[/bold] (from 3-yd line)")
+                    if not self.headless:
+                        self.log.header(SHOOTOUT_TEAM, 0, team)
                     if file_handle: file_handle.write(f"\n{team.name} 2-Pt Attempt\n")
                     
                     if getattr(self.game, 'slow_mode', False):
                         self.draw_live_ui(f"2-Pt Shootout - {team.name}")
-                        input()
 
                     # Run one play
-                    off_key, def_key = self.call_plays("NORMAL") # Forces GOAL_LINE
-                    desc, points, _ = self.resolve_play(off_key, def_key, "NORMAL")
+                    self.start_drive()
+                    off_code, def_code = self.call_plays("NORMAL") # Forces GOAL_LINE
+                    result = self.resolve_play(off_code, def_code, "NORMAL")
                     
                     # Manual Score Adjustment for 2-Pt Logic
                     # resolve_play gives 7 for TD. In shootout, it's 2 pts.
-                    if points == 7:
-                        self.stats[self.offense]["score"] -= 5 # 7 - 5 = 2
-                        desc = desc.replace("TOUCHDOWN", "2-PT CONVERSION GOOD")
+                    # (possession has already switched on the TD, so adjust the drive's team)
+                    if result.touchdown:
+                        self.stats[team]["score"] -= 5 # 7 - 5 = 2
+                        result.points = 2
+                        result.conversion = True
                         if file_handle: file_handle.write(f"   RESULT: 2-PT GOOD\n")
                     else:
-                        if "Turnover" in desc or "INTERCEPTED" in desc or "FUMBLE" in desc:
-                             desc = desc + " [red]2-PT FAILED[/red]"
-                        else:
-                             desc = desc + " [red]2-PT FAILED[/red]"
+                        result.conversion = False
                         if file_handle: file_handle.write(f"   RESULT: 2-PT FAILED\n")
 
-                    self.log.append(f"   Result: {desc}")
+                    self.play_count += 1
+                    self.track_drive(result)
+                    self.last_play = result
+                    if not self.headless:
+                        self.log.snap(SHOOTOUT, 0, self.ot_period, team, self.down, self.distance, self.ball_on, "NORMAL", result, self.score())
                     if getattr(self.game, 'slow_mode', False):
-                        self.draw_live_ui(desc)
-                        input()
+                        self.draw_live_ui(result.render())
 
                 else:
                     # Normal Overtime (Periods 1 & 2)
@@ -801,79 +809,112 @@ class GameSim:
                     self.down = 1
                     self.distance = 10
                     
-                    self.log.append(f"\n[bold]{team.name} Possession[/bold] (Start @ Opp 25)")
+                    if not self.headless:
+                        self.log.header(OT_POSSESSION, 0, team)
                     if file_handle: file_handle.write(f"\n{team.name} Possession\n")
                     
                     if getattr(self.game, 'slow_mode', False):
                         self.draw_live_ui(f"Start of OT Period {self.ot_period} - {team.name}")
-                        input()
 
-                    drive_over = False
-                    while not drive_over:
-                        off_key, def_key = self.call_plays("NORMAL")
-                        desc, points, _ = self.resolve_play(off_key, def_key, "NORMAL")
-                        
+                    self.start_drive()
+                    while self.drive is not None:
+                        off_code, def_code = self.call_plays("NORMAL")
+                        result = self.resolve_play(off_code, def_code, "NORMAL")
+                        self.play_count += 1
+
+                        self.last_play = result
                         if getattr(self.game, 'slow_mode', False):
-                            self.draw_live_ui(desc)
-                            input()
+                            self.draw_live_ui(result.render())
 
-                        log_entry = f"   {self.down}&{int(self.distance)}: {desc}"
-                        self.log.append(log_entry)
-                        if file_handle: file_handle.write(log_entry + "\n")
+                        if not self.headless:
+                            self.log.snap(OT_SNAP, 0, self.ot_period, team, self.down, self.distance, self.ball_on, "NORMAL", result, self.score())
+                            if file_handle: file_handle.write(f"   {self.down}&{int(self.distance)}: {result.render()}\n")
                         
-                        # End drive on Score or Turnover
-                        if "TOUCHDOWN" in desc or "FG GOOD" in desc or "INTERCEPTED" in desc or "Turnover" in desc or "FG MISSED" in desc or "SAFETY" in desc or "FUMBLE" in desc or "BLOCKED" in desc:
-                            drive_over = True
+                        # Drive ends on Score, Turnover or any other change of possession
+                        self.track_drive(result)
             
             self.ot_period += 1
 
     def play_game(self):
+        if self.view is None: return self._play_game()
+        # Watch mode: the live screen stays up for the whole game
+        self.view.start()
+        try:
+            self._play_game()
+            self.view.update(f"FINAL: {self.away.name} {self.game.away_score} - {self.home.name} {self.game.home_score}")
+        finally:
+            self.view.stop()
+        return self.game
+
+    def _play_game(self):
         # UI: Simple start message if not in slow mode
         # This was previously a PRINT statement that spammed the log
         # Removed for silent simulation
         pass 
 
+        # Exported logs are built in memory and handed to the season archive at the final
         file_handle = None
         if self.game.export_log:
-            filename = f"Week{self.game.week}_{self.away.name.replace(' ','')}_vs_{self.home.name.replace(' ','')}.txt"
-            try:
-                file_handle = open(filename, "w")
-                header = f"GAME LOG: {self.away.name} vs {self.home.name} | Week {self.game.week}\n"
-                file_handle.write(header + "="*60 + "\n\n")
-            except: pass
+            archive = archive_for(self.game.season)
+            file_handle = io.StringIO()
+            header = f"GAME LOG: {self.away.name} vs {self.home.name} | Week {self.game.week}\n"
+            file_handle.write(header + "="*60 + "\n\n")
 
         while self.quarter <= 4:
             if getattr(self.game, 'slow_mode', False):
-                last_desc = self.log[-1].split("PLAY:")[-1].strip() if self.log else "Game Start"
+                last_desc = self.last_play.render() if self.last_play else "Game Start"
                 self.draw_live_ui(last_desc)
-                input()
 
+            if self.drive is None: self.start_drive()
             mode = self.check_time_management()
-            clock = self.get_clock_str()
-            situation = f"Q{self.quarter} {clock} | {self.offense.name} ball | {self.down} & {int(self.distance)} @ {self.get_field_pos_str()} [{mode}]"
-            off_key, def_key = self.call_plays(mode)
-            desc, _, time_used = self.resolve_play(off_key, def_key, mode)
-            log_str = f"{situation}\n   PLAY: {desc}"
-            self.log.append(log_str)
-            if file_handle: file_handle.write(log_str + "\n\n")
-            self.time_remaining -= time_used
+            offense, down, distance, ball_on, clock = self.offense, self.down, self.distance, self.ball_on, self.time_remaining
+            if file_handle:
+                situation = f"Q{self.quarter} {self.get_clock_str()} | {offense.name} ball | {down} & {int(distance)} @ {self.get_field_pos_str()} [{mode}]"
+            off_code, def_code = self.call_plays(mode)
+            result = self.resolve_play(off_code, def_code, mode)
+            self.play_count += 1
+            self.last_play = result
+            self.track_drive(result)
+            if not self.headless:
+                self.log.snap(SNAP, self.quarter, clock, offense, down, distance, ball_on, mode, result, self.score())
+                if file_handle: file_handle.write(f"{situation}\n   PLAY: {result.render()}\n\n")
+            self.time_remaining -= result.time_used
             if self.time_remaining <= 0:
                 if self.quarter < 4:
                     self.quarter += 1
                     self.time_remaining = 900 
                     if file_handle: file_handle.write(f"\n--- END OF QUARTER {self.quarter-1} ---\n\n")
                 else: break 
+        if self.drive is not None: self.end_drive(D_END_OF_GAME)
 
         if self.stats[self.home]["score"] == self.stats[self.away]["score"]:
             self.play_overtime(file_handle)
 
+        for snap in self.snapshots.values(): snap.settle()
         self.game.home_score = self.stats[self.home]["score"]
         self.game.away_score = self.stats[self.away]["score"]
+        self.box.commit()
+        self.game.box_score = self.box
         self.game.played = True
         self.game.game_log = self.log
+        self.game.drives = self.drives
+        self.game.summary = self.build_summary()
         if file_handle:
             file_handle.write("="*60 + "\n")
             file_handle.write(f"FINAL: {self.away.name} {self.game.away_score} - {self.home.name} {self.game.home_score}\n")
-            file_handle.close()
+            archive.append(game_key(self.game), file_handle.getvalue(), week=self.game.week,
+                           away=self.away.name, home=self.home.name)
             self.game.export_log = False
-        return self.game
\ No newline at end of file
+        return self.game
+
+    def build_summary(self):
+        """Compact per-game summary read by news/analytics instead of the text log."""
+        return {
+            "home": dict(self.stats[self.home]),
+            "away": dict(self.stats[self.away]),
+            "turnovers": self.stats[self.home]["to"] + self.stats[self.away]["to"],
+            "overtime": self.is_overtime,
+            "ot_periods": max(0, self.ot_period - 1),
+            "plays": self.play_count,
+            "drives": len(self.drives),
+        }
\ No newline at end of file
@@ -1,12 +1,28 @@
 import pickle
 import os
+import sys
+from contextlib import contextmanager
 
 SAVE_FILE = "football_league.save"
 
+# Schools and games point at each other (school.schedule -> game -> team -> ...),
+# so pickling a universe nests far deeper than Python's default recursion limit
+PICKLE_RECURSION_LIMIT = 10000
+
+@contextmanager
+def deep_pickling():
+    """Raises the recursion limit enough to pickle a whole universe."""
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, PICKLE_RECURSION_LIMIT))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(limit)
+
 def save_league(league_data):
     """Saves the current state of the league (schools, players, history) to a file."""
     try:
-        with open(SAVE_FILE, "wb") as f:
+        with open(SAVE_FILE, "wb") as f, deep_pickling():
             pickle.dump(league_data, f)
         print(f"\n[System] League successfully saved to {SAVE_FILE}.")
         return True
@@ -14,13 +30,13 @@ def save_league(league_data):
         print(f"[Error] Failed to save league: {e}")
         return False
 
-def load_league():
+def load_league(path=SAVE_FILE):
     """Loads a league from the save file if it exists."""
-    if not os.path.exists(SAVE_FILE):
+    if not os.path.exists(path):
         return None
     
     try:
-        with open(SAVE_FILE, "rb") as f:
+        with open(path, "rb") as f:
             league_data = pickle.load(f)
         print(f"\n[System] League loaded successfully.")
         return league_data
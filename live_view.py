@@ -0,0 +1,136 @@
+# live_view.py
+#
+# Watch-mode screen for GameSim (game.slow_mode). One rich.live.Live display
+# stays up for the whole game; each section (scoreboard, game status, field,
+# last play) is rebuilt only when the values it shows change, and frames are
+# capped at WATCH_FPS. With an auto-advance delay the game plays itself;
+# without one every snap waits for Enter.
+import time
+
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+from rich import box
+from rich.text import Text
+from rich.align import Align
+
+from config import WATCH_FPS, WATCH_DELAY
+
+# Field: 100 yards of green dots with a white line every 10
+_FIELD_PLAIN = "".join("|" if i % 10 == 0 and i else "." for i in range(100))
+_FIELD_BASE = Text(_FIELD_PLAIN, style="green")
+for _i in range(10, 100, 10): _FIELD_BASE.stylize("white", _i, _i + 1)
+
+
+class LiveView:
+    def __init__(self, sim, console, delay=WATCH_DELAY, fps=WATCH_FPS):
+        self.sim = sim
+        self.console = console
+        self.delay = delay          # seconds per snap, None = wait for Enter
+        self.frame_time = 1.0 / fps
+        self.last_frame = 0.0
+        self.parts = [None, None, None, None]
+        self.keys = [None, None, None]
+        self.live = Live(self, console=console, screen=True, auto_refresh=False)
+
+    def __rich_console__(self, console, options):
+        yield from self.parts
+
+    def start(self):
+        self.live.start()
+
+    def stop(self):
+        """Closes the live screen and leaves the final frame on the console."""
+        self.live.stop()
+        for part in self.parts:
+            if part is not None: self.console.print(part)
+
+    # --- SECTIONS ---
+    def _scoreboard(self):
+        sim = self.sim
+        h_score = sim.stats[sim.home]["score"]
+        a_score = sim.stats[sim.away]["score"]
+
+        # Color the leading score
+        h_style = "bold green" if h_score > a_score else ("bold red" if h_score < a_score else "bold white")
+        a_style = "bold green" if a_score > h_score else ("bold red" if a_score < h_score else "bold white")
+
+        # Possession indicators
+        p_h = "[yellow]◄ BALL[/yellow]" if sim.offense == sim.home else "      "
+        p_a = "[yellow]BALL ►[/yellow]" if sim.offense == sim.away else "      "
+
+        grid = Table.grid(expand=True)
+        grid.add_column(justify="left", ratio=1)
+        grid.add_column(justify="center", ratio=1)
+        grid.add_column(justify="right", ratio=1)
+        grid.add_row(
+            f"[bold]{sim.away.name.upper()}[/bold] ({sim.away.record_str()})",
+            "vs",
+            f"[bold]{sim.home.name.upper()}[/bold] ({sim.home.record_str()})"
+        )
+        grid.add_row(
+            f"{p_a} [{a_style}]{a_score}[/{a_style}]",
+            "",
+            f"[{h_style}]{h_score}[/{h_style}] {p_h}"
+        )
+        return Panel(grid, style="cyan", box=box.ROUNDED)
+
+    def _status(self, mode):
+        sim = self.sim
+        q_str = f"[yellow]OT{sim.ot_period}[/yellow]" if sim.is_overtime else f"Q{sim.quarter}"
+        mode_str = f"[red]HURRY[/red]" if mode == "HURRY" else (f"[green]CHEW[/green]" if mode == "CHEW" else "NORMAL")
+
+        status_table = Table(box=box.SIMPLE, show_header=False, expand=True)
+        status_table.add_column("Clock", justify="left")
+        status_table.add_column("Down", justify="center")
+        status_table.add_column("Mode", justify="right")
+        status_table.add_row(
+            f"{q_str} | {sim.get_clock_str()}",
+            f"{sim.down} & {int(sim.distance)} | {sim.get_field_pos_str()}",
+            f"Mode: {mode_str}"
+        )
+        return status_table
+
+    def _field(self, target_idx, b_idx):
+        field = _FIELD_BASE.copy()
+        plain = list(_FIELD_PLAIN)
+        if 0 <= target_idx < 100: plain[target_idx] = "I"
+        plain[b_idx] = "O"
+        field.plain = "".join(plain)
+        if 0 <= target_idx < 100: field.stylize("yellow", target_idx, target_idx + 1)
+        field.stylize("bold yellow", b_idx, b_idx + 1)
+        return Panel(Align.center(Text.assemble(("END", "red"), " ", field, " ", ("END", "red"))), box=box.HEAVY)
+
+    # --- FRAMES ---
+    def update(self, last_play_desc):
+        """Refreshes the sections whose values changed since the last frame."""
+        sim = self.sim
+        scores = (sim.stats[sim.home]["score"], sim.stats[sim.away]["score"], sim.offense is sim.home)
+        if scores != self.keys[0]:
+            self.keys[0] = scores
+            self.parts[0] = self._scoreboard()
+
+        mode = sim.check_time_management()
+        status = (sim.is_overtime, sim.ot_period, sim.quarter, int(sim.time_remaining), sim.down,
+                  int(sim.distance), int(sim.ball_on), mode)
+        if status != self.keys[1]:
+            self.keys[1] = status
+            self.parts[1] = self._status(mode)
+
+        spots = (int(sim.ball_on + sim.distance), max(0, min(99, int(sim.ball_on))))
+        if spots != self.keys[2]:
+            self.keys[2] = spots
+            self.parts[2] = self._field(*spots)
+
+        self.parts[3] = Panel(f"[bold]{last_play_desc}[/bold]", title="LAST PLAY", border_style="cyan")
+
+    def show(self, last_play_desc):
+        """Draws the current state, then waits for Enter or the auto-advance delay."""
+        self.update(last_play_desc)
+        now = time.perf_counter()
+        # Frame cap: with a fast auto-advance, snaps in between frames are skipped on screen
+        if self.delay is None or now - self.last_frame >= self.frame_time:
+            self.live.refresh()
+            self.last_frame = now
+        if self.delay is None: input()
+        elif self.delay > 0: time.sleep(self.delay)
@@ -0,0 +1,150 @@
+# log_archive.py
+#
+# Exported game logs (Game.export_log) for a season go into one appendable
+# archive instead of a text file per game: LOG_ARCHIVE_DIR/season_<year>.jsonl
+# holds one JSON line per game, and season_<year>.idx holds a
+# "key<TAB>offset<TAB>length" line per game for direct lookups.
+#
+# GameSim hands the finished text to append(); a background thread does the
+# file I/O, so exporting every game of a season doesn't stall the sim. A write
+# error doesn't stop the thread: it keeps draining the queue and the error is
+# raised by the next flush() (and so by index()/read()). flush_all() runs after
+# every simulated week and at exit and prints such errors on the console.
+import atexit
+import json
+import os
+import queue
+import threading
+
+from config import LOG_ARCHIVE_DIR, console
+
+WRITE_BUFFER = 1 << 20
+
+
+def game_key(game):
+    """Archive key of a game (the old per-game file name, without .txt)."""
+    return f"Week{game.week}_{game.away_team.name.replace(' ','')}_vs_{game.home_team.name.replace(' ','')}"
+
+
+class LogArchive:
+    def __init__(self, season, directory=LOG_ARCHIVE_DIR):
+        self.season = season
+        self.path = os.path.join(directory, f"season_{season}.jsonl")
+        self.index_path = os.path.join(directory, f"season_{season}.idx")
+        self.directory = directory
+        self._queue = queue.Queue()
+        self._thread = None
+        self._index = None
+        self._error = None  # first write error since the last flush()
+
+    # --- WRITING ---
+    def append(self, key, text, **meta):
+        """Queues one game's log; returns immediately."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._writer, name=f"log-archive-{self.season}", daemon=True)
+            self._thread.start()
+        self._queue.put((key, text, meta))
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        data = open(self.path, "ab", buffering=WRITE_BUFFER)
+        try:
+            index = open(self.index_path, "a", buffering=WRITE_BUFFER)
+        except BaseException:
+            data.close()
+            raise
+        return data, index, data.seek(0, os.SEEK_END)
+
+    def _writer(self):
+        files = None    # (data, index, offset), reopened after an error
+        while True:
+            item = self._queue.get()
+            try:
+                if item is not None:
+                    if files is None: files = self._open()
+                    data, index, offset = files
+                    key, text, meta = item
+                    line = (json.dumps({"key": key, **meta, "text": text}) + "\n").encode()
+                    data.write(line)
+                    index.write(f"{key}\t{offset}\t{len(line)}\n")
+                    files = (data, index, offset + len(line))
+                    if self._index is not None: self._index[key] = (offset, len(line))
+                # Flush whenever the queue runs dry, so a finished week is on disk
+                if files is not None and (item is None or self._queue.empty()):
+                    files[0].flush(); files[1].flush()
+            except Exception as e:
+                if self._error is None: self._error = e
+                files = self._close_files(files)
+            finally:
+                self._queue.task_done()
+            if item is None:
+                self._close_files(files)
+                return
+
+    def _close_files(self, files):
+        if files is not None:
+            for f in files[:2]:
+                try: f.close()
+                except Exception: pass
+        return None
+
+    def flush(self):
+        """Blocks until every queued log is written; raises the first write error since the last flush."""
+        if self._thread is not None: self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    # --- READING ---
+    def index(self):
+        """key -> (offset, length) for every game in the archive."""
+        self.flush()
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    for line in f:
+                        key, offset, length = line.rstrip("\n").split("\t")
+                        self._index[key] = (int(offset), int(length))
+        return self._index
+
+    def keys(self):
+        return list(self.index())
+
+    def read(self, key):
+        """The entry stored for `key` (dict with "key", "text" and any metadata), or None."""
+        where = self.index().get(key)
+        if where is None: return None
+        with open(self.path, "rb") as f:
+            f.seek(where[0])
+            return json.loads(f.read(where[1]))
+
+
+_archives = {}
+
+def archive_for(season):
+    """The shared archive for a season's exported logs."""
+    if season is None: raise ValueError("Game has no season; schedule it with scheduler.seed_game before exporting its log")
+    archive = _archives.get(season)
+    if archive is None:
+        archive = _archives[season] = LogArchive(season)
+    return archive
+
+def flush_all():
+    """Waits until every queued log is written; prints any write error instead of raising it."""
+    for archive in list(_archives.values()):
+        try:
+            archive.flush()
+        except Exception as e:
+            console.print(f"[bold red]Could not export game logs to {archive.path}: {e}[/bold red]")
+
+@atexit.register
+def close_all():
+    flush_all()
+    for archive in _archives.values(): archive.close()
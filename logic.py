@@ -1,9 +1,19 @@
 
+import atexit
+from concurrent.futures import ProcessPoolExecutor
 from rich.panel import Panel
-from config import console
+from config import console, SIM_WORKERS, SIM_FIDELITY, SIM_PROFILE
 from game_sim import GameSim
+from drive_sim import DriveSim
+from box_score import BoxScore
+from play_log import PlayLog
+from drive_result import DriveResult
+from sim_profiler import PROFILER
 from recruiting import process_weekly_recruiting
+from log_archive import flush_all as flush_exported_logs
 from scheduler import (
+    Game,
+    seed_game,
     generate_schedule,
     generate_playoffs_round_of_16, 
     generate_next_playoff_round, 
@@ -23,6 +33,107 @@ def ensure_college_schedule(universe):
             if week not in universe.schedule: universe.schedule[week] = []
             universe.schedule[week].extend(games)
 
+# --- PARALLEL WEEK SIMULATION ---
+# Games in a week share no teams and each one draws from its own seeded RNG
+# stream, so they can be played in worker processes and merged back in
+# schedule order with exactly the results the sequential loop would give.
+# The pool is kept between weeks and shut down after a season run or at exit.
+_pool = None
+_pool_workers = 0
+
+class _SimTeam:
+    """The parts of a team the engines read. Keeps worker payloads to one team's roster."""
+    def __init__(self, team):
+        self.name = team.name
+        self.coach = team.coach
+        self.roster = team.roster
+        self.depth_chart = team.depth_chart
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool: _pool.shutdown()
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
+
+def shutdown_pool():
+    """Stops the sim worker processes (started again by the next parallel week)."""
+    global _pool, _pool_workers
+    if _pool:
+        _pool.shutdown()
+        _pool, _pool_workers = None, 0
+
+atexit.register(shutdown_pool)
+
+def _engine_for(universe, game):
+    """GameSim or DriveSim, from the league's SIM_FIDELITY setting."""
+    if game.export_log: return GameSim
+    league = "HS" if game.home_team in universe.high_school_league else "COLLEGE"
+    return DriveSim if SIM_FIDELITY.get(league) == "drive" else GameSim
+
+def _play_remote(game, engine=GameSim, headless=False):
+    """Worker side: plays a detached copy of the game, returns scores, log, drives, box score and health changes."""
+    teams = (game.home_team, game.away_team)
+    before = {p.id: (p.stamina, p.weeks_injured) for t in teams for p in t.roster}
+    engine(game, headless=headless).play_game()
+
+    changes = []
+    for t in teams:
+        for p in t.roster:
+            if (p.stamina, p.weeks_injured) != before[p.id]:
+                changes.append((p.id, p.stamina, p.weeks_injured, p.injury_type))
+    drives = [d.export(game.home_team) for d in game.drives]
+    return game.home_score, game.away_score, game.summary, game.game_log.export(), drives, game.box_score.export(), changes
+
+def _apply_remote(game, result):
+    home_score, away_score, summary, game_log, drives, box, changes = result
+    game.home_score = home_score
+    game.away_score = away_score
+    game.summary = summary
+    game.played = True
+    players = {p.id: p for t in (game.home_team, game.away_team) for p in t.roster}
+    game.game_log = PlayLog.restore(game_log, game.home_team, game.away_team, players)
+    game.drives = [DriveResult.restore(d, game.home_team, game.away_team) for d in drives]
+    game.box_score = BoxScore.restore(box, players)
+    game.box_score.commit()
+    for pid, stamina, weeks_injured, injury_type in changes:
+        p = players[pid]
+        p.stamina = stamina
+        p.weeks_injured = weeks_injured
+        p.injury_type = injury_type
+
+def _can_run_parallel(games, workers):
+    if workers < 2 or len(games) < 2: return False
+    # Profiled games have to run in this process to be counted
+    if PROFILER.active: return False
+    teams = [t for g in games for t in (g.home_team, g.away_team)]
+    return len(teams) == len(set(teams))
+
+def _play_games(universe, games, headless=False):
+    """Plays the week's unplayed games, yielding each one in schedule order once it is final."""
+    for game in games: seed_game(universe, game)
+
+    # Exported logs are written by the parent; everything else can go to the pool
+    futures = {}
+    if _can_run_parallel(games, SIM_WORKERS):
+        pool = _get_pool(SIM_WORKERS)
+        for game in games:
+            if game.export_log: continue
+            detached = Game(_SimTeam(game.home_team), _SimTeam(game.away_team), game.week, title=game.title)
+            detached.season, detached.seed = game.season, game.seed
+            futures[game] = pool.submit(_play_remote, detached, _engine_for(universe, game), headless)
+
+    for game in games:
+        if game in futures:
+            _apply_remote(game, futures[game].result())
+        else:
+            # PASS CONSOLE TO GAME SIM for consistent output
+            # Season games keep their compact play log so they can be replayed later;
+            # silent (bulk) weeks run headless, except for exported games
+            _engine_for(universe, game)(game, console=console, headless=headless).play_game()
+        yield game
+
 def process_weekly_injuries(universe, silent=False):
     if not silent:
         console.print(" [dim]- Processing Medical Reports...[/dim]")
@@ -55,13 +166,7 @@ def simulate_week(universe, silent=False):
     # Inner Sim Function
     def _run_sim_loop():
         nonlocal sim_count
-        for game in games:
-            if game.played: continue
-            
-            # PASS CONSOLE TO GAME SIM for consistent output
-            sim = GameSim(game, console=console)
-            sim.play_game()
-            
+        for game in _play_games(universe, [g for g in games if not g.played], headless=silent):
             # Stats Aggregation
             game.home_team.points_for += game.home_score
             game.home_team.points_against += game.away_score
@@ -93,6 +198,10 @@ def simulate_week(universe, silent=False):
         console.print(f" [dim]Simulated {sim_count} games.[/dim]")
     else:
         _run_sim_loop()
+    # Exported logs are written in the background; report a failed write this week
+    flush_exported_logs()
+
+    if PROFILER.active and SIM_PROFILE: PROFILER.dump(SIM_PROFILE)
 
     process_weekly_injuries(universe, silent=silent)
     
@@ -145,7 +254,8 @@ def simulate_week(universe, silent=False):
                     console.print(Panel(f"[bold yellow]NATIONAL CHAMPIONSHIP SET: {f.away_team.name} vs {f.home_team.name}[/bold yellow]", style="red"))
                 
                 # Auto-Sim final (Pass console)
-                sim = GameSim(f, console=console)
+                seed_game(universe, f)
+                sim = GameSim(f, console=console, headless=silent)
                 sim.play_game()
                 # Manually set nat_champ here since it's outside simulate_week loop
                 f.winner.nat_champ = True 
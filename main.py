@@ -5,15 +5,17 @@ from rich.prompt import Prompt
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 
 # Local Imports
-from config import console
+from config import console, WATCH_DELAY
 from utils import repair_save_data, find_school_by_input
-from logic import ensure_college_schedule, simulate_week
+from logic import ensure_college_schedule, simulate_week, shutdown_pool
 import views
 
 # Import existing modules
 from world_gen import generate_world
 from league_manager import save_league, load_league, save_exists
 from game_sim import GameSim
+from replay import Replay
+from scheduler import seed_game
 from season_manager import advance_season
 from rankings import display_rankings, get_heisman_leaders
 from coach_manager import view_coach_history
@@ -92,6 +94,7 @@ def main():
                             # Integration: Generate news during loop
                             if news_manager: 
                                 news_manager.generate_weekly_news()
+                        shutdown_pool()
                         
                         console.print("\n[bold green]SEASON COMPLETE! Entering Offseason...[/bold green]")
                         time.sleep(1)
@@ -136,6 +139,7 @@ def main():
                             save_league(universe)
                             
                             progress.advance(season_task)
+                    shutdown_pool()
                     
                     console.print(f"\n[bold green]Simulation Complete! Welcome to {universe.year}.[/bold green]")
                     time.sleep(2)
@@ -172,13 +176,18 @@ def main():
                     time.sleep(1)
                 else:
                     try:
-                        idx = int(cmd.split()[1]) - 1
+                        args = cmd.split()
+                        idx = int(args[1]) - 1
                         if 0 <= idx < len(last_schedule_list):
                             g = last_schedule_list[idx]
                             if g.played:
-                                console.print("Game already played.")
+                                views.display_box_score(g)
+                                console.input("[dim]Press Enter to return...[/dim]")
                             else:
                                 g.slow_mode = True
+                                # Optional auto-advance: "watch <ID> <seconds per snap>"
+                                if len(args) > 2: g.watch_delay = float(args[2])
+                                seed_game(universe, g)
                                 # PASS CONSOLE HERE TO ENABLE RICH UI IN GAME SIM
                                 sim = GameSim(g, console=console)
                                 sim.play_game()
@@ -190,6 +199,29 @@ def main():
                                 console.input("[dim]Press Enter to return...[/dim]")
                     except: pass
 
+            elif cmd.startswith("replay"):
+                # "replay <ID> [q<n>|d<n>|ot] [seconds per snap]": re-watch a final from its play log
+                if not last_schedule_list:
+                    console.print("[red]View schedule first.[/red]")
+                    time.sleep(1)
+                else:
+                    try:
+                        args = cmd.split()
+                        idx = int(args[1]) - 1
+                        if 0 <= idx < len(last_schedule_list):
+                            g = last_schedule_list[idx]
+                            if not g.played or not Replay.available(g):
+                                console.print("[red]No replay for that game.[/red]")
+                                time.sleep(1)
+                            else:
+                                where, delay = None, WATCH_DELAY
+                                for a in args[2:]:
+                                    if a[0] in "qdo": where = a
+                                    else: delay = float(a)
+                                Replay(g).play(console, where, delay)
+                                console.input("[dim]Press Enter to return...[/dim]")
+                    except: pass
+
             elif cmd == "view":
                 active = universe.high_school_league if context == "HS" else universe.college_league
                 
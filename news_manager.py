@@ -5,6 +5,13 @@ from rich.panel import Panel
 
 # Local Imports
 from rankings import get_top_25
+from drive_result import go_ahead_drive, D_2PT_GOOD
+from scheduler import game_seed
+
+try:
+    from batch_sim import simulate_matchup
+except ImportError:  # NumPy not installed: previews skip the model projection
+    simulate_matchup = None
 
 console = Console()
 
@@ -610,7 +617,15 @@ class NewsManager:
         return depth_chart[0] if depth_chart else None
 
     def _scan_game_log_for_context(self, game):
-        """Reads the raw game log to find narrative hooks."""
+        """Reads the game summary (or the raw log for older saves) to find narrative hooks."""
+        summary = getattr(game, 'summary', None)
+        if summary:
+            turnovers = summary["turnovers"]
+            context = "clean"
+            if turnovers >= 4: context = "sloppy"
+            if summary["overtime"]: context = "ot_thriller"
+            return context, turnovers
+
         log_text = " ".join(game.game_log)
         turnovers = log_text.count("INTERCEPTED") + log_text.count("FUMBLE") + log_text.count("Fumble")
         
@@ -677,6 +692,20 @@ class NewsManager:
             
         if l_rank and l_rank <= 12: 
             context_lines.append(f"{loser.name}'s playoff hopes have taken a massive hit.")
+
+        box_score = getattr(game, 'box_score', None)
+        star = box_score.top_performer(winner) if box_score else None
+        if star:
+            context_lines.append(f"{star.full_name} led the way with {star.get_stat_summary(box_score.line(star))}.")
+
+        # Late go-ahead score, from the drive records
+        drive = go_ahead_drive(getattr(game, 'drives', None) or [], winner)
+        if drive and drive.quarter in (0, 4) and diff <= 8:
+            if drive.result == D_2PT_GOOD:
+                context_lines.append(f"{winner.name} finally won it on a two-point try in overtime period {drive.clock}.")
+            else:
+                when = "in overtime" if drive.quarter == 0 else "in the fourth quarter"
+                context_lines.append(f"The go-ahead score came {when} on a {drive.plays}-play, {drive.yards}-yard drive.")
             
         context = " ".join(context_lines)
         quote = NewsNarrator.get_game_quote(winner, loser, archetype)
@@ -879,6 +908,13 @@ class NewsManager:
             else: 
                 body += f"The road team comes in as the underdog by ranking, but they have the firepower to pull off the upset if they can control the tempo."
             
+            if simulate_matchup:
+                seed = game_seed(self.universe.seed, self.universe.year, top_game)
+                odds = simulate_matchup(top_game.home_team, top_game.away_team, n_games=2000, seed=seed)
+                h_pts, a_pts = odds.expected_score()
+                pct = max(odds.home_win_prob, odds.away_win_prob) * 100
+                body += f"\n\nOur model ran the matchup 2,000 times: {odds.favorite.name} wins {pct:.0f}% of them, with an average score of {top_game.away_team.name} {a_pts:.0f}, {top_game.home_team.name} {h_pts:.0f}."
+            
             stories.append(NewsStory(headline, body, "PREVIEW", week, year, 85))
             
         return stories
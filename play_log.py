@@ -0,0 +1,229 @@
+# play_log.py
+#
+# Packed play-by-play for one game (Game.game_log). Each logged line is one
+# binary record - situation, play code, outcome, yards, players as indexes
+# into the log's player table, flags, score after the play - instead of a
+# formatted string; DriveSim drives get a shorter record of their own. Text is
+# only built when the log is read: iterating a PlayLog yields the same lines
+# GameSim used to store, and replay.py steps through the records to show a
+# finished game again.
+import struct
+from collections import namedtuple
+
+import play_result as pr
+from play_result import PlayResult
+
+# --- RECORD KINDS ---
+SNAP = 0            # regulation snap (situation before the snap)
+OT_SNAP = 1         # overtime snap (down & distance after the snap, as displayed; clock = OT period)
+SHOOTOUT = 2        # 2-pt shootout attempt (clock = OT period)
+OT_PERIOD = 3       # "--- OVERTIME PERIOD n ---" header
+OT_POSSESSION = 4   # overtime possession header
+SHOOTOUT_TEAM = 5   # 2-pt attempt header
+DRIVE = 6           # DriveSim: one possession (quarter 0 = overtime, clock = OT period)
+DRIVE_OT_PERIOD = 7 # DriveSim overtime header
+
+MODES = ("NORMAL", "HURRY", "CHEW")
+OUTCOMES = (
+    pr.PUNT, pr.PUNT_BLOCKED, pr.FG_GOOD, pr.FG_MISSED, pr.FG_BLOCKED, pr.RUN, pr.FUMBLE,
+    pr.SCRAMBLE, pr.SACK, pr.STRIP_SACK, pr.COMPLETE, pr.INCOMPLETE, pr.DROP, pr.INTERCEPTION,
+)
+DETAILS = (None, pr.RUN_STUFFED, pr.RUN_MIDDLE, pr.RUN_NICE, pr.RUN_BREAKAWAY)
+CALL_NOTES = (None, pr.CALL_READ, pr.CALL_GREAT, pr.CALL_ANALYST)
+_OUTCOME_CODE = {o: i for i, o in enumerate(OUTCOMES)}
+_DETAIL_CODE = {d: i for i, d in enumerate(DETAILS)}
+_NOTE_CODE = {n: i for i, n in enumerate(CALL_NOTES)}
+
+# Drive results (drive_result.DriveResult; DriveSim logs one record per drive)
+DRIVE_RESULTS = (
+    "INTERCEPTED", "FUMBLE", "STRIP SACK", "SAFETY", "TOUCHDOWN", "END OF GAME", "DOWNS",
+    "FG GOOD", "FG MISSED", "FG BLOCKED", "PUNT BLOCKED", "PUNT", "2PT GOOD", "2PT FAILED",
+)
+(D_INTERCEPTED, D_FUMBLE, D_STRIP_SACK, D_SAFETY, D_TOUCHDOWN, D_END_OF_GAME, D_DOWNS,
+ D_FG_GOOD, D_FG_MISSED, D_FG_BLOCKED, D_PUNT_BLOCKED, D_PUNT, D_2PT_GOOD, D_2PT_FAILED) = range(len(DRIVE_RESULTS))
+
+# Flag bits
+MISSED_TACKLE, BROKE_TACKLE, TOUCHDOWN, SAFETY, FIRST_DOWN, TURNOVER_ON_DOWNS, POSSESSION_CHANGE, \
+    CONVERSION_TRY, CONVERSION_GOOD = (1 << i for i in range(9))
+
+# Snaps and headers: kind, quarter, clock (s) or OT period, offense (0 away / 1 home),
+# down, distance, ball_on, mode, play code, outcome, detail, call note, yards, points,
+# time used, player, target, defender, tackler (log player index + 1, 0 = none), flags,
+# injuries, home score, away score
+RECORD = struct.Struct("<BBHBBBhBBBBBhbBHHHHHBBB")
+Snap = namedtuple("Snap", "kind quarter clock offense down distance ball_on mode play outcome detail note "
+                          "yards points time_used player target defender tackler flags injuries home_score away_score")
+# DRIVE: kind, quarter, clock, offense, start (own yard line), kick distance (FG/punt),
+# result (DRIVE_RESULTS index), injuries, home score, away score
+DRIVE_RECORD = struct.Struct("<BBHBBBBBBB")
+Drive = namedtuple("Drive", "kind quarter clock offense start distance result injuries home_score away_score")
+# player, injury name (string index + 1, 0 = shook it off), severity (string index)
+INJURY = struct.Struct("<HHB")
+
+
+def _field(ball_on):
+    """'own 30' / 'opp 25' for a spot measured from the offense's goal line."""
+    pos = max(1, min(99, ball_on))
+    return f"opp {100 - pos}" if pos > 50 else f"own {pos}"
+
+
+class PlayLog:
+    def __init__(self, home, away):
+        self.teams = (away, home)
+        self.records = bytearray()
+        self.injuries = bytearray()
+        self.players = []   # index -> player
+        self.strings = []   # index -> injury name / severity
+        self._index = {}
+        self._string_index = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_index"], state["_string_index"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._index = {p: i for i, p in enumerate(self.players)}
+        self._string_index = {s: i for i, s in enumerate(self.strings)}
+
+    # --- WRITING ---
+    def _player(self, player):
+        if player is None: return 0
+        i = self._index.get(player)
+        if i is None:
+            i = self._index[player] = len(self.players)
+            self.players.append(player)
+        return i + 1
+
+    def _string(self, s):
+        i = self._string_index.get(s)
+        if i is None:
+            i = self._string_index[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+    def _side(self, team):
+        return 1 if team is self.teams[1] else 0
+
+    def _add_injuries(self, injuries):
+        for player, name, severity in injuries:
+            self.injuries += INJURY.pack(self._player(player), 0 if name is None else self._string(name) + 1, self._string(severity))
+        return len(injuries)
+
+    def snap(self, kind, quarter, clock, offense, down, distance, ball_on, mode, res, score):
+        """Logs a resolved PlayResult with the situation shown next to it."""
+        flags = ((MISSED_TACKLE if res.missed_tackle else 0) | (BROKE_TACKLE if res.broke_tackle else 0)
+                 | (TOUCHDOWN if res.touchdown else 0) | (SAFETY if res.safety else 0)
+                 | (FIRST_DOWN if res.first_down else 0) | (TURNOVER_ON_DOWNS if res.turnover_on_downs else 0)
+                 | (POSSESSION_CHANGE if res.possession_change else 0))
+        if res.conversion is not None: flags |= CONVERSION_TRY | (CONVERSION_GOOD if res.conversion else 0)
+        self.records += RECORD.pack(
+            kind, quarter, int(clock), self._side(offense), down, int(distance), int(ball_on),
+            MODES.index(mode), res.play, _OUTCOME_CODE[res.outcome], _DETAIL_CODE[res.detail], _NOTE_CODE[res.call_note],
+            res.yards, res.points, res.time_used,
+            self._player(res.player), self._player(res.target), self._player(res.defender), self._player(res.tackler),
+            flags, self._add_injuries(res.injuries), min(255, score[0]), min(255, score[1]),
+        )
+
+    def header(self, kind, period, offense=None):
+        """Logs a section header (overtime period, OT possession, 2-pt attempt)."""
+        self.records += RECORD.pack(kind, 0, period, self._side(offense) if offense else 0,
+                                    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    def drive(self, d, injuries, score):
+        """Logs one DriveSim possession (a DriveResult)."""
+        self.records += DRIVE_RECORD.pack(DRIVE, d.quarter, d.clock, self._side(d.offense), d.start, d.distance,
+                                          d.result, self._add_injuries([i for i in injuries if i[1]]),
+                                          min(255, score[0]), min(255, score[1]))
+
+    # --- READING ---
+    def _offsets(self):
+        """(kind, offset) of every record; drives are shorter than snaps and headers."""
+        records, at = self.records, 0
+        while at < len(records):
+            kind = records[at]
+            yield kind, at
+            at += DRIVE_RECORD.size if kind == DRIVE else RECORD.size
+
+    def __len__(self):
+        return sum(1 for _ in self._offsets())
+
+    def events(self):
+        """Decoded records: (Snap or Drive, PlayResult for snaps / injury list otherwise)."""
+        players = self.players
+        inj_at = 0
+        for kind, at in self._offsets():
+            if kind == DRIVE: rec = Drive._make(DRIVE_RECORD.unpack_from(self.records, at))
+            else: rec = Snap._make(RECORD.unpack_from(self.records, at))
+            injuries = []
+            for _ in range(rec.injuries):
+                p, name, sev = INJURY.unpack_from(self.injuries, inj_at)
+                inj_at += INJURY.size
+                injuries.append((players[p - 1], self.strings[name - 1] if name else None, self.strings[sev]))
+            if kind not in (SNAP, OT_SNAP, SHOOTOUT):
+                yield rec, injuries
+                continue
+            player, target, defender, tackler, flags = rec.player, rec.target, rec.defender, rec.tackler, rec.flags
+            res = PlayResult(rec.play, OUTCOMES[rec.outcome], rec.yards, rec.time_used, players[player - 1] if player else None)
+            res.detail = DETAILS[rec.detail]
+            res.call_note = CALL_NOTES[rec.note]
+            res.points = rec.points
+            res.target = players[target - 1] if target else None
+            res.defender = players[defender - 1] if defender else None
+            res.tackler = players[tackler - 1] if tackler else None
+            res.missed_tackle = bool(flags & MISSED_TACKLE)
+            res.broke_tackle = bool(flags & BROKE_TACKLE)
+            res.touchdown = bool(flags & TOUCHDOWN)
+            res.safety = bool(flags & SAFETY)
+            res.first_down = bool(flags & FIRST_DOWN)
+            res.turnover_on_downs = bool(flags & TURNOVER_ON_DOWNS)
+            res.possession_change = bool(flags & POSSESSION_CHANGE)
+            if flags & CONVERSION_TRY: res.conversion = bool(flags & CONVERSION_GOOD)
+            res.injuries = injuries
+            yield rec, res
+
+    def __iter__(self):
+        for rec, res in self.events():
+            yield self.render(rec, res)
+
+    def lines(self):
+        return list(self)
+
+    def render(self, rec, res):
+        """Text line for one record (same text GameSim/DriveSim used to log)."""
+        kind, quarter, clock = rec.kind, rec.quarter, rec.clock
+        team = self.teams[rec.offense]
+        if kind == SNAP:
+            situation = f"Q{quarter} {clock // 60:02d}:{clock % 60:02d} | {team.name} ball | {rec.down} & {rec.distance} @ {_field(rec.ball_on)} [{MODES[rec.mode]}]"
+            return f"{situation}\n   PLAY: {res.render()}"
+        if kind == OT_SNAP: return f"   {rec.down}&{rec.distance}: {res.render()}"
+        if kind == SHOOTOUT: return f"   Result: {res.render()}"
+        if kind == OT_PERIOD: return f"\n[bold yellow]--- OVERTIME PERIOD {clock} ---[/bold yellow]"
+        if kind == OT_POSSESSION: return f"\n[bold]{team.name} Possession[/bold] (Start @ Opp 25)"
+        if kind == SHOOTOUT_TEAM: return f"\n[bold]{team.name} 2-Point Attempt[/bold] (from 3-yd line)"
+        if kind == DRIVE_OT_PERIOD: return f"--- OVERTIME PERIOD {clock} ---"
+
+        # DRIVE: res holds the injuries
+        result = rec.result
+        label = DRIVE_RESULTS[result]
+        if result in (D_FG_GOOD, D_FG_MISSED): label = f"{rec.distance} yd {label}"
+        elif result == D_PUNT: label = f"Punt {rec.distance} yds"
+        where = "OT" if quarter == 0 else f"Q{quarter} {clock // 60:02d}:{clock % 60:02d}"
+        line = f"{where} | {team.name} drive from {_field(rec.start)}: {label}"
+        if res: line += " | Injured: " + ", ".join(f"{p.last_name} ({inj})" for p, inj, _ in res)
+        return line
+
+    # --- PROCESS HAND-OFF ---
+    def export(self):
+        """Log with players as ids, for a game played in another process."""
+        return bytes(self.records), bytes(self.injuries), [p.id for p in self.players], list(self.strings)
+
+    @classmethod
+    def restore(cls, data, home, away, players_by_id):
+        records, injuries, ids, strings = data
+        log = cls(home, away)
+        log.records = bytearray(records)
+        log.injuries = bytearray(injuries)
+        log.__setstate__({"players": [players_by_id[i] for i in ids], "strings": strings})
+        return log
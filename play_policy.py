@@ -0,0 +1,104 @@
+# play_policy.py
+#
+# Play-calling policy tables. Fourth-down aggressiveness, field goal range and
+# run/pass weighting depend only on the coach's profile and a few bucketed
+# features of the situation, so they are worked out once per profile into flat
+# tables that GameSim.call_plays indexes on every snap.
+#
+# Tables are cached by profile (the coach attributes and traits that play
+# calling reads), so a coach whose attributes change between seasons simply
+# maps to a new table.
+from tactics import PLAYBOOK
+from trait_flags import PLAYER_FLAGS, COACH_FLAGS
+
+GUNSLINGER = PLAYER_FLAGS.bit("Gunslinger")
+GAME_MANAGER = PLAYER_FLAGS.bit("Game Manager")
+HERO_BALL = PLAYER_FLAGS.bit("Hero Ball")
+GUT_FEELING = COACH_FLAGS.bit("Gut Feeling")
+FOURTH_DOWN_FIRE = COACH_FLAGS.bit("Fourth Down Fire")
+
+FIELD_GOAL_RANGE = 65
+GUT_SWING = range(-20, 41)  # Gut Feeling adds randint(-20, 40) to 4th down aggressiveness
+
+MODES = {"NORMAL": 0, "HURRY": 1, "CHEW": 2}
+
+# 4th down calls
+GO_SHORT = (PLAYBOOK.off["RUN_POWER"], PLAYBOOK.defense["GOAL_LINE"])
+GO_LONG = (PLAYBOOK.off["PASS_QUICK"], PLAYBOOK.defense["MAN_1"])
+GO_DEEP = (PLAYBOOK.off["PASS_DEEP"], PLAYBOOK.defense["BLITZ_HEAVY"])
+KICK = (PLAYBOOK.off["FIELD_GOAL"], PLAYBOOK.defense["BLOCK"])
+PUNT = (PLAYBOOK.off["PUNT"], PLAYBOOK.defense["RETURN"])
+
+
+# --- SITUATION BUCKETS ---
+def fourth_down_index(distance, ball_on, late_and_trailing):
+    """Short yardage (<= 2) x field goal range x trailing in the last 3 minutes."""
+    return (distance <= 2) * 4 + (ball_on >= FIELD_GOAL_RANGE) * 2 + late_and_trailing
+
+
+def pass_index(distance, mode, qb_flags, desperate):
+    """Distance (< 4 / 4-8 / > 8) x clock mode x QB tendencies (Gunslinger, Game Manager, Hero Ball when down late)."""
+    dist = 0 if distance < 4 else (2 if distance > 8 else 1)
+    style = (1 if qb_flags & GUNSLINGER else 0) | (2 if qb_flags & GAME_MANAGER else 0)
+    if desperate and qb_flags & HERO_BALL: style |= 4
+    return (dist * 3 + MODES[mode]) * 8 + style
+
+
+class PlayPolicy:
+    def __init__(self, run_pass_bias, aggressiveness, fourth_down_agg, coach_flags):
+        self.aggressiveness = aggressiveness
+        self.gut_feeling = bool(coach_flags & GUT_FEELING)
+
+        # 4th down: call per situation; with Gut Feeling also the call for every swing
+        bonus = 15 if coach_flags & FOURTH_DOWN_FIRE else 0
+        self.fourth = []
+        self.fourth_gut = []
+        for i in range(8):
+            short, in_range, late = i >> 2, (i >> 1) & 1, i & 1
+            agg = fourth_down_agg + (50 if late else 0) + bonus
+            self.fourth.append(self._fourth_call(agg, short, in_range))
+            if self.gut_feeling:
+                self.fourth_gut.append(tuple(self._fourth_call(agg + s, short, in_range) for s in GUT_SWING))
+
+        # Other downs: probability of a pass call
+        self.pass_prob = []
+        for dist in range(3):
+            for mode in ("NORMAL", "HURRY", "CHEW"):
+                for style in range(8):
+                    p = run_pass_bias * 0.08
+                    if dist == 2: p += 0.25 # Need yards, pass more
+                    if dist == 0: p -= 0.15 # Short yardage, run more
+                    if mode == "HURRY": p += 0.35
+                    if mode == "CHEW": p -= 0.40
+                    if style & 1: p += 0.15
+                    if style & 2: p -= 0.10
+                    p = max(0.10, min(0.90, p))
+                    # TRAIT: Hero Ball (Ignores safe calls when losing)
+                    if style & 4: p = 1.0
+                    self.pass_prob.append(p)
+
+    @staticmethod
+    def _fourth_call(agg, short, in_range):
+        if in_range:
+            if agg > 15: return GO_SHORT if short else GO_LONG
+            return KICK
+        return GO_DEEP if agg > 25 else PUNT
+
+    def fourth_down(self, index, rng):
+        """4th down call for a situation index. Gut Feeling draws from rng like the old inline logic."""
+        # TRAIT: Gut Feeling (High Variance decision)
+        if self.gut_feeling and rng.random() < 0.2:
+            return self.fourth_gut[index][rng.randint(-20, 40) + 20]
+        return self.fourth[index]
+
+
+_policies = {}
+
+def policy_for(coach):
+    """Shared policy table for the coach's current profile."""
+    key = (coach.run_pass_bias, coach.aggressiveness, coach.fourth_down_agg,
+           coach.trait_flags & (GUT_FEELING | FOURTH_DOWN_FIRE))
+    policy = _policies.get(key)
+    if policy is None:
+        policy = _policies[key] = PlayPolicy(*key)
+    return policy
@@ -0,0 +1,157 @@
+# play_result.py
+#
+# Structured result of a single snap. GameSim.resolve_play fills one of these
+# in instead of formatting a Rich-markup string; the markup is only built when
+# something actually displays the play (render()).
+
+# --- OUTCOME CODES ---
+PUNT = "PUNT"
+PUNT_BLOCKED = "PUNT_BLOCKED"
+FG_GOOD = "FG_GOOD"
+FG_MISSED = "FG_MISSED"
+FG_BLOCKED = "FG_BLOCKED"
+RUN = "RUN"
+FUMBLE = "FUMBLE"
+SCRAMBLE = "SCRAMBLE"
+SACK = "SACK"
+STRIP_SACK = "STRIP_SACK"
+COMPLETE = "COMPLETE"
+INCOMPLETE = "INCOMPLETE"
+DROP = "DROP"
+INTERCEPTION = "INTERCEPTION"
+
+# Run details (how the trench battle went)
+RUN_STUFFED = "STUFFED"
+RUN_MIDDLE = "MIDDLE"
+RUN_NICE = "NICE"
+RUN_BREAKAWAY = "BREAKAWAY"
+
+# Play-call notes (strategy counter logic)
+CALL_READ = "READ"
+CALL_GREAT = "GREAT"
+CALL_ANALYST = "ANALYST"
+
+CALL_NOTE_MARKUP = {
+    CALL_READ: " [red](Def Read!)[/red]",
+    CALL_GREAT: " [green](Great Call!)[/green]",
+    CALL_ANALYST: " [yellow](Analyst Save)[/yellow]",
+}
+
+TURNOVER_OUTCOMES = (FUMBLE, STRIP_SACK, INTERCEPTION)
+PASS_ATTEMPT_OUTCOMES = (COMPLETE, INCOMPLETE, DROP, INTERCEPTION)
+
+
+class PlayResult:
+    """
+    Compact event describing one resolved snap.
+
+    `play` is the offensive play code (index into tactics.PLAYBOOK.off_keys).
+    `player` is the primary ball handler (RB, scrambling/sacked QB, kicker,
+    punter), `target` the intended receiver and `defender` the defender who
+    made the play (sacker, interceptor, or the covering DB on a completion).
+    `injuries` holds (player, injury_name, severity) tuples; injury_name is
+    None when an Iron Man shook the hit off.
+    """
+    __slots__ = (
+        "play", "outcome", "detail", "yards", "points", "time_used",
+        "player", "target", "defender", "tackler", "call_note",
+        "missed_tackle", "broke_tackle", "injuries",
+        "touchdown", "safety", "first_down", "turnover_on_downs",
+        "possession_change", "conversion",
+    )
+
+    def __init__(self, play, outcome, yards=0, time_used=0, player=None):
+        self.play = play
+        self.outcome = outcome
+        self.detail = None
+        self.yards = yards
+        self.points = 0
+        self.time_used = time_used
+        self.player = player
+        self.target = None
+        self.defender = None
+        self.tackler = None
+        self.call_note = None
+        self.missed_tackle = False
+        self.broke_tackle = False
+        self.injuries = []
+        self.touchdown = False
+        self.safety = False
+        self.first_down = False
+        self.turnover_on_downs = False
+        self.possession_change = False
+        # None for normal plays, True/False for a 2-pt shootout attempt
+        self.conversion = None
+
+    @property
+    def is_turnover(self):
+        return self.outcome in TURNOVER_OUTCOMES
+
+    @property
+    def is_pass_attempt(self):
+        return self.outcome in PASS_ATTEMPT_OUTCOMES
+
+    def render(self):
+        """Builds the Rich-markup play description used by logs and the live UI."""
+        o = self.outcome
+        name = self.player.last_name if self.player else ""
+
+        # Plays that end the snap without any down/distance bookkeeping
+        if o == PUNT_BLOCKED: return "[bold red]PUNT BLOCKED![/bold red] Recovered by defense."
+        if o == FG_BLOCKED: return "[bold red]KICK BLOCKED![/bold red] Defense recovers!"
+        if o == PUNT: return f"Punt for {self.yards} yds."
+        if o == FG_GOOD: return f"{self.yards} yd FG [bold green]GOOD[/bold green]."
+        if o == FG_MISSED: return f"{self.yards} yd FG [bold red]MISSED[/bold red]."
+        if o == FUMBLE: text = f"[bold red]FUMBLE![/bold red] {name} loses the ball! Recovered by defense."
+        elif o == STRIP_SACK: text = f"[bold red]STRIP SACK![/bold red] {self.defender.last_name} knocks it loose! Defense ball."
+        elif o == INTERCEPTION: text = f"[bold red]INTERCEPTED[/bold red] by {self.defender.last_name}!"
+        else: text = None
+
+        if text is not None:
+            if self.conversion is False: text += " [red]2-PT FAILED[/red]"
+            return text
+
+        if o == RUN:
+            if self.detail == RUN_STUFFED: text = f"Stuffed by {self.tackler.last_name}!"
+            elif self.detail == RUN_MIDDLE: text = "Run up middle."
+            elif self.detail == RUN_BREAKAWAY: text = "[bold yellow]BREAKAWAY![/bold yellow]"
+            else: text = "Nice run!"
+            if self.missed_tackle: text += " Missed tackle!"
+            if self.broke_tackle: text += f" {name} runs through contact!"
+            yard_str = f"[green]{self.yards}[/green]" if self.yards > 0 else f"[red]{self.yards}[/red]"
+            text += f" {yard_str} yds.{CALL_NOTE_MARKUP.get(self.call_note, '')}"
+        elif o == SCRAMBLE:
+            text = f"Pressure! {name} scrambles for [green]{self.yards}[/green] yds."
+        elif o == SACK:
+            text = f"[bold red]SACK![/bold red] {self.defender.last_name} drops QB for [red]{self.yards}[/red]."
+        elif o == DROP:
+            text = f"Incomplete. {self.target.last_name} [red]DROPPED[/red] the pass!"
+        elif o == INCOMPLETE:
+            text = f"Incomplete pass to {self.target.last_name}."
+        else:
+            text = f"Pass to {self.target.last_name} for [green]{self.yards}[/green] yds."
+
+        if self.injuries:
+            text += " " + " ".join(render_injury(p, inj, lbl) for p, inj, lbl in self.injuries)
+
+        if self.touchdown:
+            if self.conversion: text += " [bold green]2-PT CONVERSION GOOD![/bold green]"
+            else: text += " [bold green]TOUCHDOWN![/bold green]"
+        elif self.safety:
+            text += " [bold red]SAFETY![/bold red]"
+        elif self.first_down:
+            text += " [cyan]1st Down![/cyan]"
+        elif self.turnover_on_downs:
+            text += " [magenta]Turnover on Downs![/magenta]"
+
+        if self.conversion is False: text += " [red]2-PT FAILED[/red]"
+        return text
+
+    def __str__(self):
+        return self.render()
+
+
+def render_injury(player, injury_name, severity):
+    if injury_name is None:
+        return f"[yellow]{player.last_name} shakes off a hit.[/yellow]"
+    return f"[bold red]{player.last_name} INJURED ({injury_name} - {severity})[/bold red]"
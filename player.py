@@ -2,6 +2,7 @@
 import random
 import uuid
 from traits import TRAITS
+from trait_flags import PLAYER_FLAGS
 
 # --- GEOGRAPHY DATA ---
 # Copied here to avoid circular imports with world_gen.py
@@ -82,7 +83,7 @@ class Player:
         self.perceived_potential = max(40, min(99, self.potential + self.hype_factor))
 
         self.history = []
-        self.traits = [] 
+        self.trait_flags = 0 # Bit flags, see trait_flags.py
 
         # Current Season Stats
         self.stats = {}
@@ -127,6 +128,34 @@ class Player:
         years = {1: "Fr", 2: "So", 3: "Jr", 4: "Sr"}
         return years.get(self.eligibility_year, "Sr+")
 
+    # --- TRAITS ---
+    @property
+    def traits(self):
+        """Trait names, derived from trait_flags. Use add_trait() to grant one."""
+        return PLAYER_FLAGS.names(self.trait_flags)
+
+    @traits.setter
+    def traits(self, names):
+        self.trait_flags = PLAYER_FLAGS.mask(names)
+
+    def has_trait(self, name):
+        return bool(self.trait_flags & PLAYER_FLAGS.bit(name))
+
+    def add_trait(self, name):
+        self.trait_flags |= PLAYER_FLAGS.bit(name)
+
+    def __getstate__(self):
+        # Saves store trait names so bit numbering can change between versions
+        state = self.__dict__.copy()
+        state["traits"] = list(self.traits)
+        del state["trait_flags"]
+        return state
+
+    def __setstate__(self, state):
+        names = state.pop("traits", [])
+        self.__dict__.update(state)
+        self.trait_flags = PLAYER_FLAGS.mask(names)
+
     def check_transfer_intent(self, school, depth_chart_rank):
         """
         Determines if a player wants to enter the transfer portal.
@@ -139,9 +168,7 @@ class Player:
         unhappiness = 0
         reason = ""
         
-        coach_traits = []
-        if school.coach:
-            coach_traits = getattr(school.coach, 'traits', [])
+        coach = school.coach
 
         # 1. THE "HOLLYWOOD" FACTOR (Too good for this school)
         # 4/5 Star player at a low prestige school
@@ -165,39 +192,39 @@ class Player:
         # --- TRAIT IMPACTS ---
         
         # Player Traits
-        if "Mercenary" in self.traits:
+        if self.has_trait("Mercenary"):
             if depth_chart_rank > 1:
                 unhappiness += 100 # GONE
                 reason = "Mercenary demands start"
             else:
                 unhappiness += 10 # Always looking
                 
-        if "Coach's Pet" in self.traits:
+        if self.has_trait("Coach's Pet"):
             unhappiness -= 40 # Very loyal
             
-        if "Homesick" in self.traits:
+        if self.has_trait("Homesick"):
             if self.home_region != school.region:
                 unhappiness += 30
                 reason = "Homesick"
                 
-        if "Fan Favorite" in self.traits:
+        if self.has_trait("Fan Favorite"):
             unhappiness -= 10
             
         # Coach Traits
-        if "Retention King" in coach_traits:
+        if coach and coach.has_trait("Retention King"):
             unhappiness -= 30
             
-        if "Player's Coach" in coach_traits:
+        if coach and coach.has_trait("Player's Coach"):
             unhappiness -= 20
             
-        if "Drill Sergeant" in coach_traits:
+        if coach and coach.has_trait("Drill Sergeant"):
             if depth_chart_rank > 1:
                 unhappiness += 15 # Backups hate hard practice
                 
         # 4. TAMPERING / CHAOS (Random Chance)
         # Even starters might leave if the bag is heavy
         tamper_chance = 0.05
-        if "Mercenary" in self.traits: tamper_chance = 0.15
+        if self.has_trait("Mercenary"): tamper_chance = 0.15
         
         if depth_chart_rank == 1 and random.random() < tamper_chance:
             unhappiness += 40
@@ -210,7 +237,7 @@ class Player:
 
         # MITIGATING FACTOR: LOYALTY
         # High loyalty reduces unhappiness
-        if "Team Captain" in self.traits: self.loyalty += 20
+        if self.has_trait("Team Captain"): self.loyalty += 20
         unhappiness -= (self.loyalty / 2)
         
         # Final Roll
@@ -287,7 +314,8 @@ class Player:
             self.attributes[attr] = int(max(1, min(99, val)))
 
     def assign_traits(self):
-        self.traits = []
+        self.trait_flags = 0
+        count = 0
         count_roll = random.randint(1, 100)
         
         if count_roll > 60: num_traits = 5
@@ -302,24 +330,21 @@ class Player:
             weights = [5, 15, 40, 40]   
 
         attempts = 0
-        while len(self.traits) < num_traits and attempts < 100:
+        while count < num_traits and attempts < 100:
             attempts += 1
             tier_choice = random.choices(["GOLD", "SILVER", "BRONZE", "RED"], weights=weights, k=1)[0]
             candidates = [k for k, v in TRAITS.items() if v["tier"] == tier_choice]
             if not candidates: continue
             
             new_trait_name = random.choice(candidates)
-            new_trait_data = TRAITS[new_trait_name]
+            new_bit = PLAYER_FLAGS.bit(new_trait_name)
             
-            has_conflict = False
-            if new_trait_name in self.traits: has_conflict = True
-            if not has_conflict:
-                for existing in self.traits:
-                    if existing in new_trait_data.get("conflicts", []): has_conflict = True
-                    if new_trait_name in TRAITS[existing].get("conflicts", []): has_conflict = True
+            # Duplicate, or conflicts with a held trait (declared by either side)
+            has_conflict = self.trait_flags & (new_bit | PLAYER_FLAGS.blocked[new_trait_name])
             
             if not has_conflict:
-                self.traits.append(new_trait_name)
+                self.trait_flags |= new_bit
+                count += 1
 
     def calculate_overall(self):
         weights = self.POSITION_WEIGHTS.get(self.position)
@@ -400,9 +425,9 @@ class Player:
         if self.weeks_injured > 0:
             rec_amt = 1
             # TRAIT: Wolverine Blood (Heals faster)
-            if "Wolverine Blood" in self.traits: rec_amt += 1
+            if self.has_trait("Wolverine Blood"): rec_amt += 1
             # TRAIT: Injury Prone (Heals slower)
-            if "Injury Prone" in self.traits and random.random() < 0.5: rec_amt = 0
+            if self.has_trait("Injury Prone") and random.random() < 0.5: rec_amt = 0
 
             self.weeks_injured -= rec_amt
             if self.weeks_injured <= 0:
@@ -412,7 +437,7 @@ class Player:
 
     def train(self, coach=None):
         # ... (Existing Lazy Trait Logic) ...
-        if "Lazy" in self.traits and random.random() < 0.5:
+        if self.has_trait("Lazy") and random.random() < 0.5:
             return
 
         # ... (Growth Chances Calculation logic remains the same) ...
@@ -423,8 +448,8 @@ class Player:
         if self.potential > 85: growth_chances += 3 
         if self.potential > 95: growth_chances += 5 
 
-        if "Gym Rat" in self.traits: growth_chances += 5 
-        if "Film Room Rat" in self.traits: growth_chances += 5 
+        if self.has_trait("Gym Rat"): growth_chances += 5 
+        if self.has_trait("Film Room Rat"): growth_chances += 5 
 
         if coach:
             # Use safe getattr incase Coach object is old version
@@ -462,8 +487,8 @@ class Player:
                 
                 # ... (Existing Cap Logic) ...
                 cap = 99
-                if attr_to_boost == "STR" and "Weight Room Hero" in self.traits: cap = 99
-                if attr_to_boost == "SPD" and "Weight Room Hero" in self.traits: cap = 90
+                if attr_to_boost == "STR" and self.has_trait("Weight Room Hero"): cap = 99
+                if attr_to_boost == "SPD" and self.has_trait("Weight Room Hero"): cap = 90
                 
                 # HS Caps
                 if self.context == "HS":
@@ -110,10 +110,9 @@ def calculate_interest_score(recruit, school, needs):
         score -= 200 # "No scholarship available"
 
     # 4. RANDOM FIT BIAS
-    random.seed(recruit.id + school.name)
-    fit_bonus = random.randint(-50, 100)
+    # Fixed per recruit/school pair, from its own generator so the global stream (and its seed) is left alone
+    fit_bonus = random.Random(recruit.id + school.name).randint(-50, 100)
     score += fit_bonus
-    random.seed() 
 
     # 5. COACH TRAITS & SCHEME FIT
     # (Delegates to the updated Coach.get_recruiting_bonus method)
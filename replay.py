@@ -0,0 +1,102 @@
+# replay.py
+#
+# Replays a finished game from its play log (play_log.PlayLog) in the watch
+# mode screen, without simulating anything: every record becomes one frame,
+# showing the situation of the snap, the play, and the score after it.
+# Replays can start at a quarter ("q3", "ot") or a drive ("d7") and
+# auto-advance at any speed.
+from play_log import PlayLog, SNAP, OT_SNAP, SHOOTOUT, OT_POSSESSION, SHOOTOUT_TEAM, DRIVE, MODES
+from live_view import LiveView
+from config import WATCH_DELAY
+
+
+class ReplayState:
+    """The parts of GameSim a LiveView reads, loaded from one play log record at a time."""
+    def __init__(self, log):
+        self.away, self.home = log.teams
+        self.stats = {self.home: {"score": 0}, self.away: {"score": 0}}
+        self.offense = self.away
+        self.is_overtime = False
+        self.ot_period = 0
+        self.quarter = 1
+        self.time_remaining = 900
+        self.down = 1
+        self.distance = 10
+        self.ball_on = 25
+        self.mode = "NORMAL"
+
+    def load(self, rec, teams):
+        kind = rec.kind
+        self.offense = teams[rec.offense]
+        self.is_overtime = kind in (OT_SNAP, SHOOTOUT) or (kind == DRIVE and rec.quarter == 0)
+        if self.is_overtime:
+            self.ot_period = rec.clock
+        else:
+            self.quarter, self.time_remaining = rec.quarter, rec.clock
+        if kind == DRIVE:
+            self.down, self.distance, self.ball_on, self.mode = 1, 10, rec.start, "NORMAL"
+        else:
+            self.down, self.distance, self.ball_on, self.mode = rec.down, rec.distance, rec.ball_on, MODES[rec.mode]
+        self.stats[self.home]["score"], self.stats[self.away]["score"] = rec.home_score, rec.away_score
+
+    def check_time_management(self):
+        return self.mode
+
+    def get_clock_str(self):
+        if self.is_overtime: return f"[yellow]OT{self.ot_period}[/yellow]" if self.ot_period > 0 else "[yellow]OT[/yellow]"
+        return f"{self.time_remaining // 60:02d}:{self.time_remaining % 60:02d}"
+
+    def get_field_pos_str(self):
+        pos = max(1, min(99, int(self.ball_on)))
+        if pos > 50: return f"opp {100 - pos}"
+        return f"own {pos}"
+
+
+class Replay:
+    def __init__(self, game):
+        self.game = game
+        self.log = game.game_log
+        self.frames = []    # (record, decoded play / injuries)
+        self.quarters = {}  # quarter (5 = overtime) -> first frame
+        self.drives = []    # first frame of each possession
+        new_drive = True
+        offense = None
+        for rec, res in self.log.events():
+            kind = rec.kind
+            if kind in (OT_POSSESSION, SHOOTOUT_TEAM): new_drive = True
+            if kind not in (SNAP, OT_SNAP, SHOOTOUT, DRIVE): continue
+            quarter = 5 if kind in (OT_SNAP, SHOOTOUT) or (kind == DRIVE and rec.quarter == 0) else rec.quarter
+            self.quarters.setdefault(quarter, len(self.frames))
+            if new_drive or kind == DRIVE or rec.offense != offense: self.drives.append(len(self.frames))
+            new_drive, offense = False, rec.offense
+            self.frames.append((rec, res))
+
+    @staticmethod
+    def available(game):
+        return isinstance(getattr(game, 'game_log', None), PlayLog) and len(game.game_log) > 0
+
+    def start_frame(self, where):
+        """Frame index for "q<n>", "ot" or "d<n>" (None / unknown = kickoff)."""
+        if not where: return 0
+        where = where.lower()
+        if where == "ot": return self.quarters.get(5, 0)
+        try: n = int(where[1:])
+        except ValueError: return 0
+        if where[0] == "q": return self.quarters.get(n, 0)
+        if where[0] == "d" and 1 <= n <= len(self.drives): return self.drives[n - 1]
+        return 0
+
+    def play(self, console, where=None, delay=WATCH_DELAY):
+        """Shows the game from `where` in the watch screen."""
+        state = ReplayState(self.log)
+        view = LiveView(state, console, delay=delay)
+        view.start()
+        try:
+            for rec, res in self.frames[self.start_frame(where):]:
+                state.load(rec, self.log.teams)
+                # DriveSim games replay one line per drive
+                view.show(self.log.render(rec, res) if rec.kind == DRIVE else res.render())
+            g = self.game
+            view.update(f"FINAL: {g.away_team.name} {g.away_score} - {g.home_team.name} {g.home_score}")
+        finally:
+            view.stop()
@@ -1,4 +1,5 @@
 import random
+import hashlib
 from player import Player
 from coach import Coach
 from rankings import calculate_rpi  # Required for Seeding
@@ -55,6 +56,12 @@ class Game:
         self.home_score = 0
         self.away_score = 0
         self.game_log = [] 
+        self.summary = None # Compact stat summary filled in by GameSim
+        self.box_score = None # Per-player stat lines (box_score.BoxScore), kept after the game
+        self.drives = []    # drive_result.DriveResult per possession
+        self.season = None  # Year the game was played in
+        self.seed = None    # Seed of the game's RNG stream, set when it is simulated
+        self.odds = None    # (favorite, win probability) shown on the schedule before kickoff
         self.title = title 
         
         self.export_log = False 
@@ -68,6 +75,18 @@ class Game:
         label = f" [{self.title}]" if self.title else ""
         return f"W{self.week}{label}: {self.away_team.name} @ {self.home_team.name}"
 
+def game_seed(universe_seed, year, game):
+    """Stable 64-bit seed from the universe seed and the game's identity."""
+    key = f"{universe_seed}|{year}|{game.week}|{game.home_team.name}|{game.away_team.name}|{game.title}"
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "big")
+
+def seed_game(universe, game):
+    """Gives an unplayed game its own RNG seed, independent of what was simulated before it."""
+    if getattr(game, 'seed', None) is None:
+        game.season = universe.year
+        game.seed = game_seed(universe.seed, universe.year, game)
+    return game.seed
+
 def generate_schedule(schools):
     """
     Main entry point. Detects if we are scheduling High School (Regions) 
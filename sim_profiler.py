@@ -0,0 +1,107 @@
+# sim_profiler.py
+#
+# Opt-in profiling for the game engines. While PROFILER is active, every new
+# GameSim / DriveSim has its hot stages (play calling, target selection,
+# depth chart lookups, fatigue/injury, stamina recovery, play log writes...)
+# wrapped with timers, and optionally the whole game runs under cProfile.
+# Timings add up across games until reset(), so a week or a season can be
+# reported in one go; dump() also writes a .pstats file for standard tools
+# (snakeviz, gprof2dot, flameprof).
+#
+# Set SIM_PROFILE=<path prefix> to profile from startup: the report is written
+# after every simulated week (see logic.simulate_week). Profiled weeks are
+# played sequentially.
+import cProfile
+import io
+import pstats
+import time
+
+from config import SIM_PROFILE
+
+# Engine methods timed per call (whichever the engine has). Times are inclusive:
+# resolve_play contains the stages it calls.
+STAGES = (
+    "call_plays", "resolve_play", "resolve_pass_target", "get_active_player", "get_active_cards",
+    "process_fatigue_and_injury", "recover_stamina_step",
+    "play_drive", "_hand_out", "_roll_injuries",
+)
+# PlayLog writes (records, headers) and text rendering
+LOG_STAGES = ("snap", "header", "drive", "render")
+
+
+class SimProfiler:
+    def __init__(self):
+        self.active = False
+        self.profile = None
+        self.reset()
+
+    def reset(self):
+        self.stages = {}    # stage -> [calls, seconds]
+        self.games = {}     # engine name -> [games, seconds]
+        if self.profile is not None: self.profile = cProfile.Profile()
+
+    def start(self, cprofile=False):
+        self.active = True
+        if cprofile and self.profile is None: self.profile = cProfile.Profile()
+
+    def stop(self):
+        self.active = False
+
+    # --- HOOKS ---
+    def _timed(self, name, fn):
+        stat = self.stages.setdefault(name, [0, 0.0])
+        clock = time.perf_counter
+        def timed(*args, **kwargs):
+            t = clock()
+            try: return fn(*args, **kwargs)
+            finally:
+                stat[0] += 1
+                stat[1] += clock() - t
+        return timed
+
+    def attach(self, sim):
+        """Wraps a freshly built engine's stages (instance attributes only, the class is untouched)."""
+        for name in STAGES:
+            if hasattr(sim, name): setattr(sim, name, self._timed(name, getattr(sim, name)))
+        log = getattr(sim, "log", None)
+        for name in LOG_STAGES:
+            if hasattr(log, name): setattr(log, name, self._timed(f"log.{name}", getattr(log, name)))
+
+        engine = type(sim).__name__
+        play_game = sim.play_game
+        def profiled_game():
+            stat = self.games.setdefault(engine, [0, 0.0])
+            t = time.perf_counter()
+            if self.profile: self.profile.enable()
+            try: return play_game()
+            finally:
+                if self.profile: self.profile.disable()
+                stat[0] += 1
+                stat[1] += time.perf_counter() - t
+        sim.play_game = profiled_game
+
+    # --- OUTPUT ---
+    def report(self):
+        """Plain-text report: time per engine and per stage."""
+        total = sum(s for _, s in self.games.values()) or 1e-9
+        lines = ["SIM PROFILE", "=" * 72]
+        for engine, (games, secs) in sorted(self.games.items()):
+            lines.append(f"{engine:<12} {games:>7} games  {secs:9.3f} s  {secs / max(1, games) * 1000:8.2f} ms/game")
+        lines += ["", f"{'Stage':<30}{'Calls':>10}{'Total s':>10}{'% game':>9}{'us/call':>10}", "-" * 72]
+        for name, (calls, secs) in sorted(self.stages.items(), key=lambda kv: -kv[1][1]):
+            if not calls: continue
+            lines.append(f"{name:<30}{calls:>10}{secs:>10.3f}{secs / total * 100:>8.1f}%{secs / calls * 1e6:>10.2f}")
+        if self.profile and self.games:
+            out = io.StringIO()
+            pstats.Stats(self.profile, stream=out).sort_stats("cumulative").print_stats(25)
+            lines += ["", "cProfile (top 25 by cumulative time)", out.getvalue()]
+        return "\n".join(lines)
+
+    def dump(self, prefix):
+        """Writes <prefix>.txt (report) and, with cProfile on, <prefix>.pstats."""
+        with open(f"{prefix}.txt", "w") as f: f.write(self.report())
+        if self.profile and self.games: self.profile.dump_stats(f"{prefix}.pstats")
+
+
+PROFILER = SimProfiler()
+if SIM_PROFILE: PROFILER.start(cprofile=True)
@@ -1,3 +1,7 @@
+import json
+
+from config import PLAYBOOK_FILE
+
 # --- FORMATIONS ---
 FORMATIONS_OFF = [
     "I-Formation", "Singleback", "Shotgun", "Pistol", "Empty Set", "Goal Line"
@@ -68,4 +72,106 @@ DEF_STRATEGIES = {
     "BLITZ_ZONE":  {"desc": "Zone Blitz",     "bonus_vs": ["PASS_STD", "RUN_DRAW"],   "weak_vs": ["PASS_QUICK", "RUN_POWER"]},
     "BLITZ_HEAVY": {"desc": "All Out Blitz",  "bonus_vs": ["RUN_ZONE", "RUN_POWER"],  "weak_vs": ["PASS_SCREEN", "PASS_PA"]},
     "GOAL_LINE":   {"desc": "Goal Line Stand","bonus_vs": ["RUN_POWER", "RUN_ZONE"],  "weak_vs": ["PASS_PA", "PASS_QUICK"]},
-}
\ No newline at end of file
+}
+
+# --- COMPILED PLAYBOOK ---
+# The engine never looks plays up by name on a snap. At import the tables
+# above (or a playbook data file, see PLAYBOOK_FILE in config) are validated
+# once and compiled into integer codes: every per-play value is a tuple indexed
+# by play code and the strategy counters are an offense x defense matrix.
+
+# Calls the engine makes itself; always compiled after the playbook's plays
+SPECIAL_OFF = ("PUNT", "FIELD_GOAL")
+SPECIAL_DEF = ("RETURN", "BLOCK")
+
+# Plays and strategies the play caller uses by name; a playbook must define them
+REQUIRED_OFF = ("RUN_POWER", "RUN_ZONE", "RUN_DRAW", "PASS_QUICK", "PASS_SCREEN", "PASS_STD", "PASS_PA", "PASS_DEEP")
+REQUIRED_DEF = ("COVER_2", "COVER_3", "MAN_1", "BLITZ_ZONE", "BLITZ_HEAVY", "GOAL_LINE")
+
+# Receiver slots a route can be run from, in target-scan order
+RECEIVER_SLOTS = ("WR", "WR", "TE", "RB")
+DEFAULT_ROUTES = {"WR": ("Route", 10)}
+
+STRAT_READ, STRAT_GREAT = -15, 15   # defense guessed right / wrong
+
+
+def validate_playbook(off_plays, def_strategies):
+    """Raises ValueError describing every problem found in a playbook."""
+    errors = []
+    for key in REQUIRED_OFF:
+        if key not in off_plays: errors.append(f"missing offensive play {key}")
+    for key in REQUIRED_DEF:
+        if key not in def_strategies: errors.append(f"missing defensive strategy {key}")
+    for key, play in off_plays.items():
+        if key in SPECIAL_OFF: errors.append(f"{key}: reserved play name")
+        if play.get("type") not in ("RUN", "PASS"): errors.append(f"{key}: type must be RUN or PASS")
+        if not isinstance(play.get("time"), int) or play["time"] <= 0: errors.append(f"{key}: time must be a positive int")
+        for pos, route in play.get("routes", {}).items():
+            if pos not in RECEIVER_SLOTS: errors.append(f"{key}: no receiver slot {pos}")
+            elif len(route) != 2 or not isinstance(route[1], (int, float)): errors.append(f"{key}: route for {pos} must be (name, priority)")
+    for key, strat in def_strategies.items():
+        if key in SPECIAL_DEF: errors.append(f"{key}: reserved strategy name")
+        bonus, weak = strat.get("bonus_vs", []), strat.get("weak_vs", [])
+        for other in list(bonus) + list(weak):
+            if other not in off_plays: errors.append(f"{key}: counters unknown play {other}")
+        for other in set(bonus) & set(weak):
+            errors.append(f"{key}: {other} is both bonus_vs and weak_vs")
+    if errors: raise ValueError("Invalid playbook:\n  " + "\n  ".join(errors))
+
+
+class Playbook:
+    def __init__(self, off_plays, def_strategies):
+        validate_playbook(off_plays, def_strategies)
+        self.off_keys = tuple(off_plays) + SPECIAL_OFF
+        self.def_keys = tuple(def_strategies) + SPECIAL_DEF
+        self.off = {k: i for i, k in enumerate(self.off_keys)}     # name -> code
+        self.defense = {k: i for i, k in enumerate(self.def_keys)}
+
+        plays = [off_plays[k] for k in off_plays]
+        self.is_run = tuple(p["type"] == "RUN" for p in plays) + (False, False)
+        self.is_pass = tuple(p["type"] == "PASS" for p in plays) + (False, False)
+        self.time = tuple(p["time"] for p in plays) + (15, 5)
+        self.desc = tuple(p.get("desc", k) for k, p in off_plays.items()) + ("Punt", "Field Goal")
+        # Air yards before YAC on a completion
+        self.base_yards = tuple(
+            p.get("base_yards", 20 if "DEEP" in k else (10 if "STD" in k else 4)) for k, p in off_plays.items()
+        ) + (0, 0)
+
+        # Routes: (position, route, priority) per play; blockers are left out
+        self.routes = tuple(
+            tuple((pos, r[0], r[1]) for pos, r in p.get("routes", DEFAULT_ROUTES).items() if r[0] != "Block")
+            if p["type"] == "PASS" else ()
+            for p in plays
+        ) + ((), ())
+        # Route priority per receiver slot (None = not in the pattern)
+        self.route_priority = tuple(
+            tuple(next((prio for pos, _, prio in routes if pos == slot), None) for slot in RECEIVER_SLOTS)
+            for routes in self.routes
+        )
+
+        self.is_zone = tuple(
+            s.get("zone", "COVER" in k or "ZONE" in k) for k, s in def_strategies.items()
+        ) + (False, False)
+
+        # Strategy counters: matchup[off][def] -> strat modifier
+        matchup = [[0] * len(self.def_keys) for _ in self.off_keys]
+        for d, strat in enumerate(def_strategies.values()):
+            for k in strat.get("bonus_vs", []): matchup[self.off[k]][d] = STRAT_READ
+            for k in strat.get("weak_vs", []): matchup[self.off[k]][d] = STRAT_GREAT
+        self.matchup = tuple(tuple(row) for row in matchup)
+
+
+def load_playbook(path):
+    """Reads a JSON playbook ({"offense": {...}, "defense": {...}}, shaped like the tables above)."""
+    with open(path) as f:
+        data = json.load(f)
+    off_plays = data.get("offense", {})
+    for play in off_plays.values():
+        if "routes" in play: play["routes"] = {pos: tuple(r) for pos, r in play["routes"].items()}
+    return off_plays, data.get("defense", {})
+
+
+if PLAYBOOK_FILE:
+    OFF_PLAYS, DEF_STRATEGIES = load_playbook(PLAYBOOK_FILE)
+
+PLAYBOOK = Playbook(OFF_PLAYS, DEF_STRATEGIES)
@@ -0,0 +1,193 @@
+# team_snapshot.py
+#
+# Frozen per-game view of a team, built by GameSim at kickoff.
+# Attributes and traits never change during a game, so every rating the play
+# engine needs (composite blocking/run-stop/separation/coverage numbers, trait
+# flags) is computed once per player here instead of on every snap.
+# Only availability changes mid-game (fatigue, injuries); that is tracked per
+# player and only invalidates the cached units of that player's position.
+#
+# Stamina recovery is lazy: the snapshot counts snaps, and the recovery a
+# player is owed since they were last touched is applied when their stamina
+# is next read. A tired player's return to FRESH happens on a snap that is
+# known in advance, so those are kept in a heap keyed by that snap.
+#
+# Each position keeps its fresh and tired players as two lists in depth
+# chart order, updated only when a player changes state; a unit is then
+# just a slice of those lists.
+import heapq
+from bisect import insort
+
+from trait_flags import PLAYER_FLAGS
+
+IRON_MAN = PLAYER_FLAGS.bit("Iron Man")
+ROUTE_TECHNICIAN = PLAYER_FLAGS.bit("Route Technician")
+
+# Availability states
+FRESH, TIRED, INJURED = 0, 1, 2
+
+RECOVERY_PER_SNAP = 4
+
+
+class PlayerCard:
+    """Precomputed game ratings for one player. `line` is the player's row in the game's BoxScore."""
+    __slots__ = (
+        "player", "owner", "position", "rank", "state", "due", "last_name", "line", "trait_flags", "fatigue_floor", "tick",
+        "spd", "str", "agi", "int", "acc", "cth", "blk", "tkl", "dur",
+        "run_block", "run_stop", "separation", "coverage", "escape",
+    )
+
+    def __init__(self, player, position, rank, owner, line):
+        a = player.attributes
+        self.player = player
+        self.owner = owner
+        self.position = position
+        self.rank = rank        # index in the position's depth chart
+        self.state = None
+        self.due = None         # snap on which a TIRED player becomes FRESH again
+        self.last_name = player.last_name
+        self.line = line
+        self.tick = 0   # snap count at which player.stamina was last brought up to date
+        self.trait_flags = player.trait_flags
+        # TRAIT: Iron Man (Ignores fatigue minimums slightly)
+        self.fatigue_floor = 15 if self.trait_flags & IRON_MAN else 25
+
+        self.spd = a["SPD"]; self.str = a["STR"]; self.agi = a["AGI"]; self.int = a["INT"]
+        self.acc = a["ACC"]; self.cth = a["CTH"]; self.blk = a["BLK"]; self.tkl = a["TKL"]
+        self.dur = a.get("DUR", 75)
+
+        # Composite ratings used in the trenches and in coverage
+        self.run_block = self.str + self.blk            # OL: STR + BLK
+        self.run_stop = self.str + self.tkl             # DL: STR + TKL
+        self.separation = (self.spd * 0.45) + (self.agi * 0.55)
+        # TRAIT: Route Technician (Separation bonus)
+        if self.trait_flags & ROUTE_TECHNICIAN: self.separation += 10
+        self.coverage = (self.spd * 0.50) + (self.int * 0.50)
+        self.escape = (self.spd * 0.6) + (self.agi * 0.4)
+
+
+def _by_rank(card):
+    return card.rank
+
+
+class TeamSnapshot:
+    def __init__(self, team, box):
+        self.team = team
+        self.depth = {}     # position -> tuple of PlayerCards in depth chart order
+        self.cards = {}     # player -> PlayerCard
+        self._fresh = {}    # position -> FRESH cards in depth chart order
+        self._tired = {}    # position -> TIRED cards in depth chart order
+        self._recovery = [] # heap of (due snap, seq, card)
+        self._seq = 0
+        self.tick = 0
+        for pos, players in team.depth_chart.items():
+            self.depth[pos] = tuple(PlayerCard(p, pos, i, self, box.row(p)) for i, p in enumerate(players))
+            self._fresh[pos] = []
+            self._tired[pos] = []
+            for card in self.depth[pos]:
+                self.cards[card.player] = card
+                self._set_state(card, self._availability(card))
+        self._units = {}    # (position, count) -> tuple of cards
+        self._sums = {}     # (position, count, rating) -> summed rating (OR'd trait flags) of that unit
+
+    @staticmethod
+    def _availability(card):
+        p = card.player
+        if p.weeks_injured > 0: return INJURED
+        return FRESH if p.stamina > card.fatigue_floor else TIRED
+
+    def card(self, player):
+        return self.cards.get(player)
+
+    # --- STAMINA ---
+    def stamina(self, card):
+        """Current stamina, after applying the recovery owed since the card was last touched."""
+        p = card.player
+        gap = self.tick - card.tick
+        if gap:
+            card.tick = self.tick
+            if p.weeks_injured == 0 and p.stamina < 100:
+                p.stamina = min(100, p.stamina + RECOVERY_PER_SNAP * gap)
+        return p.stamina
+
+    def advance(self):
+        """One snap of rest for everybody. Wakes up the tired players due back this snap."""
+        self.tick += 1
+        heap = self._recovery
+        while heap and heap[0][0] <= self.tick:
+            due, _, card = heapq.heappop(heap)
+            if card.due != due: continue    # rescheduled or no longer tired
+            self.stamina(card)
+            self.refresh(card)
+
+    def settle(self):
+        """Writes owed recovery back to every player (end of game)."""
+        for card in self.cards.values(): self.stamina(card)
+
+    def unit(self, position, count=1):
+        """Active players at a position, same rules as the old depth chart scan."""
+        key = (position, count)
+        unit = self._units.get(key)
+        if unit is None:
+            unit = self._units[key] = self._build_unit(position, count)
+        return unit
+
+    def _build_unit(self, position, count):
+        # Fresh players first, topped up with tired ones; if everyone is hurt, the starter plays
+        fresh = self._fresh.get(position, ())
+        active = fresh[:count]
+        if len(active) < count:
+            active += self._tired[position][:count - len(active)]
+        if not active and self.depth.get(position):
+            active = [self.depth[position][0]]
+        return tuple(active)
+
+    def unit_sum(self, position, count, rating):
+        """Sum of a card rating over the current unit (cached until the unit changes)."""
+        key = (position, count, rating)
+        total = self._sums.get(key)
+        if total is None:
+            total = self._sums[key] = sum(getattr(c, rating) for c in self.unit(position, count))
+        return total
+
+    def unit_flags(self, position, count):
+        """Trait flags of the current unit OR'd together ("does anyone in the unit have X")."""
+        key = (position, count, "trait_flags")
+        flags = self._sums.get(key)
+        if flags is None:
+            flags = 0
+            for c in self.unit(position, count): flags |= c.trait_flags
+            self._sums[key] = flags
+        return flags
+
+    def refresh(self, card):
+        """Re-checks one player's availability; drops cached units for that position only."""
+        new_state = self._availability(card)
+        if new_state != card.state:
+            self._set_state(card, new_state)
+            self.invalidate(card.position)
+        elif new_state == TIRED:
+            self._schedule(card)
+
+    def _set_state(self, card, new_state):
+        pos = card.position
+        if card.state == FRESH: self._fresh[pos].remove(card)
+        elif card.state == TIRED: self._tired[pos].remove(card)
+        card.state = new_state
+        card.due = None
+        if new_state == FRESH: insort(self._fresh[pos], card, key=_by_rank)
+        elif new_state == TIRED:
+            insort(self._tired[pos], card, key=_by_rank)
+            self._schedule(card)
+
+    def _schedule(self, card):
+        # First snap on which recovery lifts stamina above the fatigue floor
+        due = self.tick + (card.fatigue_floor - card.player.stamina) // RECOVERY_PER_SNAP + 1
+        if due != card.due:
+            card.due = due
+            self._seq += 1
+            heapq.heappush(self._recovery, (due, self._seq, card))
+
+    def invalidate(self, position):
+        for key in [k for k in self._units if k[0] == position]: del self._units[key]
+        for key in [k for k in self._sums if k[0] == position]: del self._sums[key]
@@ -0,0 +1,53 @@
+# trait_flags.py
+#
+# Interns trait names into integer bit flags. Players and coaches store their
+# traits as one int (`trait_flags`); the old list of names is derived from it
+# on demand. Every trait check is then a single `flags & bit` test and
+# conflict checks are mask operations.
+from traits import TRAITS
+from coach_traits import COACH_TRAITS
+
+
+class TraitRegistry:
+    def __init__(self, catalog, conflict_key):
+        self.bits = {}      # name -> bit
+        self.order = []     # bit index -> name
+        for name in catalog: self.bit(name)
+
+        # conflicts: what a trait itself declares.
+        # blocked: declared in either direction (A lists B or B lists A).
+        self.conflicts = {}
+        self.blocked = {}
+        for name, data in catalog.items():
+            mask = self.mask(data.get(conflict_key, []))
+            self.conflicts[name] = mask
+            self.blocked[name] = self.blocked.get(name, 0) | mask
+            for other in data.get(conflict_key, []):
+                self.blocked[other] = self.blocked.get(other, 0) | self.bits[name]
+
+    def bit(self, name):
+        """Bit for a trait name. Names outside the catalog are interned on first use."""
+        b = self.bits.get(name)
+        if b is None:
+            b = self.bits[name] = 1 << len(self.order)
+            self.order.append(name)
+        return b
+
+    def mask(self, names):
+        m = 0
+        for name in names: m |= self.bit(name)
+        return m
+
+    def names(self, flags):
+        """Trait names set in `flags`, in catalog order."""
+        out = []
+        i = 0
+        while flags:
+            if flags & 1: out.append(self.order[i])
+            flags >>= 1
+            i += 1
+        return tuple(out)
+
+
+PLAYER_FLAGS = TraitRegistry(TRAITS, "conflicts")
+COACH_FLAGS = TraitRegistry(COACH_TRAITS, "conflict")
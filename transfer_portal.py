@@ -159,12 +159,12 @@ def resolve_portal_destinations(universe, portal_pool, silent=False):
                 score += 150
             
             # Coach Traits
-            coach_traits = getattr(school.coach, 'traits', [])
-            if "Portal Shark" in coach_traits: score += 150
-            if "Mercenary Hunter" in coach_traits and player.eligibility_year == 3: score += 200
-            if "Pipeline: South" in coach_traits and player.home_region == "SOUTH": score += 100
-            if "Pipeline: North" in coach_traits and player.home_region == "NORTH": score += 100
-            if "Pipeline: West" in coach_traits and player.home_region == "WEST": score += 100
+            coach = school.coach
+            if coach and coach.has_trait("Portal Shark"): score += 150
+            if coach and coach.has_trait("Mercenary Hunter") and player.eligibility_year == 3: score += 200
+            if coach and coach.has_trait("Pipeline: South") and player.home_region == "SOUTH": score += 100
+            if coach and coach.has_trait("Pipeline: North") and player.home_region == "NORTH": score += 100
+            if coach and coach.has_trait("Pipeline: West") and player.home_region == "WEST": score += 100
 
             score += random.randint(0, 100)
             
@@ -232,7 +232,7 @@ def resolve_portal_destinations(universe, portal_pool, silent=False):
                 if cuts_made >= num_to_cut:
                     break
                 
-                if "Fan Favorite" in candidate.traits:
+                if candidate.has_trait("Fan Favorite"):
                     continue # Saved by the fans
                 
                 # CUT LOGIC
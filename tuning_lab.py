@@ -1,21 +1,43 @@
+import copy
+import csv
+import itertools
+import json
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist, variance
+
 from game_sim import GameSim
 from player import Player
 from coach import Coach
-from tactics import OFF_PLAYS, DEF_STRATEGIES
+from tactics import PLAYBOOK, DEF_STRATEGIES
+from engine_tuning import PARAMS, TUNING, EngineTuning
+from league_manager import SAVE_FILE, load_league
+import play_result as pr
+
+# Snaps per simulated game: every GAME_SNAPS snaps the lab kicks off a fresh GameSim
+# with healthy players, so fatigue and injuries stay at the scale of one game
+GAME_SNAPS = 70
+# Every snap is 1st & 10 from here, with the test offense on the field
+SNAP_SPOT = 25
+# Defensive strategy "MIX": a random strategy every snap (the default)
+DEF_MIX = "MIX"
+# Real-team fixtures are grouped by team overall in buckets this wide (70 = 70-74)
+FIXTURE_BUCKET = 5
 
 # --- MOCK CLASSES TO ISOLATE THE MATH ---
 class MockTeam:
-    def __init__(self, name, off_rating, def_rating):
+    def __init__(self, name, off_rating, def_rating, run_pass_bias=None):
         self.name = name
         self.coach = Coach("Test", "Coach")
-        self.coach.run_pass_bias = 5
+        self.coach.run_pass_bias = 5 if run_pass_bias is None else run_pass_bias
         self.coach.aggressiveness = 5
-        
+        self.coach.trait_flags = 0
+
         # Create a dummy depth chart with specific ratings
         self.depth_chart = {}
         positions = ["QB", "RB", "WR", "TE", "OL", "DL", "LB", "DB", "K", "P"]
-        
+
         for pos in positions:
             self.depth_chart[pos] = []
             for _ in range(5):
@@ -25,118 +47,556 @@ class MockTeam:
                 for attr in p.attributes:
                     p.attributes[attr] = rating_val
                 p.overall = p.calculate_overall()
+                # No traits: results depend on the ratings alone (and on the seed)
+                p.trait_flags = 0
                 self.depth_chart[pos].append(p)
+        self.roster = [p for chart in self.depth_chart.values() for p in chart]
 
 class MockGame:
-    def __init__(self):
-        self.home_team = MockTeam("Home", 75, 75) 
-        self.away_team = MockTeam("Away", 75, 75)
+    def __init__(self, home=None, away=None, seed=None):
+        self.home_team = home or MockTeam("Home", 75, 75)
+        self.away_team = away or MockTeam("Away", 75, 75)
         self.export_log = False
         self.week = 1
+        self.seed = seed
+
+# --- REAL-TEAM FIXTURES ---
+# Teams from a save file or a generated universe, so experiments see real
+# attribute spreads, depth charts, traits and coaches. Fixtures are copies: the
+# lab never touches the universe they came from. In fixture mode a cell's
+# offense/defense "ratings" name buckets of team overall, and every block of
+# GAME_SNAPS snaps draws a new offense and defense from those buckets.
+class FixtureTeam:
+    """Copy of a team's roster, depth chart and coach."""
+    def __init__(self, team):
+        self.name = team.name
+        self.overall = team.team_overall
+        self.coach = copy.copy(team.coach)
+        self.run_pass_bias = team.coach.run_pass_bias
+        self.roster, self.depth_chart = copy.deepcopy((team.roster, team.depth_chart))
+
+class Fixtures:
+    def __init__(self, teams, width=FIXTURE_BUCKET):
+        self.width = width
+        self.buckets = {}   # bucket (lowest overall) -> [FixtureTeam]
+        for team in teams:
+            if not team.roster or team.coach is None: continue
+            fixture = FixtureTeam(team)
+            self.buckets.setdefault(self.bucket(fixture.overall), []).append(fixture)
+
+    def bucket(self, rating):
+        return rating // self.width * self.width
+
+    def teams(self, rating):
+        teams = self.buckets.get(self.bucket(rating))
+        if not teams: raise ValueError(f"No fixture teams rated {self.label(rating)} (have {self.describe()})")
+        return teams
+
+    def label(self, rating):
+        low = self.bucket(rating)
+        return f"{low}-{low + self.width - 1}"
+
+    def typical(self):
+        """The bucket with the most teams."""
+        return max(self.buckets, key=lambda b: len(self.buckets[b]))
+
+    def describe(self):
+        return ", ".join(f"{self.label(b)}: {len(t)}" for b, t in sorted(self.buckets.items()))
+
+def fixtures_from_universe(universe, league="COLLEGE", width=FIXTURE_BUCKET):
+    """Fixtures from a universe's "COLLEGE", "HS" or "ALL" teams."""
+    teams = []
+    if league in ("COLLEGE", "ALL"): teams += universe.college_league
+    if league in ("HS", "ALL"): teams += universe.high_school_league
+    return Fixtures(teams, width)
+
+def load_fixtures(path=SAVE_FILE, league="COLLEGE", width=FIXTURE_BUCKET):
+    universe = load_league(path)
+    if universe is None: raise ValueError(f"Could not load a league from {path}")
+    return fixtures_from_universe(universe, league, width)
+
+# Fixtures in use in this process (None = MockTeams). Workers get them once, from the pool initializer.
+_fixtures = None
+
+def _use_fixtures(fixtures):
+    global _fixtures
+    _fixtures = fixtures
+
+def _pool(workers, fixtures):
+    return ProcessPoolExecutor(max_workers=workers, initializer=_use_fixtures, initargs=(fixtures,))
+
+def _run_jobs(jobs, workers, fixtures):
+    _use_fixtures(fixtures)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        with _pool(workers, fixtures) as pool:
+            return list(pool.map(_run_job, jobs))
+    return [_run_job(job) for job in jobs]
+
+# --- SIMULATION ---
+def _kickoff(offense, defense, seed, tuning):
+    """Fresh GameSim for the next block of snaps; the lab's players start it healthy and rested."""
+    for team in (offense, defense):
+        for p in team.roster:
+            p.stamina = 100
+            p.weeks_injured = 0
+            p.injury_type = None
+    return GameSim(MockGame(home=defense, away=offense, seed=seed), headless=True, tuning=tuning)
+
+def _reset_snap(sim, offense, defense):
+    # Turnovers and scores hand the ball over inside resolve_play; every snap starts from the same spot
+    sim.offense, sim.defense = offense, defense
+    sim.down, sim.distance, sim.ball_on = 1, 10, SNAP_SPOT
+
+def simulate_plays(sim_count=1000, off_rating=75, def_rating=75, run_pass_bias=None, def_strategy=DEF_MIX, seed=None, tuning=None,
+                   paired=False, fixtures=None):
+    """
+    Runs sim_count snaps of an `off_rating` offense against a `def_rating` defense,
+    half runs and half passes, and returns the raw counts. `run_pass_bias` is the
+    offensive coach's (scheme bonuses; None = 5, or each real coach's own);
+    `def_strategy` fixes the defensive call;
+    `tuning` is the engine's EngineTuning (default TUNING). The same seed always
+    gives the same counts.
+
+    `paired` reseeds the engine's RNG before every snap, so two tunings run on
+    one seed see the same calls and the same draws on each snap, even after
+    their results have diverged (common random numbers).
+
+    With `fixtures` the ratings pick buckets of real teams instead of building
+    MockTeams (see Fixtures).
+    """
+    rng = random.Random(seed)
+    if fixtures is None:
+        offense = MockTeam("Offense", off_rating, 75, run_pass_bias)
+        defense = MockTeam("Defense", 75, def_rating)
+    else:
+        offenses, defenses = fixtures.teams(off_rating), fixtures.teams(def_rating)
+        if len(offenses) == 1 and offenses == defenses:
+            raise ValueError(f"Only one fixture team rated {fixtures.label(off_rating)}")
 
-def run_tuning_test(sim_count=1000, off_rating=75, def_rating=75):
-    print(f"\n--- RUNNING SIMULATION: Offense {off_rating} OVR vs Defense {def_rating} OVR ---")
-    
-    # Setup
-    game = MockGame()
-    game.home_team = MockTeam("Defense", 75, def_rating)
-    game.away_team = MockTeam("Offense", off_rating, 75)
-    
-    sim = GameSim(game)
-    sim.offense = game.away_team
-    sim.defense = game.home_team
-    
     results = {
         "runs": 0, "run_yds": 0, "breakaways": 0, "stuffed": 0,
         "passes": 0, "completions": 0, "pass_yds": 0, "sacks": 0, "ints": 0,
         "scrambles": 0
     }
-    
-    print(f"Simulating {sim_count} plays...")
-    
+
     # Lists for random selection
-    run_plays = [k for k,v in OFF_PLAYS.items() if v["type"] == "RUN"]
-    pass_plays = [k for k,v in OFF_PLAYS.items() if v["type"] == "PASS"]
-    def_plays = list(DEF_STRATEGIES.keys())
+    run_plays = [code for code, is_run in enumerate(PLAYBOOK.is_run) if is_run]
+    pass_plays = [code for code, is_pass in enumerate(PLAYBOOK.is_pass) if is_pass]
+    if def_strategy == DEF_MIX: def_plays = [PLAYBOOK.defense[k] for k in DEF_STRATEGIES]
+    else: def_plays = [PLAYBOOK.defense[def_strategy]]
+
+    sim = None
+    for i in range(sim_count):
+        if i % GAME_SNAPS == 0:
+            if fixtures is not None:
+                offense = rng.choice(offenses)
+                defense = rng.choice([t for t in defenses if t is not offense])
+                offense.coach.run_pass_bias = offense.run_pass_bias if run_pass_bias is None else run_pass_bias
+            sim = _kickoff(offense, defense, rng.getrandbits(64), tuning)
+        _reset_snap(sim, offense, defense)
+        if paired: sim.rng.seed(rng.getrandbits(64))
 
-    for _ in range(sim_count):
         # Alternate run/pass
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             # RUN TEST
-            off_key = random.choice(run_plays) 
-            def_key = random.choice(def_plays)
-            desc, score, time = sim.resolve_play(off_key, def_key, "NORMAL")
-            
+            off_code = rng.choice(run_plays)
+            def_code = rng.choice(def_plays)
+            result = sim.resolve_play(off_code, def_code, "NORMAL")
+
             results["runs"] += 1
-            if "SACK" in desc or "Pressure" in desc:
-                pass 
-            else:
-                try:
-                    words = desc.split()
-                    for i, w in enumerate(words):
-                        if "yds" in w or "yds." in w:
-                            yds = int(words[i-1])
-                            results["run_yds"] += yds
-                            if yds <= 0: results["stuffed"] += 1
-                            if yds >= 20: results["breakaways"] += 1
-                            break
-                except: pass
+            if result.outcome == pr.RUN:
+                results["run_yds"] += result.yards
+                if result.yards <= 0: results["stuffed"] += 1
+                if result.yards >= 20: results["breakaways"] += 1
 
         else:
             # PASS TEST
-            off_key = random.choice(pass_plays)
-            def_key = random.choice(def_plays)
-            desc, score, time = sim.resolve_play(off_key, def_key, "NORMAL")
-            
-            if "SACK" in desc:
+            off_code = rng.choice(pass_plays)
+            def_code = rng.choice(def_plays)
+            result = sim.resolve_play(off_code, def_code, "NORMAL")
+
+            if result.outcome in (pr.SACK, pr.STRIP_SACK):
                 results["sacks"] += 1
-                results["passes"] += 1 
-            elif "Pressure" in desc and "scrambles" in desc:
-                results["scrambles"] += 1
-                results["runs"] += 1 
-                try:
-                    words = desc.split()
-                    for i, w in enumerate(words):
-                        if "yds" in w:
-                            yds = int(words[i-1])
-                            results["run_yds"] += yds
-                except: pass
-            elif "Pressure" in desc and "Throws it away" in desc:
                 results["passes"] += 1
-            elif "INTERCEPTED" in desc:
+            elif result.outcome == pr.SCRAMBLE:
+                results["scrambles"] += 1
+                results["runs"] += 1
+                results["run_yds"] += result.yards
+            elif result.outcome == pr.INTERCEPTION:
                 results["ints"] += 1
                 results["passes"] += 1
-            elif "Incomplete" in desc:
+            elif result.outcome in (pr.INCOMPLETE, pr.DROP):
                 results["passes"] += 1
             else:
                 results["passes"] += 1
                 results["completions"] += 1
-                try:
-                    words = desc.split()
-                    for i, w in enumerate(words):
-                        if "yds" in w:
-                            yds = int(words[i-1])
-                            results["pass_yds"] += yds
-                except: pass
+                results["pass_yds"] += result.yards
+    return results
+
+def _add_counts(counts):
+    total = dict.fromkeys(counts[0], 0)
+    for c in counts:
+        for k, v in c.items(): total[k] += v
+    return total
+
+def summarize(results):
+    """Rates from simulate_plays counts (percentages are 0-100)."""
+    runs, passes = results["runs"], results["passes"]
+    def pct(n, d): return n / d * 100 if d else 0.0
+    return {
+        "runs": runs, "passes": passes,
+        "ypc": results["run_yds"] / runs if runs else 0.0,
+        "breakaway_pct": pct(results["breakaways"], runs),
+        "stuffed_pct": pct(results["stuffed"], runs),
+        "cmp_pct": pct(results["completions"], passes),
+        "ypa": results["pass_yds"] / passes if passes else 0.0,
+        "sack_pct": pct(results["sacks"], passes),
+        "int_pct": pct(results["ints"], passes),
+    }
+
+def run_tuning_test(sim_count=1000, off_rating=75, def_rating=75, run_pass_bias=None, def_strategy=DEF_MIX, seed=None,
+                    fixtures=None):
+    if fixtures is None: print(f"\n--- RUNNING SIMULATION: Offense {off_rating} OVR vs Defense {def_rating} OVR ---")
+    else: print(f"\n--- RUNNING SIMULATION: {fixtures.label(off_rating)} OVR offenses vs {fixtures.label(def_rating)} OVR defenses ---")
+    print(f"Simulating {sim_count} plays...")
+    results = simulate_plays(sim_count, off_rating, def_rating, run_pass_bias, def_strategy, seed, fixtures=fixtures)
+    s = summarize(results)
 
     # REPORT
     if results["runs"] > 0:
-        ypc = results["run_yds"] / results["runs"]
-        print(f"RUSHING: {results['runs']} att, {results['run_yds']} yds, {ypc:.2f} avg")
-        print(f"   Breakaways (>20y): {results['breakaways']} ({(results['breakaways']/results['runs'])*100:.1f}%)")
-        print(f"   Stuffed (<=0y)   : {results['stuffed']} ({(results['stuffed']/results['runs'])*100:.1f}%)")
+        print(f"RUSHING: {results['runs']} att, {results['run_yds']} yds, {s['ypc']:.2f} avg")
+        print(f"   Breakaways (>20y): {results['breakaways']} ({s['breakaway_pct']:.1f}%)")
+        print(f"   Stuffed (<=0y)   : {results['stuffed']} ({s['stuffed_pct']:.1f}%)")
         print(f"   (Includes {results['scrambles']} QB Scrambles)")
 
     if results["passes"] > 0:
-        cmp_pct = (results['completions'] / results['passes']) * 100
-        yPa = results['pass_yds'] / results['passes']
-        sack_pct = (results['sacks'] / results['passes']) * 100
-        int_pct = (results['ints'] / results['passes']) * 100
         print(f"PASSING: {results['passes']} att, {results['completions']} cmp, {results['pass_yds']} yds")
-        print(f"   Comp %  : {cmp_pct:.1f}%  (Target: 58-65%)")
-        print(f"   Yards/Att: {yPa:.1f}   (Target: 6.5-8.0)")
-        print(f"   Sack %  : {sack_pct:.1f}%  (Target: 5-8%)")
-        print(f"   Int %   : {int_pct:.1f}%  (Target: 2-3%)")
+        print(f"   Comp %  : {s['cmp_pct']:.1f}%  (Target: 58-65%)")
+        print(f"   Yards/Att: {s['ypa']:.1f}   (Target: 6.5-8.0)")
+        print(f"   Sack %  : {s['sack_pct']:.1f}%  (Target: 5-8%)")
+        print(f"   Int %   : {s['int_pct']:.1f}%  (Target: 2-3%)")
+    return s
+
+# --- PARAMETER SWEEPS ---
+# A sweep runs every combination of offense rating, defense rating, coach run/pass
+# bias and defensive strategy (a "cell") and spreads the cells over worker
+# processes. Each cell's seed comes from the sweep seed and the cell's own values,
+# so a cell gives the same numbers whatever else is in the grid.
+SWEEP_COLUMNS = ("off_rating", "def_rating", "run_pass_bias", "def_strategy", "plays",
+                 "runs", "passes", "cmp_pct", "ypa", "ypc", "sack_pct", "int_pct", "breakaway_pct", "stuffed_pct")
+
+def _cell_seed(seed, cell):
+    return random.Random("|".join(map(str, (seed,) + cell))).getrandbits(64)
+
+def _run_job(job):
+    """Worker side: raw counts for one (cell, snaps, seed, tuning, paired) job."""
+    (off_rating, def_rating, bias, strategy), sim_count, seed, tuning, paired = job
+    return simulate_plays(sim_count, off_rating, def_rating, bias, strategy, seed, tuning, paired, _fixtures)
+
+def sweep(off_ratings, def_ratings, biases=(None,), def_strategies=(DEF_MIX,), sim_count=2000, workers=None, seed=0, out=None,
+          fixtures=None):
+    """
+    Runs every cell of the grid and returns one row (dict, SWEEP_COLUMNS) per cell,
+    in grid order. `workers` defaults to the CPU count; with `out` the table is also
+    written there (.json, anything else as CSV). With `fixtures` the ratings are
+    buckets of real teams.
+    """
+    cells = list(itertools.product(off_ratings, def_ratings, biases, def_strategies))
+    jobs = [(cell, sim_count, _cell_seed(seed, cell), None, False) for cell in cells]
+    counts = _run_jobs(jobs, workers, fixtures)
+
+    rows = []
+    for (off_rating, def_rating, bias, strategy), c in zip(cells, counts):
+        row = {"off_rating": off_rating, "def_rating": def_rating, "run_pass_bias": bias,
+               "def_strategy": strategy, "plays": sim_count}
+        row.update(summarize(c))
+        rows.append(row)
+    if out: write_table(rows, out)
+    return rows
+
+def write_table(rows, path):
+    if path.endswith(".json"):
+        with open(path, "w") as f: json.dump(rows, f, indent=1)
+        return
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SWEEP_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: round(v, 3) if isinstance(v, float) else v for k, v in row.items()})
+
+def print_sweep(rows):
+    print(f"{'OFF':>4}{'DEF':>5}{'BIAS':>5}  {'DEFENSE':<12}{'Cmp%':>7}{'Y/A':>6}{'Y/C':>6}{'Sack%':>7}{'Int%':>6}")
+    for r in rows:
+        bias = "-" if r["run_pass_bias"] is None else r["run_pass_bias"]
+        print(f"{r['off_rating']:>4}{r['def_rating']:>5}{bias:>5}  {r['def_strategy']:<12}"
+              f"{r['cmp_pct']:>7.1f}{r['ypa']:>6.1f}{r['ypc']:>6.2f}{r['sack_pct']:>7.1f}{r['int_pct']:>6.1f}")
+
+# --- CALIBRATION ---
+# Searches engine constants (engine_tuning.PARAMS) until the lab's rates land in
+# the target bands. Every candidate is played on the same paired seeds (see
+# simulate_plays), so two candidates differ only by their constants, and each
+# one's sample is split into JOB_SNAPS-snap jobs across the worker pool.
+TARGETS = {"cmp_pct": (58, 65), "ypa": (6.5, 8.0), "sack_pct": (5, 8), "int_pct": (2, 3)}
+TARGET_LABELS = {"cmp_pct": "Comp %", "ypa": "Yards/Att", "sack_pct": "Sack %", "int_pct": "Int %"}
+# Constants searched by default: the ones that move the passing numbers most directly
+CALIBRATE_PARAMS = ("catch_base", "sep_weight", "pressure_threshold", "int_rate", "risky_separation", "yac_max", "big_play_chance")
+# (offense, defense) ratings every candidate is measured on; the bands describe an even matchup
+CALIBRATE_CELLS = ((75, 75),)
+JOB_SNAPS = 1000
+# Pull toward the middle of each band, so a result does not sit on an edge
+CENTER_WEIGHT = 0.05
+
+def evaluate(tunings, cells=CALIBRATE_CELLS, sim_count=6000, seed=0, pool=None):
+    """Rates (summarize) for each EngineTuning over `cells`, sim_count snaps per cell, on shared seeds."""
+    jobs = []
+    for tuning in tunings:
+        for off_rating, def_rating in cells:
+            cell = (off_rating, def_rating, None, DEF_MIX)
+            for start in range(0, sim_count, JOB_SNAPS):
+                jobs.append((cell, min(JOB_SNAPS, sim_count - start), _cell_seed(seed, cell + (start,)), tuning, True))
+    counts = list(pool.map(_run_job, jobs) if pool else map(_run_job, jobs))
+    per = len(jobs) // len(tunings)
+    return [summarize(_add_counts(counts[i * per:(i + 1) * per])) for i in range(len(tunings))]
+
+def band_miss(stats, targets=TARGETS):
+    """How far the rates are from their bands, in band widths squared (plus the small centering term)."""
+    miss = 0.0
+    for key, (low, high) in targets.items():
+        value, width = stats[key], high - low
+        if value < low: miss += ((low - value) / width) ** 2
+        elif value > high: miss += ((value - high) / width) ** 2
+        miss += CENTER_WEIGHT * ((value - (low + high) / 2) / width) ** 2
+    return miss
+
+def in_bands(stats, targets=TARGETS):
+    return all(low <= stats[key] <= high for key, (low, high) in targets.items())
+
+def _rates_str(stats):
+    return "  ".join(f"{TARGET_LABELS[k]} {stats[k]:.1f}" for k in TARGETS)
+
+def _coarse_step(name):
+    default, step, low, high = PARAMS[name]
+    coarse = max(step, (high - low) / 8)
+    return int(round(coarse)) if isinstance(default, int) else coarse
+
+def calibrate(params=CALIBRATE_PARAMS, start=None, cells=CALIBRATE_CELLS, sim_count=6000, rounds=10,
+              workers=None, seed=0, fixtures=None, log=print):
+    """
+    Coordinate (compass) search over `params`, starting from `start` (default
+    TUNING): each constant is tried one step up and down and keeps moving while
+    that brings the rates closer to TARGETS. Steps start at an eighth of each
+    constant's range and double while both neighbours score exactly the same
+    (clamped rates can be flat under small moves); a round that moves nothing
+    halves them, down to the PARAMS step. Returns
+    (EngineTuning, rates).
+    """
+    best = start or TUNING
+    finest = {name: PARAMS[name][1] for name in params}
+    steps = {name: _coarse_step(name) for name in params}
+    workers = workers or os.cpu_count() or 1
+    _use_fixtures(fixtures)
+    pool = _pool(workers, fixtures) if workers > 1 else None
+    try:
+        best_stats = evaluate([best], cells, sim_count, seed, pool)[0]
+        best_miss = band_miss(best_stats)
+        log(f"start    miss {best_miss:7.3f}  {_rates_str(best_stats)}")
+        for rnd in range(1, rounds + 1):
+            moved = False
+            for name in params:
+                step = steps[name]
+                span = PARAMS[name][3] - PARAMS[name][2]
+                direction = None
+                while True:
+                    deltas = (-step, step) if direction is None else (direction,)
+                    tries = [t for t in (best.replace(**{name: getattr(best, name) + d}) for d in deltas) if t != best]
+                    if not tries: break
+                    results = [(band_miss(s), t, s) for t, s in zip(tries, evaluate(tries, cells, sim_count, seed, pool))]
+                    miss, tuning, stats = min(results, key=lambda r: r[0])
+                    if miss < best_miss:
+                        # Keep going the same way
+                        direction = getattr(tuning, name) - getattr(best, name)
+                        best, best_stats, best_miss, moved = tuning, stats, miss, True
+                    elif direction is None and all(r[0] == best_miss for r in results) and step * 2 <= span:
+                        # Exactly flat on the shared seeds (e.g. a clamped formula): look further out
+                        step *= 2
+                    else:
+                        break
+            log(f"round {rnd}  miss {best_miss:7.3f}  {_rates_str(best_stats)}  {best!r}")
+            if not moved:
+                halved = {n: max(finest[n], s // 2 if isinstance(PARAMS[n][0], int) else s / 2) for n, s in steps.items()}
+                if halved == steps: break
+                steps = halved
+    finally:
+        if pool: pool.shutdown()
+    return best, best_stats
+
+def print_calibration(tuning, stats):
+    for key, (low, high) in TARGETS.items():
+        mark = "ok" if low <= stats[key] <= high else "--"
+        print(f"   {TARGET_LABELS[key]:<10} {stats[key]:6.2f}   (Target: {low}-{high})  {mark}")
+    for name, value in tuning.changes().items():
+        print(f"   {name:<20} {PARAMS[name][0]!r:>8} -> {value!r}")
+
+# --- A/B COMPARISON ---
+# Two engine tunings played on the same paired seeds (common random numbers):
+# both see the same play calls and the same draws on every snap, so most of the
+# noise cancels in the difference. The snaps are split into AB_BATCH_SNAPS
+# batches; each batch gives one paired difference per rate, and the confidence
+# interval comes from the spread of those (normal approximation, so keep 30+
+# batches). `reduction` is how many times more snaps an unpaired comparison
+# would need for the same interval.
+AB_BATCH_SNAPS = 500
+AB_METRICS = ("cmp_pct", "ypa", "ypc", "sack_pct", "int_pct", "breakaway_pct", "stuffed_pct")
+AB_LABELS = {"cmp_pct": "Comp %", "ypa": "Yards/Att", "ypc": "Yards/Carry", "sack_pct": "Sack %",
+             "int_pct": "Int %", "breakaway_pct": "Breakaway %", "stuffed_pct": "Stuffed %"}
+
+class ABResult:
+    """One rate under both tunings: pooled values, paired difference (b - a) and its interval."""
+    def __init__(self, metric, a, b, batch_a, batch_b, confidence):
+        self.metric = metric
+        self.a = a
+        self.b = b
+        self.diff = b - a
+        n = len(batch_a)
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        diffs = [y - x for x, y in zip(batch_a, batch_b)]
+        paired_var = variance(diffs) if n > 1 else 0.0
+        unpaired_var = (variance(batch_a) + variance(batch_b)) if n > 1 else 0.0
+        self.half_width = z * (paired_var / n) ** 0.5 if n else 0.0
+        self.reduction = unpaired_var / paired_var if paired_var > 0 else float("inf")
+
+    @property
+    def significant(self):
+        return abs(self.diff) > self.half_width
+
+def parse_tuning(spec):
+    """EngineTuning from a JSON file, or "name=value,..." changes to TUNING ("" = TUNING)."""
+    if spec.endswith(".json"): return EngineTuning.load(spec)
+    values = {}
+    for item in filter(None, spec.split(",")):
+        name, _, value = item.partition("=")
+        values[name.strip()] = float(value)
+    return TUNING.replace(**values)
+
+def compare(tuning_a, tuning_b, sim_count=20000, off_rating=75, def_rating=75, run_pass_bias=None,
+            def_strategy=DEF_MIX, workers=None, seed=0, confidence=0.95, fixtures=None):
+    """Runs both tunings on the same snaps; returns {metric: ABResult} for AB_METRICS."""
+    cell = (off_rating, def_rating, run_pass_bias, def_strategy)
+    starts = range(0, sim_count, AB_BATCH_SNAPS)
+    jobs = [(cell, min(AB_BATCH_SNAPS, sim_count - s), _cell_seed(seed, cell + (s,)), tuning, True)
+            for tuning in (tuning_a, tuning_b) for s in starts]
+    counts = _run_jobs(jobs, workers, fixtures)
+
+    n = len(starts)
+    counts_a, counts_b = counts[:n], counts[n:]
+    total_a, total_b = summarize(_add_counts(counts_a)), summarize(_add_counts(counts_b))
+    batch_a = [summarize(c) for c in counts_a]
+    batch_b = [summarize(c) for c in counts_b]
+    return {m: ABResult(m, total_a[m], total_b[m], [s[m] for s in batch_a], [s[m] for s in batch_b], confidence)
+            for m in AB_METRICS}
+
+def print_comparison(results, confidence=0.95):
+    print(f"{'Rate':<13}{'A':>9}{'B':>9}{'B - A':>9}{f'+/- ({confidence:.0%})':>13}{'Reduction':>11}")
+    for r in results.values():
+        mark = " *" if r.significant else ""
+        reduction = f"{r.reduction:.1f}x" if r.reduction != float("inf") else "-"
+        print(f"{AB_LABELS[r.metric]:<13}{r.a:>9.2f}{r.b:>9.2f}{r.diff:>+9.2f}{r.half_width:>13.2f}{reduction:>11}{mark}")
+    print("* difference outside the interval")
 
 if __name__ == "__main__":
-    run_tuning_test(1000, 75, 75)
\ No newline at end of file
+    import argparse
+
+    def _ints(text): return [int(v) for v in text.split(",")]
+    def _names(text): return [v.strip().upper() for v in text.split(",")]
+    def _cells(text): return [tuple(int(r) for r in pair.split(":")) for pair in text.split(",")]
+
+    # Real-team fixtures, before or after the command (suppressed defaults, so a subcommand doesn't reset them)
+    fx = argparse.ArgumentParser(add_help=False, argument_default=argparse.SUPPRESS)
+    fx.add_argument("--universe", nargs="?", const=SAVE_FILE,
+                    help=f"play real teams from a save file (default {SAVE_FILE}); ratings then pick team-overall buckets")
+    fx.add_argument("--generate", type=int, metavar="SCHOOLS", help="play real teams from a newly generated universe")
+    fx.add_argument("--league", type=str.upper, choices=("COLLEGE", "HS", "ALL"), help="fixture league (default COLLEGE)")
+
+    parser = argparse.ArgumentParser(description="Play engine tuning lab", parents=[fx])
+    sub = parser.add_subparsers(dest="cmd")
+    s = sub.add_parser("sweep", parents=[fx], help="grid of ratings / bias / defensive strategies over a process pool")
+    s.add_argument("--off", type=_ints, default=None, help="offense ratings, e.g. 65,75,85 (fixtures: every bucket)")
+    s.add_argument("--def", dest="defense", type=_ints, default=None, help="defense ratings")
+    s.add_argument("--bias", type=_ints, default=[None], help="offensive coach run/pass bias values (0-10; default 5 / each coach's own)")
+    s.add_argument("--strategy", type=_names, default=[DEF_MIX], help=f"defensive strategies or {DEF_MIX}")
+    s.add_argument("--plays", type=int, default=2000, help="snaps per cell")
+    s.add_argument("--workers", type=int, default=None)
+    s.add_argument("--seed", type=int, default=0)
+    s.add_argument("--out", default=None, help="results table (.csv or .json)")
+
+    c = sub.add_parser("calibrate", parents=[fx], help="search engine constants until the rates land in the target bands")
+    c.add_argument("--params", type=lambda t: t.split(","), default=list(CALIBRATE_PARAMS), help="engine_tuning constants to search")
+    c.add_argument("--cells", type=_cells, default=None, help="offense:defense ratings, e.g. 70:80,75:75 (fixtures: the biggest bucket)")
+    c.add_argument("--plays", type=int, default=6000, help="snaps per cell per candidate")
+    c.add_argument("--rounds", type=int, default=10)
+    c.add_argument("--start", default=None, help="EngineTuning JSON to start from (default: current constants)")
+    c.add_argument("--workers", type=int, default=None)
+    c.add_argument("--seed", type=int, default=0)
+    c.add_argument("--out", default=None, help="write the calibrated constants here (JSON, see ENGINE_TUNING_FILE)")
+
+    ab = sub.add_parser("ab", parents=[fx], help="compare two engine tunings on common random numbers")
+    ab.add_argument("--a", default="", help="tuning A: JSON file or name=value,... changes (default: current constants)")
+    ab.add_argument("--b", required=True, help="tuning B, same forms as --a")
+    ab.add_argument("--plays", type=int, default=20000, help="snaps per tuning")
+    ab.add_argument("--off", type=int, default=None, help="offense rating (default 75 / the biggest bucket)")
+    ab.add_argument("--def", dest="defense", type=int, default=None)
+    ab.add_argument("--bias", type=int, default=None)
+    ab.add_argument("--strategy", default=DEF_MIX)
+    ab.add_argument("--workers", type=int, default=None)
+    ab.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    fixtures = None
+    league = getattr(args, "league", "COLLEGE")
+    if getattr(args, "generate", None):
+        from world_gen import generate_world
+        random.seed(getattr(args, "seed", 0))
+        fixtures = fixtures_from_universe(generate_world(args.generate), league)
+    elif getattr(args, "universe", None):
+        try: fixtures = load_fixtures(args.universe, league)
+        except ValueError as e: parser.error(str(e))
+    if fixtures is not None: print(f"Fixtures ({league}, team overall): {fixtures.describe()}")
+    typical = 75 if fixtures is None else fixtures.typical()
+
+    def _check_ratings(ratings):
+        if fixtures is None: return
+        for rating in ratings:
+            try: fixtures.teams(rating)
+            except ValueError as e: parser.error(str(e))
+
+    if args.cmd == "sweep":
+        for name in args.strategy:
+            if name != DEF_MIX and name not in PLAYBOOK.defense: parser.error(f"unknown defensive strategy {name}")
+        default = [65, 75, 85] if fixtures is None else sorted(fixtures.buckets)
+        off, defense = args.off or default, args.defense or default
+        _check_ratings(off + defense)
+        print_sweep(sweep(off, defense, args.bias, args.strategy, args.plays, args.workers, args.seed, args.out, fixtures))
+    elif args.cmd == "calibrate":
+        for name in args.params:
+            if name not in PARAMS: parser.error(f"unknown engine constant {name}")
+        start = EngineTuning.load(args.start) if args.start else None
+        cells = args.cells or (list(CALIBRATE_CELLS) if fixtures is None else [(typical, typical)])
+        _check_ratings([r for cell in cells for r in cell])
+        tuning, stats = calibrate(args.params, start, cells, args.plays, args.rounds, args.workers, args.seed, fixtures)
+        print("\nCALIBRATED" if in_bands(stats) else "\nNOT IN BANDS (more rounds or --params may help)")
+        print_calibration(tuning, stats)
+        if args.out:
+            tuning.save(args.out)
+            print(f"Saved to {args.out} (use it with ENGINE_TUNING_FILE={args.out})")
+    elif args.cmd == "ab":
+        try: tuning_a, tuning_b = parse_tuning(args.a), parse_tuning(args.b)
+        except ValueError as e: parser.error(str(e))
+        off = typical if args.off is None else args.off
+        defense = typical if args.defense is None else args.defense
+        _check_ratings([off, defense])
+        print(f"A: {tuning_a!r}\nB: {tuning_b!r}\n{args.plays} snaps each, Offense {off} vs Defense {defense}\n")
+        print_comparison(compare(tuning_a, tuning_b, args.plays, off, defense, args.bias,
+                                 args.strategy.upper(), args.workers, args.seed, fixtures=fixtures))
+    else:
+        run_tuning_test(1000, typical, typical, fixtures=fixtures)
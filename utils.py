@@ -6,6 +6,7 @@ from config import console
 def repair_save_data(universe):
     """Fixes potential data corruption from previous bugs."""
     count = 0
+    if not hasattr(universe, 'seed'): universe.seed = random.getrandbits(64)
     all_teams = universe.high_school_league + universe.college_league
     for team in all_teams:
         if not hasattr(team, 'nat_champ'): team.nat_champ = False
@@ -7,6 +7,27 @@ from rich.align import Align
 from rich import box
 from config import console
 from coach_manager import get_coach_market_value
+from scheduler import game_seed
+
+try:
+    from batch_sim import simulate_matchup
+except ImportError:  # NumPy not installed: schedule shows no playoff odds
+    simulate_matchup = None
+
+# Regular-season titles; every other titled game (playoffs, championships) is a headline game
+ROUTINE_TITLES = ("Conference Play", "Non-Conference", "Non-Conference (FCS)")
+# Games per matchup for the schedule's odds (news previews run the full 2,000)
+SCHEDULE_ODDS_GAMES = 200
+
+def _headline_odds(universe, g):
+    """(favorite, win probability) of an unplayed headline game, computed once and kept on the game."""
+    if g.played or not g.title or g.title in ROUTINE_TITLES or not simulate_matchup: return None
+    if getattr(g, 'odds', None) is None:
+        # Plain values, so saves load without NumPy
+        odds = simulate_matchup(g.home_team, g.away_team, n_games=SCHEDULE_ODDS_GAMES,
+                                seed=game_seed(universe.seed, universe.year, g))
+        g.odds = (odds.favorite, max(odds.home_win_prob, odds.away_win_prob))
+    return g.odds
 
 # --- DASHBOARD COMPONENTS ---
 
@@ -429,6 +450,10 @@ def display_weekly_schedule(universe, week, active_league):
         title = f" [yellow][{g.title}][/yellow]" if g.title else ""
         
         status = "Upcoming"
+        odds = _headline_odds(universe, g)
+        if odds:
+            favorite, prob = odds
+            status = f"Upcoming ({favorite.name} {prob*100:.0f}%)"
         if g.played:
             w_team = g.home_team if g.home_score > g.away_score else g.away_team
             status = f"[dim]Final: {g.away_score}-{g.home_score} ({w_team.name})[/dim]"
@@ -436,7 +461,8 @@ def display_weekly_schedule(universe, week, active_league):
         table.add_row(idx, g.away_team.name, "@", g.home_team.name, status + title)
 
     console.print(table)
-    console.print("Type '[yellow]watch <ID>[/yellow]' to spectate.")
+    console.print("Type '[yellow]watch <ID> [secs][/yellow]' to spectate, auto-advancing every [secs] (or see the box score of a final).")
+    console.print("Type '[yellow]replay <ID> [q<n>|d<n>|ot] [secs][/yellow]' to re-watch a final from a quarter or drive.")
     return active_games
 
 def display_standings(schools, context):
@@ -505,6 +531,38 @@ def display_team_schedule(school):
         table.add_row(str(game.week), f"{loc} {opp.name}", res)
     console.print(table)
 
+def display_box_score(game):
+    console.print(Panel(f"[bold]FINAL: {game.away_team.name} {game.away_score} - {game.home_team.name} {game.home_score}[/bold]", style="cyan"))
+    stat_lines = getattr(game, 'box_score', None)
+    if not stat_lines:
+        console.print("[dim]No box score kept for this game.[/dim]")
+        return
+
+    for team in (game.away_team, game.home_team):
+        table = Table(title=team.name, box=box.SIMPLE)
+        table.add_column("Pos", style="dim")
+        table.add_column("Player", style="bold")
+        table.add_column("Line")
+        for player, line in stat_lines.team_lines(team):
+            table.add_row(player.position, player.full_name, player.get_stat_summary(line))
+        console.print(table)
+
+    drives = getattr(game, 'drives', None)
+    if drives:
+        table = Table(title="Drive Chart", box=box.SIMPLE)
+        table.add_column("Team", style="bold")
+        table.add_column("Qtr", justify="center")
+        table.add_column("Start", justify="right")
+        table.add_column("Plays", justify="right")
+        table.add_column("Yds", justify="right")
+        table.add_column("Time", justify="right")
+        table.add_column("Result")
+        for d in drives:
+            style = "green" if d.scored else ""
+            table.add_row(d.offense.name, "OT" if d.quarter == 0 else f"Q{d.quarter}", f"own {d.start}", str(d.plays),
+                          str(d.yards), f"{d.time_used // 60}:{d.time_used % 60:02d}", f"[{style}]{d.label()}[/{style}]" if style else d.label())
+        console.print(table)
+
 def display_bracket(universe):
     console.print("\n[bold cyan]=== PLAYOFF BRACKET ===[/bold cyan]")
     schedule = universe.schedule
@@ -295,6 +295,7 @@ class Universe:
     def __init__(self):
         self.year = 2024
         self.current_week = 1
+        self.seed = random.getrandbits(64) # Root of every game's RNG stream (scheduler.seed_game)
         
         self.high_school_league = [] 
         self.college_league = []     